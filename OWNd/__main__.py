@@ -57,12 +57,10 @@ async def main(arguments: dict, connection: OWNEventSession) -> None:
     await connection.connect()
 
     logger.info("Now waiting for events from the gateway (e.g. a cover opening/closing)")
-    while True:
-        message = await connection.get_next()
-        if message:
-            logger.debug("Received: %s", message)
-            if isinstance(message, OWNMessage) and message.is_event:
-                logger.info(message.human_readable_log)
+    async for message in connection.events():
+        logger.debug("Received: %s", message)
+        if isinstance(message, OWNMessage) and message.is_event:
+            logger.info(message.human_readable_log)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,179 @@
+""" This module contains the OpenWebNet WHERE address value type """
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional
+
+# Lighting and automation are the only systems with areas, groups and general addresses
+_TOPOLOGY_WHOS = (1, 2)
+# Systems whose addresses can target a device behind a bus interface: WHERE#4#INTERFACE
+_INTERFACE_WHOS = (1, 2, 15)
+
+# Distinct addresses kept interned, the least recently seen are let go beyond it
+MAX_INTERNED_ADDRESSES = 4096
+
+
+class WhereAddress:
+    """
+    Immutable WHERE of a message, with its parameters, for a given WHO.
+    Addresses are interned, the MAX_INTERNED_ADDRESSES most recently seen have
+    a single instance, and all their properties are computed once when they are
+    first seen.
+    """
+
+    __slots__ = (
+        "_who",
+        "_where",
+        "_where_param",
+        "_interface",
+        "_is_general",
+        "_is_group",
+        "_is_area",
+        "_group",
+        "_area",
+        "_unique_id",
+    )
+
+    _interned = OrderedDict()
+
+    def __new__(cls, who, where: Optional[str], where_param=()):
+        _key = (who, where, tuple(where_param))
+        try:
+            address = cls._interned[_key]
+        except KeyError:
+            pass
+        else:
+            cls._interned.move_to_end(_key)
+            return address
+
+        address = super().__new__(cls)
+        address._who = who
+        address._where = where
+        address._where_param = _key[2]
+
+        address._interface = (
+            where_param[1]
+            if who in _INTERFACE_WHOS and len(where_param) > 1 and where_param[0] == "4"
+            else None
+        )
+
+        address._is_general = False
+        address._is_group = False
+        address._is_area = False
+        address._group = None
+        address._area = None
+        if who in _TOPOLOGY_WHOS and where is not None:
+            # Messages have always reported None rather than False here
+            address._is_general = True if where == "0" else None
+            if where.startswith("#"):
+                address._is_group = True
+                address._group = int(where[1:])
+            elif where in ("00", "100") or (
+                len(where) == 1 and where.isdecimal() and 0 < int(where) < 10
+            ):
+                address._is_area = True
+                address._area = 10 if where == "100" else int(where)
+
+        address._unique_id = (
+            f"{who}-{where}#4#{address._interface}"
+            if address._interface is not None
+            else f"{who}-{where}"
+        )
+
+        cls._interned[_key] = address
+        if len(cls._interned) > MAX_INTERNED_ADDRESSES:
+            cls._interned.popitem(last=False)
+        return address
+
+    def __reduce__(self):
+        return (WhereAddress, (self._who, self._where, self._where_param))
+
+    # Compared by value, an address let go by the intern table can be seen again
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, WhereAddress):
+            return NotImplemented
+        return (self._who, self._where, self._where_param) == (
+            other._who,
+            other._where,
+            other._where_param,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._who, self._where, self._where_param))
+
+    @property
+    def who(self) -> int:
+        return self._who
+
+    @property
+    def where(self) -> Optional[str]:
+        return self._where
+
+    @property
+    def where_param(self) -> tuple:
+        return self._where_param
+
+    @property
+    def interface(self) -> Optional[str]:
+        """The bus interface the device is behind, if any"""
+        return self._interface
+
+    @property
+    def is_general(self) -> bool:
+        return self._is_general
+
+    @property
+    def is_group(self) -> bool:
+        return self._is_group
+
+    @property
+    def is_area(self) -> bool:
+        return self._is_area
+
+    @property
+    def is_point(self) -> bool:
+        """Whether the address is a single light point or shutter"""
+        return (
+            self._who in _TOPOLOGY_WHOS
+            and self._where is not None
+            and not (self._is_general or self._is_group or self._is_area)
+        )
+
+    @property
+    def device(self) -> Optional[tuple]:
+        """The single device the address targets, None if it may target several or
+        can't be told: general, area and group WHEREs, heating central unit WHEREs
+        (#0, #0#N) and the WHEREs of other WHOs"""
+        if self._who in _TOPOLOGY_WHOS:
+            return (
+                (self._who, self._where, self._where_param) if self.is_point else None
+            )
+        if self._who == 4 and self._where is not None and not self._where_param:
+            # Zones are addressed as N or #N
+            _zone = self._where[1:] if self._where.startswith("#") else self._where
+            if _zone.isdecimal() and int(_zone) != 0:
+                return (4, str(int(_zone)))
+        return None
+
+    @property
+    def group(self) -> Optional[int]:
+        return self._group
+
+    @property
+    def area(self) -> Optional[int]:
+        return self._area
+
+    @property
+    def unique_id(self) -> str:
+        return self._unique_id
+
+    def __repr__(self) -> str:
+        return (
+            f"WhereAddress({self._who!r}, {self._where!r}, {list(self._where_param)!r})"
+        )
+
+    def __str__(self) -> str:
+        return "#".join((self._where, *self._where_param)) if self._where else ""
@@ -0,0 +1,220 @@
+""" This module contains a columnar representation of batches of OpenWebNet frames """
+
+from __future__ import annotations
+
+from array import array
+import itertools
+import time
+from typing import Iterable, Optional
+
+from .message import FrameSplitter, OWNMessage, _tokenize, _tokenize_bytes
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Stands for a missing field (no WHAT, no WHERE, no dimension or no value)
+NONE = -1
+_INT64_MAX = 2**63 - 1
+
+MESSAGE_TYPES = (
+    "STATUS",
+    "STATUS_REQUEST",
+    "DIMENSION_REQUEST",
+    "DIMENSION_REQUEST_REPLY",
+    "DIMENSION_WRITING",
+)
+_MESSAGE_TYPE_CODES = {_type: _code for _code, _type in enumerate(MESSAGE_TYPES)}
+
+
+class EventBatch:
+    """
+    Columnar batch of frames, the bulk counterpart of OWNMessage.parse.
+    Each valid frame is a row of array backed columns: message type, who, what,
+    where (as an index in the `wheres` dictionary), dimension, first dimension
+    value and receive timestamp. Missing fields are NONE, frames with numbers
+    that don't fit in 64 bits are left out.
+    Full OWNMessage objects are only built when a row is accessed.
+    """
+
+    def __init__(self):
+        self._frames = []
+        self._wheres = []
+        self._where_ids = {}
+        self._message_type = array("b")
+        self._who = array("q")
+        self._what = array("q")
+        self._where_id = array("i")
+        self._dimension = array("q")
+        self._value = array("q")
+        self._timestamp = array("d")
+
+    @classmethod
+    def from_frames(
+        cls, frames: Iterable, timestamps: Optional[Iterable[float]] = None
+    ) -> EventBatch:
+        """Batch of frames (str or bytes), invalid frames are left out.
+        Without timestamps, all rows are stamped with the current time"""
+        batch = cls()
+        batch.extend(frames, timestamps)
+        return batch
+
+    @classmethod
+    def from_bytes(cls, data, timestamp: Optional[float] = None) -> EventBatch:
+        """Batch of all the complete frames of a buffer, such as a capture file"""
+        batch = cls()
+        batch.extend(FrameSplitter().split(data), None, timestamp)
+        return batch
+
+    def extend(
+        self,
+        frames: Iterable,
+        timestamps: Optional[Iterable[float]] = None,
+        timestamp: Optional[float] = None,
+    ) -> int:
+        """Append frames to the batch, returns the number of rows added"""
+        if timestamps is None:
+            _now = time.time() if timestamp is None else timestamp
+            timestamps = itertools.repeat(_now)
+
+        _where_ids = self._where_ids
+        _wheres = self._wheres
+        _frames = self._frames
+        _message_type = self._message_type
+        _who = self._who
+        _what = self._what
+        _where_id = self._where_id
+        _dimension = self._dimension
+        _value = self._value
+        _timestamp = self._timestamp
+        _count = len(_frames)
+
+        for frame, frame_timestamp in zip(frames, timestamps):
+            if isinstance(frame, str):
+                tokens = _tokenize(frame)
+            else:
+                frame = bytes(frame)
+                tokens = _tokenize_bytes(frame)
+            if tokens is None:
+                continue
+            (
+                _,
+                message_type,
+                who,
+                what,
+                _,
+                where,
+                where_param,
+                dimension,
+                _,
+                values,
+            ) = tokens
+            value = int(values[0]) if values and values[0] else NONE
+            if max(who, what or 0, dimension or 0, value) > _INT64_MAX:
+                continue
+
+            if where is None:
+                where_id = NONE
+            else:
+                if where_param:
+                    where = "#".join([where, *where_param])
+                where_id = _where_ids.get(where)
+                if where_id is None:
+                    where_id = _where_ids[where] = len(_wheres)
+                    _wheres.append(where)
+
+            _frames.append(frame)
+            _message_type.append(_MESSAGE_TYPE_CODES[message_type])
+            _who.append(who)
+            _what.append(NONE if what is None else what)
+            _where_id.append(where_id)
+            _dimension.append(NONE if dimension is None else dimension)
+            _value.append(value)
+            _timestamp.append(frame_timestamp)
+
+        return len(_frames) - _count
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __getitem__(self, index: int) -> OWNMessage:
+        return self.message(index)
+
+    def message(self, index: int) -> Optional[OWNMessage]:
+        """The full message of a row, parsed on demand"""
+        frame = self._frames[index]
+        if isinstance(frame, str):
+            return OWNMessage.parse(frame)
+        return OWNMessage.parse_bytes(frame)
+
+    def messages(self, indexes: Optional[Iterable[int]] = None):
+        """Iterate over the full messages of all, or some, rows"""
+        for index in range(len(self._frames)) if indexes is None else indexes:
+            yield self.message(index)
+
+    def frame(self, index: int) -> str:
+        frame = self._frames[index]
+        return frame if isinstance(frame, str) else frame.decode()
+
+    def where(self, index: int) -> Optional[str]:
+        """The WHERE of a row, with its parameters"""
+        where_id = self._where_id[index]
+        return None if where_id == NONE else self._wheres[where_id]
+
+    def where_id(self, where: str) -> int:
+        """The id standing for a WHERE in the where_ids column, NONE if absent"""
+        return self._where_ids.get(where, NONE)
+
+    @property
+    def wheres(self) -> list:
+        """The where dictionary, indexed by the where_ids column"""
+        return self._wheres
+
+    @property
+    def message_types(self) -> array:
+        """Index of the message type of each row in MESSAGE_TYPES"""
+        return self._message_type
+
+    @property
+    def whos(self) -> array:
+        return self._who
+
+    @property
+    def whats(self) -> array:
+        return self._what
+
+    @property
+    def where_ids(self) -> array:
+        return self._where_id
+
+    @property
+    def dimensions(self) -> array:
+        return self._dimension
+
+    @property
+    def values(self) -> array:
+        """The first dimension value of each row"""
+        return self._value
+
+    @property
+    def timestamps(self) -> array:
+        return self._timestamp
+
+    def to_numpy(self) -> dict:
+        """The columns as NumPy arrays sharing the batch memory, requires numpy.
+        The batch can't be extended while those arrays are alive"""
+        if numpy is None:
+            raise ImportError("numpy is required to export an EventBatch to NumPy.")
+        return {
+            _name: numpy.frombuffer(_column, dtype=_column.typecode)
+            for _name, _column in (
+                ("message_types", self._message_type),
+                ("whos", self._who),
+                ("whats", self._what),
+                ("where_ids", self._where_id),
+                ("dimensions", self._dimension),
+                ("values", self._value),
+                ("timestamps", self._timestamp),
+            )
+        }
@@ -0,0 +1,891 @@
+""" OWNd benchmarks, run them with `python -m OWNd.bench` """
+
+import argparse
+import asyncio
+import datetime
+import json
+import pickle
+import random
+import re
+import gc
+import sys
+import time
+import tracemalloc
+
+import pytz
+
+from .batch import EventBatch
+from .clock import DateResolver
+from .message import (
+    CLIMATE_MODE_AUTO,
+    CLIMATE_MODE_COOL,
+    CLIMATE_MODE_HEAT,
+    CLIMATE_MODE_OFF,
+    _HEATING_MODES,
+    FrameSplitter,
+    OWNAutomationCommand,
+    OWNDryContactCommand,
+    OWNEnergyCommand,
+    OWNEnergyEvent,
+    OWNFrameCache,
+    OWNGatewayCommand,
+    OWNHeatingCommand,
+    OWNLightingCommand,
+    OWNMessage,
+    _decode_temperature,
+    _tokenize,
+)
+from .wire import decode_batch, encode_batch
+
+# Frames of every shape, the tokenizer is checked against the regex cascade on them
+CORPUS = [
+    "*1*1*12##",
+    "*1*0*12##",
+    "*1*1*0215#4#01##",
+    "*#1*14*1*150*0##",
+    "*2*1*21##",
+    "*2*0*21##",
+    "*#2*21*10*10*45*0*0##",
+    "*#4*1*0*0215##",
+    "*#4*1*14*0210*3##",
+    "*#4*1*19*0*1##",
+    "*4*1#0215*1##",
+    "*#18*51*113*1500##",
+    "*#18*51*511#1#15*5*123##",
+    "*#13**22*12*30*00*001*05*15*03*2024##",
+    "*15*21#1*31##",
+    "*25*31#1*31##",
+    "*#1*12##",
+    "*#4*1*0##",
+]
+
+
+def _lighting_frame(rng: random.Random) -> str:
+    _where = f"{rng.randint(1, 9)}{rng.randint(1, 9)}"
+    if rng.random() < 0.1:
+        _where = f"{_where}#4#0{rng.randint(1, 9)}"
+    _kind = rng.random()
+    if _kind < 0.6:
+        return f"*1*{rng.randint(0, 1)}*{_where}##"
+    if _kind < 0.8:
+        return f"*1*{rng.randint(2, 10)}*{_where}##"
+    return f"*#1*{_where}*1*{rng.randint(100, 200)}*{rng.randint(0, 255)}##"
+
+
+def _automation_frame(rng: random.Random) -> str:
+    _where = f"{rng.randint(1, 9)}{rng.randint(1, 9)}"
+    if rng.random() < 0.7:
+        return f"*2*{rng.randint(0, 2)}*{_where}##"
+    return f"*#2*{_where}*10*{rng.choice((10, 11, 12))}*{rng.randint(0, 100)}*0*0##"
+
+
+def _heating_frame(rng: random.Random) -> str:
+    _zone = rng.randint(1, 99)
+    _kind = rng.random()
+    if _kind < 0.4:
+        return f"*#4*{_zone}*0*0{rng.randint(150, 280):03d}##"
+    if _kind < 0.55:
+        return f"*#4*{_zone}*14*0{rng.randint(150, 250):03d}*3##"
+    if _kind < 0.65:
+        return f"*#4*{_zone}*12*0{rng.randint(150, 250):03d}*3##"
+    if _kind < 0.75:
+        return f"*#4*{_zone}*19*{rng.randint(0, 1)}*{rng.randint(0, 1)}##"
+    if _kind < 0.85:
+        return f"*#4*{_zone}#{rng.randint(1, 9)}*20*{rng.randint(0, 1)}##"
+    return f"*4*{rng.choice((1, 0, 303, 1101, 2201, 13001, 23017, 20))}*{_zone}##"
+
+
+def _energy_frame(rng: random.Random) -> str:
+    _where = f"5{rng.randint(1, 9)}"
+    _kind = rng.random()
+    if _kind < 0.7:
+        return f"*#18*{_where}*113*{rng.randint(0, 6000)}##"
+    if _kind < 0.8:
+        return f"*#18*{_where}*51*{rng.randint(0, 10**7)}##"
+    if _kind < 0.9:
+        return f"*#18*{_where}*54*{rng.randint(0, 10**5)}##"
+    return f"*#18*{_where}*511#{rng.randint(1, 12)}#{rng.randint(1, 28)}*{rng.randint(1, 24)}*{rng.randint(0, 2000)}##"  # pylint: disable=line-too-long
+
+
+def _gateway_frame(rng: random.Random) -> str:
+    _kind = rng.random()
+    if _kind < 0.5:
+        return f"*#13**0*{rng.randint(0, 23):02d}*{rng.randint(0, 59):02d}*{rng.randint(0, 59):02d}*001##"  # pylint: disable=line-too-long
+    if _kind < 0.8:
+        return f"*#13**1*{rng.randint(0, 6):02d}*{rng.randint(1, 28):02d}*{rng.randint(1, 12):02d}*2024##"  # pylint: disable=line-too-long
+    return f"*#13**22*{rng.randint(0, 23):02d}*{rng.randint(0, 59):02d}*00*001*{rng.randint(0, 6):02d}*{rng.randint(1, 28):02d}*{rng.randint(1, 12):02d}*2024##"  # pylint: disable=line-too-long
+
+
+def _cen_frame(rng: random.Random) -> str:
+    _where = f"{rng.randint(1, 9)}{rng.randint(1, 9)}"
+    _action = rng.choice(("", "#1", "#2", "#3"))
+    return f"*15*{rng.randint(0, 31)}{_action}*{_where}##"
+
+
+def _cen_plus_frame(rng: random.Random) -> str:
+    return f"*25*{rng.randint(21, 25)}#{rng.randint(0, 31)}*2{rng.randint(1, 2047)}##"
+
+
+def _dry_contact_frame(rng: random.Random) -> str:
+    return f"*25*{rng.choice((31, 32))}#{rng.randint(0, 1)}*3{rng.randint(1, 201)}##"
+
+
+def _signaling_frame(rng: random.Random) -> str:
+    return "*#*1##" if rng.random() < 0.95 else "*#*0##"
+
+
+# Frame generators of a busy bus, and their share of the traffic
+GENERATORS = {
+    "lighting": _lighting_frame,
+    "automation": _automation_frame,
+    "heating": _heating_frame,
+    "energy": _energy_frame,
+    "gateway": _gateway_frame,
+    "cen": _cen_frame,
+    "cen_plus": _cen_plus_frame,
+    "dry_contact": _dry_contact_frame,
+    "signaling": _signaling_frame,
+}
+MIX = {
+    "lighting": 35,
+    "automation": 10,
+    "heating": 20,
+    "energy": 15,
+    "gateway": 2,
+    "cen": 5,
+    "cen_plus": 3,
+    "dry_contact": 5,
+    "signaling": 5,
+}
+
+
+def generate_corpus(count: int, mix: dict = None, seed: int = 0) -> list:
+    """`count` random frames, drawn from GENERATORS according to the mix ratios"""
+    mix = MIX if mix is None else mix
+    _unknown = set(mix) - set(GENERATORS)
+    if _unknown:
+        raise ValueError(f"Unknown frame families: {', '.join(sorted(_unknown))}.")
+    rng = random.Random(seed)
+    _names = [_name for _name in mix if mix[_name] > 0]
+    if not _names:
+        raise ValueError("The mix needs at least one frame family.")
+    _families = rng.choices(_names, weights=[mix[_name] for _name in _names], k=count)
+    return [GENERATORS[_family](rng) for _family in _families]
+
+
+_STATUS = re.compile(
+    r"^\*(?P<who>\d+)\*(?P<what>\d+)(?P<what_param>(?:#\d+)*)\*(?P<where>\*|#?\d+)(?P<where_param>(?:#\d+)*)##$"  # pylint: disable=line-too-long
+)
+_STATUS_REQUEST = re.compile(
+    r"^\*#(?P<who>\d+)\*(?P<where>#?\d+)(?P<where_param>(?:#\d+)*)##$"
+)
+_DIMENSION_WRITING = re.compile(
+    r"^\*#(?P<who>\d+)\*(?P<where>#?\d+)?(?P<where_param>(?:#\d+)*)?\*#(?P<dimension>\d+)(?P<dimension_param>(?:#\d+)*)?(?P<dimension_value>(?:\*\d*)+)##$"  # pylint: disable=line-too-long
+)
+_DIMENSION_REQUEST = re.compile(
+    r"^\*#(?P<who>\d+)\*(?P<where>#?\d+)?(?P<where_param>(?:#\d+)*)?\*(?P<dimension>\d+)##$"
+)
+_DIMENSION_REQUEST_REPLY = re.compile(
+    r"^\*#(?P<who>\d+)\*(?P<where>#?\d+)?(?P<where_param>(?:#\d+)*)?\*(?P<dimension>\d+)(?P<dimension_param>(?:#\d+)*)?(?P<dimension_value>(?:\*\d*)+)##$"  # pylint: disable=line-too-long
+)
+
+
+def _split(group: str, separator: str = "#") -> list:
+    _list = group.split(separator)
+    del _list[0]
+    return _list
+
+
+def _regex_tokenize(data: str):
+    """Reference implementation: the regex cascade OWNMessage used to run"""
+    if _STATUS.match(data):
+        _match = _STATUS.match(data)
+        _what = int(_match.group("what"))
+        return (
+            "COMMAND_TRANSLATION" if _what == 1000 else "EVENT",
+            "STATUS",
+            int(_match.group("who")),
+            _what,
+            _split(_match.group("what_param")),
+            _match.group("where"),
+            _split(_match.group("where_param")),
+            None,
+            None,
+            None,
+        )
+    elif _STATUS_REQUEST.match(data):
+        _match = _STATUS_REQUEST.match(data)
+        return (
+            "REQUEST",
+            "STATUS_REQUEST",
+            int(_match.group("who")),
+            None,
+            None,
+            _match.group("where"),
+            _split(_match.group("where_param")),
+            None,
+            None,
+            None,
+        )
+    elif _DIMENSION_REQUEST.match(data):
+        _match = _DIMENSION_REQUEST.match(data)
+        return (
+            "REQUEST",
+            "DIMENSION_REQUEST",
+            int(_match.group("who")),
+            None,
+            None,
+            _match.group("where"),
+            _split(_match.group("where_param")),
+            int(_match.group("dimension")),
+            None,
+            None,
+        )
+    elif _DIMENSION_REQUEST_REPLY.match(data):
+        _match = _DIMENSION_REQUEST_REPLY.match(data)
+        family = "EVENT"
+        message_type = "DIMENSION_REQUEST_REPLY"
+    elif _DIMENSION_WRITING.match(data):
+        _match = _DIMENSION_WRITING.match(data)
+        family = "COMMAND"
+        message_type = "DIMENSION_WRITING"
+    else:
+        return None
+    return (
+        family,
+        message_type,
+        int(_match.group("who")),
+        None,
+        None,
+        _match.group("where"),
+        _split(_match.group("where_param")),
+        int(_match.group("dimension")),
+        _split(_match.group("dimension_param")),
+        _split(_match.group("dimension_value"), "*"),
+    )
+
+
+def _frames_per_second(function, frames: list, repeat: int) -> float:
+    """Best throughput out of `repeat` runs of `function` over `frames`"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for frame in frames:
+            function(frame)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None or elapsed < best else best
+    return len(frames) / best
+
+
+def _report(name: str, before: float, after: float) -> None:
+    print(
+        f"{name:<40} before: {before:>12,.0f} frames/s   after: {after:>12,.0f} frames/s   speedup: {after / before:.2f}x"  # pylint: disable=line-too-long
+    )
+
+
+def bench_tokenizer(frames: list, repeat: int) -> None:
+    """Regex cascade vs single pass tokenizer"""
+    for frame in CORPUS:
+        assert _tokenize(frame) == _regex_tokenize(frame), frame
+    _report(
+        "tokenizer",
+        _frames_per_second(_regex_tokenize, frames, repeat),
+        _frames_per_second(_tokenize, frames, repeat),
+    )
+
+
+def _parse_and_log(frame: str):
+    """What parsing used to cost, when every message built its log eagerly"""
+    return OWNMessage.parse(frame).human_readable_log
+
+
+def _decode_and_parse(frame: bytes):
+    """What the sessions used to do with every frame read off the wire"""
+    return OWNMessage.parse(frame.decode())
+
+
+def bench_bytes(frames: list, repeat: int) -> None:
+    """Decoding frames before parsing vs parsing them as bytes"""
+    _frames = [frame.encode() for frame in frames]
+    _report(
+        "bytes",
+        _frames_per_second(_decode_and_parse, _frames, repeat),
+        _frames_per_second(OWNMessage.parse_bytes, _frames, repeat),
+    )
+
+
+async def _read_per_frame(stream: bytes, parse: bool) -> int:
+    """One readuntil() per frame, as OWNEventSession.get_next does"""
+    reader = asyncio.StreamReader()
+    reader.feed_data(stream)
+    reader.feed_eof()
+    count = 0
+    while not reader.at_eof():
+        frame = await reader.readuntil(b"##")
+        if not parse or OWNMessage.parse_bytes(frame) is not None:
+            count += 1
+    return count
+
+
+async def _read_chunks(stream: bytes, parse: bool) -> int:
+    """Large reads, split into frames by a FrameSplitter"""
+    reader = asyncio.StreamReader()
+    reader.feed_data(stream)
+    reader.feed_eof()
+    splitter = FrameSplitter()
+    count = 0
+    while not reader.at_eof():
+        chunk = await reader.read(65536)
+        count += len(splitter.parse(chunk) if parse else splitter.split(chunk))
+    return count
+
+
+def _stream_frames_per_second(function, stream: bytes, parse: bool, repeat: int):
+    """Best throughput out of `repeat` runs of `function` over the whole stream"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = asyncio.run(function(stream, parse))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None or elapsed < best else best
+    return count / best
+
+
+def bench_stream(frames: list, repeat: int) -> None:
+    """readuntil() per frame vs chunked reads through a FrameSplitter"""
+    _stream = "".join(frames).encode()
+    for _name, _parse in (("stream (split)", False), ("stream (split+parse)", True)):
+        _report(
+            _name,
+            _stream_frames_per_second(_read_per_frame, _stream, _parse, repeat),
+            _stream_frames_per_second(_read_chunks, _stream, _parse, repeat),
+        )
+
+
+def bench_batch(frames: list, repeat: int) -> None:
+    """One message per frame vs a columnar EventBatch"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        EventBatch.from_frames(frames)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None or elapsed < best else best
+    _report(
+        "batch",
+        _frames_per_second(OWNMessage.parse, frames, repeat),
+        len(frames) / best,
+    )
+
+
+def _legacy_event_content(message) -> dict:
+    """Reference implementation: event_content as it used to be built on every access"""
+    # pylint: disable=protected-access
+    _event = {
+        "message": str(message),
+        "family": message._family.replace("_", " ").capitalize(),
+        "type": message._message_type.replace("_", " ").capitalize(),
+        "who": message._who,
+    }
+    if message._where:
+        _event.update({"where": message._where})
+    if message.interface:
+        _event.update({"interface": message.interface})
+        if message._where_param and len(message._where_param) > 2:
+            _event.update({"where parameters": message._where_param[2:]})
+    elif message._where_param:
+        _event.update({"where parameters": message._where_param})
+    if message._what:
+        _event.update({"what": message._what})
+    if message._what_param:
+        _event.update({"what parameters": message._what_param})
+    if message._dimension:
+        _event.update({"dimension": message._dimension})
+    if message._dimension_param:
+        _event.update({"dimension parameters": message._dimension_param})
+    if message._dimension_value:
+        _event.update({"dimension values": message._dimension_value})
+    return _event
+
+
+def bench_serialize(frames: list, repeat: int) -> None:
+    """Building event_content on every access vs to_dict() and to_tuple(), per type"""
+    _by_type = {}
+    for frame in frames:
+        _message = OWNMessage.parse(frame)
+        if not _message.is_event:
+            continue
+        assert _message.to_dict() == _legacy_event_content(_message), frame
+        _by_type.setdefault(type(_message).__name__, []).append(_message)
+    for _name, _messages in _by_type.items():
+        _before = _frames_per_second(_legacy_event_content, _messages, repeat)
+        _report(
+            f"{_name} dict",
+            _before,
+            _frames_per_second(OWNMessage.to_dict, _messages, repeat),
+        )
+        _report(
+            f"{_name} tuple",
+            _before,
+            _frames_per_second(OWNMessage.to_tuple, _messages, repeat),
+        )
+
+
+class _UncachedDateResolver(DateResolver):
+    """Reference implementation: reads the clock and builds dates for every frame"""
+
+    def resolve_day(self, month: int, day: int):
+        _today = datetime.date.today()
+        try:
+            _date = datetime.date(_today.year, month, day)
+            if _date > _today:
+                _date = datetime.date(_today.year - 1, month, day)
+        except ValueError:
+            return None
+        return _date
+
+
+def bench_energy(frames: list, repeat: int) -> None:  # pylint: disable=unused-argument
+    """A year of hourly consumption frames, dated with and without the resolver tables"""
+    _today = datetime.date.today()
+    _frames = [
+        f"*#18*51*511#{_day.month}#{_day.day}*{_hour}*{_hour * 10}##"
+        for _day in (_today - datetime.timedelta(days=_days) for _days in range(365))
+        for _hour in range(1, 26)
+    ]
+    OWNEnergyEvent.set_date_resolver(_UncachedDateResolver())
+    _before = _frames_per_second(OWNMessage.parse, _frames, repeat)
+    OWNEnergyEvent.set_date_resolver()
+    _report("energy", _before, _frames_per_second(OWNMessage.parse, _frames, repeat))
+
+
+def _parse_back(message_class, frame: str):
+    """Reference implementation: builders formatted their frame and the constructor
+    parsed it back with the regex cascade"""
+    return message_class(frame, _regex_tokenize(frame))
+
+
+def _legacy_heating_zone(where, standalone: bool):
+    """Reference implementation: the zone and zone name the heating builders used
+    to work out, compiling their regex on every call"""
+    central_local = re.compile(r"^#0#\d+$")
+    if central_local.match(str(where)):
+        return where, f"zone {int(where.split('#')[-1])}"
+    zone = int(where.split("#")[-1]) if where.startswith("#") else int(where)
+    zone_name = f"zone {zone}" if zone > 0 else "general"
+    if standalone:
+        zone = f"#{zone}" if zone == 0 else str(zone)
+    else:
+        zone = f"#{zone}"
+    return zone, zone_name
+
+
+def _legacy_set_mode(where, mode: str, standalone=False):
+    """Reference implementation: OWNHeatingCommand.set_mode as it used to be"""
+    zone, zone_name = _legacy_heating_zone(where, standalone)
+    mode_name = mode
+    if mode == CLIMATE_MODE_OFF:
+        mode = 303
+    elif mode == CLIMATE_MODE_AUTO:
+        mode = 311
+    else:
+        return None
+    message = _parse_back(OWNHeatingCommand, f"*4*{mode}*{zone}##")
+    message._human_readable_log = f"Setting {zone_name} mode to '{mode_name}'."
+    return message
+
+
+def _legacy_set_temperature(where, temperature: float, mode: str, standalone=False):
+    """Reference implementation: OWNHeatingCommand.set_temperature as it used to be"""
+    zone, zone_name = _legacy_heating_zone(where, standalone)
+    temperature = round(temperature * 2) / 2
+    if temperature < 5.0:
+        temperature = 5.0
+    elif temperature > 40.0:
+        temperature = 40.0
+    temperature_print = f"{temperature}"
+    temperature = int(temperature * 10)
+    mode_name = mode
+    if mode == CLIMATE_MODE_HEAT:
+        mode = 1
+    elif mode == CLIMATE_MODE_COOL:
+        mode = 2
+    elif mode == CLIMATE_MODE_AUTO:
+        mode = 3
+    message = _parse_back(
+        OWNHeatingCommand, f"*#4*{zone}*#14*{temperature:04d}*{mode}##"
+    )
+    message._human_readable_log = (
+        f"Setting {zone_name} to {temperature_print}°C in mode '{mode_name}'."
+    )
+    return message
+
+
+# Builder, its arguments and how it used to build the same command
+_BUILDERS = [
+    (
+        OWNLightingCommand.status,
+        ("12",),
+        lambda where: _parse_back(OWNLightingCommand, f"*#1*{where}##"),
+    ),
+    (
+        OWNLightingCommand.switch_on,
+        ("12",),
+        lambda where: _parse_back(OWNLightingCommand, f"*1*1*{where}##"),
+    ),
+    (
+        OWNLightingCommand.switch_off,
+        ("12#4#01",),
+        lambda where: _parse_back(OWNLightingCommand, f"*1*0*{where}##"),
+    ),
+    (
+        OWNLightingCommand.set_brightness,
+        ("12", 50, 2),
+        lambda where, level, speed: _parse_back(
+            OWNLightingCommand, f"*#1*{where}*#1*{level + 100}*{speed}##"
+        ),
+    ),
+    (
+        OWNAutomationCommand.raise_shutter,
+        ("21",),
+        lambda where: _parse_back(OWNAutomationCommand, f"*2*1*{where}##"),
+    ),
+    (
+        OWNAutomationCommand.set_shutter_level,
+        ("21", 40),
+        lambda where, level: _parse_back(
+            OWNAutomationCommand, f"*#2*{where}*#11#001*{level}##"
+        ),
+    ),
+    (OWNHeatingCommand.set_mode, ("1", "auto"), _legacy_set_mode),
+    (OWNHeatingCommand.set_temperature, ("1", 21.5, "heat"), _legacy_set_temperature),
+    (
+        OWNEnergyCommand.get_total_consumption,
+        ("51",),
+        lambda where: _parse_back(OWNEnergyCommand, f"*#18*{where}*51##"),
+    ),
+    (
+        OWNGatewayCommand.set_date_to_today,
+        ("UTC",),
+        lambda time_zone: _parse_back(
+            OWNGatewayCommand,
+            f"*#13**#1*0{pytz.timezone(time_zone).localize(datetime.datetime.now()).strftime('%w*%d*%m*%Y##')}",  # pylint: disable=line-too-long
+        ),
+    ),
+    (
+        OWNDryContactCommand.status,
+        ("31",),
+        lambda where: _parse_back(OWNDryContactCommand, f"*#25*{where}##"),
+    ),
+]
+
+
+def _legacy_heating_mode(mode: int):
+    """Reference implementation: the comparison chain OWNHeatingEvent used to run"""
+    if mode in [103, 203, 303, 102, 202, 302]:
+        return CLIMATE_MODE_OFF
+    if (
+        mode in [0, 210, 211, 215]
+        or (mode >= 2101 and mode <= 2103)
+        or (mode >= 2201 and mode <= 2216)
+    ):
+        return CLIMATE_MODE_COOL
+    if (
+        mode in [1, 110, 111, 115]
+        or (mode >= 1101 and mode <= 1103)
+        or (mode >= 1201 and mode <= 1216)
+    ):
+        return CLIMATE_MODE_HEAT
+    if (
+        mode in [310, 311, 315]
+        or (mode >= 23001 and mode <= 23255)
+        or (mode >= 13001 and mode <= 13255)
+    ):
+        return CLIMATE_MODE_AUTO
+    return None
+
+
+def _legacy_temperature(value: str) -> float:
+    """Reference implementation: temperatures as they used to be decoded"""
+    return float(f"{value[1:3]}.{value[-1]}")
+
+
+def bench_heating(frames: list, repeat: int) -> None:
+    """Mode and temperature decoding of a building's thermostat zones"""
+    _events = [
+        OWNMessage.parse(_frame)
+        for _zone in range(1, 100)
+        for _frame in (
+            f"*4*{(1, 0, 303, 1101, 2201, 13001, 23017, 20)[_zone % 8]}*{_zone}##",
+            f"*#4*{_zone}*0*0{180 + _zone:03d}##",
+            f"*#4*{_zone}*14*0{200 + _zone % 40:03d}*3##",
+        )
+    ]
+    _events = (_events * (len(frames) // len(_events) + 1))[: len(frames)]
+    _modes = [_event._mode for _event in _events if _event._mode is not None]
+    _values = [
+        _event._dimension_value[0] for _event in _events if _event._dimension_value
+    ]
+    _report(
+        "heating mode lookup",
+        _frames_per_second(_legacy_heating_mode, _modes, repeat),
+        _frames_per_second(_HEATING_MODES.get, _modes, repeat),
+    )
+    _report(
+        "heating temperature decoding",
+        _frames_per_second(_legacy_temperature, _values, repeat),
+        _frames_per_second(_decode_temperature, _values, repeat),
+    )
+
+
+def bench_builders(frames: list, repeat: int) -> None:
+    """Formatting then parsing command frames vs building them from their fields"""
+    for _builder, _args, _legacy in _BUILDERS:
+        assert str(_builder(*_args)) == str(_legacy(*_args)), _builder.__qualname__
+        _calls = [_args] * len(frames)
+        _report(
+            _builder.__qualname__,
+            _frames_per_second(
+                lambda args, _legacy=_legacy: _legacy(*args), _calls, repeat
+            ),
+            _frames_per_second(
+                lambda args, _builder=_builder: _builder(*args), _calls, repeat
+            ),
+        )
+
+
+def bench_templates(frames: list, repeat: int) -> None:
+    """Building and encoding a command per send vs cached frames"""
+    _sends = [
+        (OWNLightingCommand.switch_on, ("12",)),
+        (OWNLightingCommand.switch_off, ("12",)),
+        (OWNAutomationCommand.lower_shutter, ("21",)),
+        (OWNHeatingCommand.set_temperature, ("1", 21.5, "heat")),
+    ] * (len(frames) // 4)
+    _cache = OWNFrameCache()
+    _report(
+        "OWNFrameCache.frame",
+        _frames_per_second(
+            lambda send: str(send[0](*send[1])).encode(), _sends, repeat
+        ),
+        _frames_per_second(
+            lambda send: _cache.frame(send[0], *send[1]), _sends, repeat
+        ),
+    )
+
+
+def bench_log(frames: list, repeat: int) -> None:
+    """Eager vs lazy human readable log, per event type"""
+    _by_type = {}
+    for frame in frames:
+        _by_type.setdefault(type(OWNMessage.parse(frame)).__name__, []).append(frame)
+    for _name, _frames in _by_type.items():
+        _report(
+            _name,
+            _frames_per_second(_parse_and_log, _frames, repeat),
+            _frames_per_second(OWNMessage.parse, _frames, repeat),
+        )
+
+
+def _bytes_per_message(frames: list) -> float:
+    """Memory retained per parsed message, as traced by tracemalloc"""
+    tracemalloc.start()
+    _before = tracemalloc.take_snapshot()
+    _messages = [OWNMessage.parse(frame) for frame in frames]
+    _after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    _retained = sum(_stat.size_diff for _stat in _after.compare_to(_before, "filename"))
+    return (_retained - sys.getsizeof(_messages)) / len(_messages)
+
+
+def _object_size(message) -> int:
+    """Shallow size of a message, including its __dict__ if it has one"""
+    _size = sys.getsizeof(message)
+    if hasattr(message, "__dict__"):
+        _size += sys.getsizeof(message.__dict__)
+    return _size
+
+
+def bench_memory(frames: list, repeat: int) -> None:  # pylint: disable=unused-argument
+    """Per instance footprint of each message type"""
+    _by_type = {}
+    for frame in frames:
+        _by_type.setdefault(type(OWNMessage.parse(frame)).__name__, []).append(frame)
+    for _name, _frames in _by_type.items():
+        print(
+            f"{_name:<24} object: {_object_size(OWNMessage.parse(_frames[0])):>6} bytes   retained: {_bytes_per_message(_frames):>8,.1f} bytes/message"  # pylint: disable=line-too-long
+        )
+
+
+def bench_wire(frames: list, repeat: int) -> None:
+    """Pickle and JSON vs the binary wire format, round trips of batches of 100 messages"""
+    _messages = [OWNMessage.parse(frame) for frame in frames]
+    _batches = [_messages[i : i + 100] for i in range(0, len(_messages), 100)]
+    _formats = {
+        "pickle": (pickle.dumps, pickle.loads),
+        "json": (
+            lambda batch: json.dumps([str(_message) for _message in batch]),
+            lambda data: [OWNMessage.parse(_frame) for _frame in json.loads(data)],
+        ),
+        "wire": (encode_batch, decode_batch),
+    }
+    _wire = _frames_per_second(
+        lambda batch: decode_batch(encode_batch(batch)), _batches, repeat
+    )
+    for _name, (_encode, _decode) in _formats.items():
+        _size = sum(len(_encode(_batch)) for _batch in _batches) / len(_messages)
+        print(f"{_name:<36} size: {_size:>8,.1f} bytes/message")
+        if _name != "wire":
+            _report(
+                f"{_name} round trip (messages x100)",
+                _frames_per_second(
+                    lambda batch, _encode=_encode, _decode=_decode: _decode(
+                        _encode(batch)
+                    ),
+                    _batches,
+                    repeat,
+                ),
+                _wire,
+            )
+
+
+def _blocks_per_frame(function, frames: list) -> float:
+    """Memory blocks still allocated per frame once `function` ran over `frames`,
+    with the results kept; temporary allocations are not counted"""
+    gc.collect()
+    gc.disable()
+    try:
+        _before = sys.getallocatedblocks()
+        _results = [function(frame) for frame in frames]
+        _after = sys.getallocatedblocks()
+    finally:
+        gc.enable()
+    return (_after - _before - 1) / len(_results)
+
+
+def _measure(name: str, function, frames: list, repeat: int) -> None:
+    _rate = _frames_per_second(function, frames, repeat)
+    print(
+        f"{name:<40} {_rate:>12,.0f} frames/s   {1e9 / _rate:>8,.0f} ns/frame   {_blocks_per_frame(function, frames):>6.1f} blocks/frame"  # pylint: disable=line-too-long
+    )
+
+
+def bench_suite(frames: list, repeat: int) -> None:
+    """Absolute figures to track from release to release: parsing, each event
+    constructor, event_content, unique_id and the command builders"""
+    _measure("OWNMessage.parse", OWNMessage.parse, frames, repeat)
+    _measure(
+        "OWNMessage.parse_bytes",
+        OWNMessage.parse_bytes,
+        [_frame.encode() for _frame in frames],
+        repeat,
+    )
+
+    _by_class = {}
+    for _frame in frames:
+        _message = OWNMessage.parse(_frame)
+        _by_class.setdefault(type(_message), []).append(_frame)
+    for _class, _frames in _by_class.items():
+        _tokens = [(_frame, _tokenize(_frame)) for _frame in _frames]
+        _measure(
+            f"{_class.__name__}()",
+            lambda item, _class=_class: _class(*item) if item[1] else _class(item[0]),
+            _tokens,
+            repeat,
+        )
+
+    _events = [
+        _message
+        for _message in map(OWNMessage.parse, frames)
+        if _message is not None and _message.is_event
+    ]
+    _measure(
+        "event_content (first access)",
+        lambda message: message._build_event_content(),  # pylint: disable=protected-access
+        _events,
+        repeat,
+    )
+    _measure("unique_id", lambda message: message.unique_id, _events, repeat)
+
+    for _builder, _args, _ in _BUILDERS:
+        _measure(
+            _builder.__qualname__,
+            lambda args, _builder=_builder: _builder(*args),
+            [_args] * len(frames),
+            repeat,
+        )
+
+
+BENCHMARKS = {
+    "suite": bench_suite,
+    "tokenizer": bench_tokenizer,
+    "bytes": bench_bytes,
+    "stream": bench_stream,
+    "batch": bench_batch,
+    "energy": bench_energy,
+    "heating": bench_heating,
+    "builders": bench_builders,
+    "templates": bench_templates,
+    "wire": bench_wire,
+    "log": bench_log,
+    "serialize": bench_serialize,
+    "memory": bench_memory,
+}
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        help=f"Benchmarks to run among {', '.join(BENCHMARKS)}, default is all of them",
+    )
+    parser.add_argument(
+        "-n",
+        "--frames",
+        type=int,
+        default=100000,
+        help="Number of frames in the corpus, default is 100000",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of runs, the best one is reported, default is 5",
+    )
+    parser.add_argument(
+        "-m",
+        "--mix",
+        default=None,
+        help=f"Share of each frame family in the corpus, e.g. lighting=3,heating=1, default is {','.join(f'{_name}={_weight}' for _name, _weight in MIX.items())}",  # pylint: disable=line-too-long
+    )
+    parser.add_argument(
+        "-s",
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the corpus generator, default is 0",
+    )
+    args = parser.parse_args()
+    for _name in args.benchmarks:
+        if _name not in BENCHMARKS:
+            parser.error(f"unknown benchmark '{_name}'")
+
+    _mix = None
+    if args.mix is not None:
+        try:
+            _mix = {
+                _name.strip(): float(_weight)
+                for _name, _, _weight in (
+                    _item.partition("=") for _item in args.mix.split(",")
+                )
+            }
+        except ValueError:
+            parser.error(f"invalid mix '{args.mix}'")
+    try:
+        _frames = generate_corpus(args.frames, _mix, args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+    for _name in args.benchmarks or BENCHMARKS:
+        BENCHMARKS[_name](_frames, args.repeat)
@@ -0,0 +1,93 @@
+""" This module contains the clock used to date energy consumption frames """
+
+from __future__ import annotations
+
+import datetime
+import time
+from typing import Callable, Optional
+
+
+class DateResolver:
+    """
+    Resolves the (month, day) of consumption frames into full dates.
+    Gateways only send the month and day, the year is worked out from today's
+    date. The clock is read at most once per `refresh_interval` seconds, and
+    again at day rollover; resolved dates are kept in a table until then.
+    The clock can be injected to make date resolution deterministic.
+    """
+
+    def __init__(
+        self,
+        now: Callable[[], datetime.datetime] = datetime.datetime.now,
+        refresh_interval: float = 1.0,
+        monotonic: Callable[[], float] = time.monotonic,
+    ):
+        self._now = now
+        self._refresh_interval = refresh_interval
+        self._monotonic = monotonic
+        self._today = None
+        self._valid_until = None
+        self._dates = {}
+
+    def _refresh(self) -> datetime.date:
+        _monotonic = self._monotonic()
+        if self._valid_until is not None and _monotonic < self._valid_until:
+            return self._today
+
+        _now = self._now()
+        _today = _now.date()
+        _midnight = datetime.datetime.combine(
+            _today + datetime.timedelta(days=1), datetime.time(), tzinfo=_now.tzinfo
+        )
+        self._valid_until = _monotonic + min(
+            self._refresh_interval, (_midnight - _now).total_seconds()
+        )
+        if _today != self._today:
+            self._today = _today
+            self._dates.clear()
+        return _today
+
+    def today(self) -> datetime.date:
+        return self._refresh()
+
+    def resolve_day(self, month: int, day: int) -> Optional[datetime.date]:
+        """Latest date on this month and day that is not in the future, None if invalid"""
+        if not (1 <= month <= 12 and 1 <= day <= 31):
+            return None
+        _today = self._refresh()
+        _key = (month, day, None)
+        try:
+            return self._dates[_key]
+        except KeyError:
+            pass
+        try:
+            _date = datetime.date(_today.year, month, day)
+            if _date > _today:
+                _date = datetime.date(_today.year - 1, month, day)
+        except ValueError:
+            _date = None
+        self._dates[_key] = _date
+        return _date
+
+    def resolve_month_day(
+        self, month: int, day: int, years_back: int = 0
+    ) -> Optional[datetime.date]:
+        """Day of the latest month that is not in the future, or of the same month
+        `years_back` years before it, None if invalid"""
+        if not (1 <= month <= 12 and 1 <= day <= 31):
+            return None
+        _today = self._refresh()
+        _key = (month, day, years_back)
+        try:
+            return self._dates[_key]
+        except KeyError:
+            pass
+        try:
+            _year = _today.year
+            if datetime.date(_year, month, 1) > _today:
+                _year -= 1
+            _date = datetime.date(_year - years_back, month, day)
+        except ValueError:
+            _date = None
+        self._dates[_key] = _date
+        return _date
@@ -0,0 +1,156 @@
+""" This module contains a last-write-wins coalescing stage for commands """
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from .message import OWNMessage
+
+
+class _Pending:
+    __slots__ = ("message", "address", "is_status_request", "futures", "timer")
+
+    def __init__(self, message, address, is_status_request: bool):
+        self.message = message
+        self.address = address
+        self.is_status_request = is_status_request
+        self.futures = []
+        self.timer = None
+
+
+class OWNCommandCoalescer:
+    """
+    Coalescing stage in front of a command session, or of anything with the
+    same send(). Dimension writings, such as set_brightness, set_shutter_level
+    or OWNHeatingCommand.set_temperature, are held for `window` seconds; a
+    later writing of the same dimension to the same WHO and WHERE replaces the
+    held one, which is never sent.
+    Other commands, such as on/off, are sent right away and in order: held
+    writings they could be overridden by are sent before them. Those are the
+    writings to the same device, and, when either the command or the writing
+    may address several devices (general, area, group or heating central
+    WHEREs, or any WHERE of a WHO the coalescer can't classify), all the
+    writings of the WHO.
+    """
+
+    def __init__(self, target, window: float = 0.3):
+        self._target = target
+        self._window = window
+        self._pending = {}
+        self._tasks = set()
+        self._sent = 0
+        self._coalesced = 0
+        self._dropped = 0
+
+    async def send(self, message, is_status_request: bool = False):
+        """Send the message, possibly after the coalescing window.
+        Returns what the session's send returned; for a superseded message, what
+        it returned for the message that replaced it"""
+        _command = (
+            message
+            if isinstance(message, OWNMessage)
+            else OWNMessage.parse(
+                message.decode() if isinstance(message, (bytes, bytearray)) else message
+            )
+        )
+        if _command is None or not _command.is_valid:
+            return await self._send(message, is_status_request)
+
+        # pylint: disable=protected-access
+        _target = (_command._who, _command._where, tuple(_command._where_param))
+        if _command._message_type != "DIMENSION_WRITING":
+            await self._flush_covered(_target, _command._address)
+            return await self._send(message, is_status_request)
+
+        _key = (*_target, _command._dimension)
+        future = asyncio.get_running_loop().create_future()
+        _pending = self._pending.get(_key)
+        if _pending is None:
+            _pending = self._pending[_key] = _Pending(
+                message, _command._address, is_status_request
+            )
+            _pending.timer = asyncio.get_running_loop().call_later(
+                self._window, self._flush_later, _key
+            )
+        else:
+            _pending.message = message
+            _pending.is_status_request = is_status_request
+            self._dropped += 1
+        _pending.futures.append(future)
+        return await future
+
+    async def flush(self, target: Optional[tuple] = None) -> None:
+        """Send the held writings now, all of them or those to a (WHO, WHERE, WHERE
+        parameters) target"""
+        for _key in [
+            _key for _key in self._pending if target is None or _key[:3] == target
+        ]:
+            await self._flush(_key)
+
+    async def _flush_covered(self, target: tuple, address) -> None:
+        """Send the held writings a command to target could be overridden by"""
+        _device = address.device
+        for _key in [
+            _key
+            for _key, _pending in self._pending.items()
+            if _key[:3] == target
+            or (
+                _key[0] == target[0]
+                and (_device is None or _pending.address.device in (None, _device))
+            )
+        ]:
+            await self._flush(_key)
+
+    def _flush_later(self, key: tuple) -> None:
+        _task = asyncio.create_task(self._flush(key))
+        self._tasks.add(_task)
+        _task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, key: tuple) -> None:
+        _pending = self._pending.pop(key, None)
+        if _pending is None:
+            return
+        _pending.timer.cancel()
+        if len(_pending.futures) > 1:
+            self._coalesced += 1
+        try:
+            result = await self._send(_pending.message, _pending.is_status_request)
+        except Exception as error:  # pylint: disable=broad-except
+            for _future in _pending.futures:
+                if not _future.done():
+                    _future.set_exception(error)
+        else:
+            for _future in _pending.futures:
+                if not _future.done():
+                    _future.set_result(result)
+
+    async def _send(self, message, is_status_request: bool):
+        self._sent += 1
+        result = await self._target.send(message, is_status_request=is_status_request)
+        if asyncio.isfuture(result):
+            result = await result
+        return result
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    @property
+    def pending(self) -> int:
+        """Number of writings held in their window"""
+        return len(self._pending)
+
+    @property
+    def sent(self) -> int:
+        return self._sent
+
+    @property
+    def coalesced(self) -> int:
+        """Number of writings sent in place of several commands"""
+        return self._coalesced
+
+    @property
+    def dropped(self) -> int:
+        """Number of superseded writings that were never sent"""
+        return self._dropped
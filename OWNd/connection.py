@@ -1,16 +1,17 @@
 """ This module handles TCP connections to the OpenWebNet gateway """
 
 import asyncio
+import collections
 import hmac
 import hashlib
 import string
 import random
 import logging
-from typing import Union
+from typing import AsyncIterator, Callable, Optional, Union
 from urllib.parse import urlparse
 
 from .discovery import find_gateways, get_gateway, get_port
-from .message import OWNMessage, OWNSignaling
+from .message import FrameSplitter, OWNMessage, OWNSignaling
 
 
 class OWNGateway:
@@ -221,6 +222,10 @@ class OWNSession:
     def connection_type(self, connection_type: str) -> None:
         self._type = connection_type.lower()
 
+    @property
+    def is_connected(self) -> bool:
+        return self._stream_writer is not None and not self._stream_writer.is_closing()
+
     @classmethod
     async def test_gateway(cls, gateway: OWNGateway) -> dict:
         connection = cls(gateway)
@@ -647,6 +652,19 @@ class OWNSession:
 class OWNEventSession(OWNSession):
     def __init__(self, gateway: OWNGateway = None, logger: logging.Logger = None):
         super().__init__(gateway=gateway, connection_type="event", logger=logger)
+        self._closed = False
+        self._reads = 0
+        self._frames = 0
+
+    @property
+    def reads(self) -> int:
+        """Number of socket reads done by events()"""
+        return self._reads
+
+    @property
+    def frames(self) -> int:
+        """Number of frames yielded by events()"""
+        return self._frames
 
     @classmethod
     async def connect_to_gateway(cls, gateway: OWNGateway):
@@ -680,10 +698,241 @@ class OWNEventSession(OWNSession):
             self._logger.exception("%s Event session crashed.", self._gateway.log_id)
             return None
 
+    async def events(
+        self,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[Union[OWNMessage, str]]:
+        """Messages read on the event bus: `async for message in session.events()`.
+        Each read takes all the data received so far, up to chunk_size bytes, and
+        all the complete frames in it are parsed at once. Frames that can't be
+        parsed are yielded as str, as get_next does.
+        The connection is reopened when lost; errors are logged and passed to
+        on_error instead of being yielded. The iteration ends when the session is
+        closed."""
+        self._closed = False
+        _splitter = FrameSplitter()
+        while True:
+            try:
+                _chunk = await self._stream_reader.read(chunk_size)
+                if not _chunk:
+                    raise asyncio.IncompleteReadError(_splitter.remainder, None)
+            except (ConnectionError, asyncio.IncompleteReadError) as error:
+                if self._closed:
+                    return
+                self._report(error, on_error)
+                _splitter.clear()
+                if not await self._reconnect(on_error):
+                    return
+                continue
+
+            self._reads += 1
+            for _frame in _splitter.split(_chunk):
+                try:
+                    _message = OWNMessage.parse(_frame.decode())
+                except Exception as error:  # pylint: disable=broad-except
+                    self._report(error, on_error)
+                    continue
+                self._frames += 1
+                yield _message if _message else _frame.decode(errors="replace")
+
+    async def close(self) -> None:
+        self._closed = True
+        await super().close()
+
+    def _report(
+        self, error: Exception, on_error: Optional[Callable[[Exception], None]]
+    ) -> None:
+        if isinstance(error, (ConnectionError, asyncio.IncompleteReadError)):
+            self._logger.warning(
+                "%s Event session connection error: %s", self._gateway.log_id, error
+            )
+        else:
+            self._logger.error(
+                "%s Received data could not be parsed into a message: %s",
+                self._gateway.log_id,
+                error,
+            )
+        if on_error is not None:
+            on_error(error)
+
+    async def _reconnect(self, on_error: Optional[Callable[[Exception], None]]) -> bool:
+        """Reopen the connection until it succeeds, False if the session got closed"""
+        _delay = 1
+        while not self._closed:
+            try:
+                result = await self.connect()
+            except OSError as error:
+                result = None
+                self._report(error, on_error)
+            if result is not None and result["Success"]:
+                return not self._closed
+            self._report(
+                ConnectionError(f"Event session not reopened, retrying in {_delay}s."),
+                on_error,
+            )
+            await asyncio.sleep(_delay)
+            _delay = min(_delay * 2, 60)
+        return False
+
+
+# Commands per second each gateway model is sent at first, and at most
+RATE_LIMITS = {
+    "F454": (10.0, 40.0),
+    "MyHOMEServer1": (10.0, 40.0),
+    "MH202": (5.0, 20.0),
+    "F453": (5.0, 20.0),
+    "F453AV": (5.0, 20.0),
+    "MH201": (3.0, 10.0),
+    "MH200N": (3.0, 10.0),
+    "F452": (3.0, 10.0),
+}
+DEFAULT_RATE_LIMIT = (3.0, 10.0)
+
+
+class OWNRateLimiter:
+    """
+    Token bucket shared by the command sessions to one gateway, whose rate adapts
+    to the gateway's answers: it grows by about `increase` commands per second
+    each second the ACKs come back within `target_latency`, and is multiplied by
+    `decrease` when the mean ACK latency exceeds it, or when more than
+    `max_nack_ratio` of the last `window` commands were NACKed.
+    The rate is cut at most once per `window` answers, so that one NACK storm
+    only cuts it once.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE_LIMIT[0],
+        max_rate: float = DEFAULT_RATE_LIMIT[1],
+        min_rate: float = 0.5,
+        burst: float = 2.0,
+        target_latency: float = 0.25,
+        max_nack_ratio: float = 0.1,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        window: int = 20,
+    ):
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError("Expected 0 < min_rate <= rate <= max_rate.")
+        if not 0 < decrease < 1:
+            raise ValueError("The rate decrease factor must be between 0 and 1.")
+        if burst < 1 or window < 1:
+            raise ValueError("The burst and the window must be at least 1.")
+        self._rate = rate
+        self._max_rate = max_rate
+        self._min_rate = min_rate
+        self._burst = burst
+        self._target_latency = target_latency
+        self._max_nack_ratio = max_nack_ratio
+        self._increase = increase
+        self._decrease = decrease
+        self._window = window
+        self._tokens = burst
+        self._updated = None
+        self._lock = None
+        self._answers = collections.deque(maxlen=window)
+        self._since_decrease = window
+        self._latency = None
+        self._decreases = 0
+
+    @classmethod
+    def for_gateway(cls, gateway: OWNGateway, **kwargs):
+        """Limiter starting from the RATE_LIMITS entry of the gateway model,
+        any argument of the constructor overrides it"""
+        _rate, _max_rate = RATE_LIMITS.get(gateway.model_name, DEFAULT_RATE_LIMIT)
+        kwargs.setdefault("max_rate", _max_rate)
+        kwargs.setdefault("rate", min(_rate, kwargs["max_rate"]))
+        return cls(**kwargs)
+
+    @property
+    def rate(self) -> float:
+        """Commands per second currently allowed"""
+        return self._rate
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Moving average of the ACK latency, in seconds"""
+        return self._latency
+
+    @property
+    def nack_ratio(self) -> float:
+        """Share of NACKs among the last answers"""
+        return sum(self._answers) / len(self._answers) if self._answers else 0.0
+
+    @property
+    def decreases(self) -> int:
+        """Number of times the rate was cut"""
+        return self._decreases
+
+    async def acquire(self) -> None:
+        """Wait for a token, in turn"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        _loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                _now = _loop.time()
+                if self._updated is not None:
+                    self._tokens = min(
+                        self._burst, self._tokens + (_now - self._updated) * self._rate
+                    )
+                self._updated = _now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def ack(self, latency: Optional[float] = None) -> None:
+        """Record an ACK, received latency seconds after its frame was written.
+        The latency of status requests, answered after all their replies, is left out"""
+        if latency is not None:
+            self._latency = (
+                latency
+                if self._latency is None
+                else 0.8 * self._latency + 0.2 * latency
+            )
+        self._record(False)
+
+    def nack(self) -> None:
+        self._record(True)
+
+    def _record(self, nack: bool) -> None:
+        self._answers.append(nack)
+        self._since_decrease += 1
+        if (
+            self._latency is not None and self._latency > self._target_latency
+        ) or self.nack_ratio > self._max_nack_ratio:
+            if self._since_decrease >= self._window:
+                self._rate = max(self._min_rate, self._rate * self._decrease)
+                self._since_decrease = 0
+                self._decreases += 1
+        elif not nack:
+            self._rate = min(self._max_rate, self._rate + self._increase / self._rate)
+
+
+class _Frame(bytes):
+    """A frame sent as bytes, decoded only if it is logged"""
+
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return self.decode()
+
 
 class OWNCommandSession(OWNSession):
-    def __init__(self, gateway: OWNGateway = None, logger: logging.Logger = None):
+    def __init__(
+        self,
+        gateway: OWNGateway = None,
+        logger: logging.Logger = None,
+        rate_limiter: Optional[OWNRateLimiter] = None,
+    ):
         super().__init__(gateway=gateway, connection_type="command", logger=logger)
+        self._rate_limiter = rate_limiter
+
+    @property
+    def rate_limiter(self) -> Optional[OWNRateLimiter]:
+        return self._rate_limiter
 
     @classmethod
     async def send_to_gateway(cls, message: str, gateway: OWNGateway):
@@ -698,11 +947,24 @@ class OWNCommandSession(OWNSession):
 
     async def send(self, message, is_status_request: bool = False, attempt: int = 1):
         """Send the attached message on an existing 'command' connection,
-        actively reconnecting it if it had been reset."""
+        actively reconnecting it if it had been reset.
+        The message can be a command, its frame as a str, or its frame already
+        encoded as bytes, such as the frames of an OWNFrameCache.
+        With a rate limiter, the message waits for its turn, retries included."""
+
+        if isinstance(message, (bytes, bytearray)):
+            frame = message = _Frame(message)
+        elif isinstance(message, OWNMessage):
+            frame = bytes(message)
+        else:
+            frame = str(message).encode()
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
 
         try:
 
-            self._stream_writer.write(str(message).encode())
+            _written = asyncio.get_running_loop().time()
+            self._stream_writer.write(frame)
             await self._stream_writer.drain()
             raw_response = await self._stream_reader.readuntil(OWNSession.SEPARATOR)
             resulting_message = OWNMessage.parse(raw_response.decode())
@@ -718,6 +980,8 @@ class OWNCommandSession(OWNSession):
                 resulting_message = OWNMessage.parse(raw_response.decode())
 
             if resulting_message.is_nack():
+                if self._rate_limiter is not None:
+                    self._rate_limiter.nack()
                 if attempt <= 2:
                     self._logger.error(
                         "%s Could not send message `%s`. Retrying (%d)...", self._gateway.log_id, message,
@@ -729,6 +993,12 @@ class OWNCommandSession(OWNSession):
                         "%s Could not send message `%s`. No more retries.", self._gateway.log_id, message
                     )
             elif resulting_message.is_ack():
+                if self._rate_limiter is not None:
+                    self._rate_limiter.ack(
+                        None
+                        if is_status_request
+                        else asyncio.get_running_loop().time() - _written
+                    )
                 log_message = "%s Message `%s` was successfully sent."
                 if not is_status_request:
                     self._logger.info(log_message, self._gateway.log_id, message)
@@ -744,3 +1014,548 @@ class OWNCommandSession(OWNSession):
         except Exception:  # pylint: disable=broad-except
             self._logger.exception("%s Command session crashed.", self._gateway.log_id)
             return None
+
+
+# Frames each gateway model is trusted with in flight on a pipelined command session
+PIPELINE_DEPTHS = {
+    "F454": 8,
+    "MyHOMEServer1": 8,
+    "MH202": 4,
+    "F453": 4,
+    "F453AV": 4,
+    "MH201": 2,
+    "MH200N": 2,
+    "F452": 2,
+}
+DEFAULT_PIPELINE_DEPTH = 2
+
+
+class _InFlight:
+    __slots__ = (
+        "message",
+        "frame",
+        "is_status_request",
+        "attempt",
+        "future",
+        "written",
+        "who",
+        "device",
+    )
+
+    def __init__(
+        self, message, frame: bytes, is_status_request: bool, attempt: int, future
+    ):
+        self.message = message
+        self.frame = frame
+        self.is_status_request = is_status_request
+        self.attempt = attempt
+        self.future = future
+        self.written = None
+        _message = (
+            message
+            if isinstance(message, OWNMessage)
+            else OWNMessage.parse(str(message))
+        )
+        _address = getattr(_message, "address", None)
+        # A frame that can't be parsed is ordered with every other frame
+        self.who = None if _address is None else _address.who
+        self.device = None if _address is None else _address.device
+
+    def conflicts(self, other: "_InFlight") -> bool:
+        """Whether the two frames may target the same device, and must be
+        executed in the order they were sent"""
+        if self.who is None or other.who is None:
+            return True
+        if self.who != other.who:
+            return False
+        return (
+            self.device is None or other.device is None or self.device == other.device
+        )
+
+
+class OWNPipelinedCommandSession(OWNCommandSession):
+    """
+    Command session keeping up to `depth` frames in flight, instead of waiting
+    for each frame to be acknowledged before writing the next one.
+    The gateway answers frames in order, so ACK and NACK are matched to the
+    frames in flight first in, first out; status replies sent before an ACK
+    belong to the oldest frame in flight.
+    A frame is only written once no frame to the same device, or to a group of
+    devices it may belong to, is in flight, so that a NACKed frame written again
+    can't overtake a later frame to its device.
+    The depth defaults to the PIPELINE_DEPTHS entry of the gateway model.
+    """
+
+    def __init__(
+        self,
+        gateway: OWNGateway = None,
+        logger: logging.Logger = None,
+        depth: Optional[int] = None,
+        rate_limiter: Optional[OWNRateLimiter] = None,
+    ):
+        super().__init__(gateway=gateway, logger=logger, rate_limiter=rate_limiter)
+        self._depth = depth
+        self._retries = set()
+        self._in_flight = collections.deque()
+        # Frames waiting to be written, in order, and the frames written again later
+        self._queued = []
+        self._retrying = []
+        self._wakeups = []
+        self._slots = None
+        self._waiting = 0
+        self._connected = None
+        self._closed = False
+        self._reader_task = None
+
+    @property
+    def depth(self) -> int:
+        if self._depth is not None:
+            return self._depth
+        if self._gateway is None:
+            return DEFAULT_PIPELINE_DEPTH
+        return PIPELINE_DEPTHS.get(self._gateway.model_name, DEFAULT_PIPELINE_DEPTH)
+
+    @property
+    def is_connected(self) -> bool:
+        return (
+            super().is_connected
+            and self._reader_task is not None
+            and not self._reader_task.done()
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Number of frames written and not acknowledged yet"""
+        return len(self._in_flight)
+
+    async def connect(self):
+        result = await super().connect()
+        if result is not None and result["Success"]:
+            self._slots = asyncio.Semaphore(self.depth)
+            self._waiting = 0
+            self._closed = False
+            self._connected = asyncio.Event()
+            self._connected.set()
+            self._reader_task = asyncio.create_task(self._read_responses())
+        return result
+
+    async def close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        for _retry in self._retries:
+            _retry.cancel()
+        self._shut_down()
+        await super().close()
+
+    async def send(
+        self, message, is_status_request: bool = False, attempt: int = 1
+    ) -> asyncio.Future:
+        """Write the attached message once a slot is free, without waiting for it
+        to be acknowledged. The returned future is resolved to True when the
+        message is acknowledged, to False if it could not be sent.
+        Raises ConnectionError if the session is closed, or can't be reopened,
+        while the message waits for a slot."""
+
+        future = asyncio.get_running_loop().create_future()
+        if isinstance(message, (bytes, bytearray)):
+            frame = message = _Frame(message)
+        elif isinstance(message, OWNMessage):
+            frame = bytes(message)
+        else:
+            frame = str(message).encode()
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        await self._write(_InFlight(message, frame, is_status_request, attempt, future))
+        return future
+
+    async def _write(self, entry: _InFlight) -> None:
+        if self._reader_task is None or self._reader_task.done():
+            self._logger.error(
+                "%s Could not send message `%s`, the command session is closed.",
+                self._gateway.log_id,
+                entry.message,
+            )
+            entry.future.set_result(False)
+            return
+        self._waiting += 1
+        self._queued.append(entry)
+        try:
+            await self._slots.acquire()
+            await self._connected.wait()
+            while not self._closed and self._is_held(entry):
+                _wakeup = asyncio.get_running_loop().create_future()
+                self._wakeups.append(_wakeup)
+                await _wakeup
+        finally:
+            self._waiting -= 1
+            self._queued.remove(entry)
+            self._wake_up()
+        if self._closed:
+            raise ConnectionError(
+                f"{self._gateway.log_id} The command session is closed."
+            )
+        # Queued and written in the same step, so that the queue follows the wire order
+        entry.written = asyncio.get_running_loop().time()
+        self._in_flight.append(entry)
+        self._stream_writer.write(entry.frame)
+        try:
+            await self._stream_writer.drain()
+        except ConnectionResetError:
+            # The reader notices it as well, and writes the frames in flight again
+            pass
+
+    def _is_held(self, entry: _InFlight) -> bool:
+        """Whether a frame sent earlier to the same device isn't acknowledged yet"""
+        for _other in self._in_flight:
+            if entry.conflicts(_other):
+                return True
+        for _other in self._retrying:
+            if entry.conflicts(_other):
+                return True
+        for _other in self._queued:
+            if _other is entry:
+                return False
+            if entry.conflicts(_other):
+                return True
+        return False
+
+    def _wake_up(self) -> None:
+        """Let the frames held by _is_held check again"""
+        _wakeups, self._wakeups = self._wakeups, []
+        for _wakeup in _wakeups:
+            if not _wakeup.done():
+                _wakeup.set_result(None)
+
+    async def _write_again(self, entry: _InFlight) -> None:
+        """Write a NACKed frame again when the rate limiter allows it, in its slot"""
+        try:
+            await self._rate_limiter.acquire()
+            await self._connected.wait()
+        except asyncio.CancelledError:
+            if not entry.future.done():
+                entry.future.set_result(False)
+            raise
+        finally:
+            self._retrying.remove(entry)
+            self._wake_up()
+        if self._closed:
+            if not entry.future.done():
+                entry.future.set_result(False)
+            return
+        entry.written = asyncio.get_running_loop().time()
+        self._in_flight.append(entry)
+        self._stream_writer.write(entry.frame)
+
+    async def _read_responses(self) -> None:
+        while True:
+            try:
+                raw_response = await self._stream_reader.readuntil(OWNSession.SEPARATOR)
+            except (ConnectionResetError, asyncio.IncompleteReadError):
+                if not await self._reconnect():
+                    self._shut_down()
+                    return
+                continue
+            except Exception:  # pylint: disable=broad-except
+                self._logger.exception(
+                    "%s Command session crashed.", self._gateway.log_id
+                )
+                self._shut_down()
+                return
+
+            resulting_message = OWNMessage.parse(raw_response.decode())
+            if not self._in_flight:
+                self._logger.debug(
+                    "%s Unexpected response `%s` on command session.",
+                    self._gateway.log_id,
+                    resulting_message,
+                )
+                continue
+            entry = self._in_flight[0]
+
+            if not isinstance(resulting_message, OWNSignaling):
+                self._logger.debug(
+                    "%s Message `%s` received response `%s`.",
+                    self._gateway.log_id,
+                    entry.message,
+                    resulting_message,
+                )
+            elif resulting_message.is_nack():
+                self._in_flight.popleft()
+                if self._rate_limiter is not None:
+                    self._rate_limiter.nack()
+                if entry.attempt <= 2:
+                    self._logger.error(
+                        "%s Could not send message `%s`. Retrying (%d)...",
+                        self._gateway.log_id,
+                        entry.message,
+                        entry.attempt,
+                    )
+                    # The frame keeps its slot and goes to the back of the queue, no
+                    # frame to its device was written after it, they are held
+                    entry.attempt += 1
+                    if self._rate_limiter is None:
+                        self._in_flight.append(entry)
+                        self._stream_writer.write(entry.frame)
+                    else:
+                        self._retrying.append(entry)
+                        _retry = asyncio.create_task(self._write_again(entry))
+                        self._retries.add(_retry)
+                        _retry.add_done_callback(self._retries.discard)
+                else:
+                    self._slots.release()
+                    self._logger.error(
+                        "%s Could not send message `%s`. No more retries.",
+                        self._gateway.log_id,
+                        entry.message,
+                    )
+                    entry.future.set_result(False)
+                    self._wake_up()
+            elif resulting_message.is_ack():
+                self._in_flight.popleft()
+                self._slots.release()
+                self._wake_up()
+                if self._rate_limiter is not None:
+                    self._rate_limiter.ack(
+                        None
+                        if entry.is_status_request
+                        else asyncio.get_running_loop().time() - entry.written
+                    )
+                log_message = "%s Message `%s` was successfully sent."
+                if not entry.is_status_request:
+                    self._logger.info(log_message, self._gateway.log_id, entry.message)
+                else:
+                    self._logger.debug(log_message, self._gateway.log_id, entry.message)
+                if not entry.future.done():
+                    entry.future.set_result(True)
+
+    async def _reconnect(self) -> bool:
+        """Reopen the connection, then write the frames in flight again, in order"""
+        self._logger.debug(
+            "%s Command session connection reset, retrying...", self._gateway.log_id
+        )
+        self._connected.clear()
+        result = await OWNSession.connect(self)
+        if result is None or not result["Success"]:
+            return False
+        for entry in self._in_flight:
+            self._stream_writer.write(entry.frame)
+        self._connected.set()
+        try:
+            await self._stream_writer.drain()
+        except ConnectionResetError:
+            pass
+        return True
+
+    def _fail_in_flight(self) -> None:
+        while self._in_flight:
+            entry = self._in_flight.popleft()
+            if not entry.future.done():
+                entry.future.set_result(False)
+
+    def _shut_down(self) -> None:
+        """Fail the frames in flight, and wake the sends waiting for a slot or for
+        the connection, so that they fail as well"""
+        self._closed = True
+        self._fail_in_flight()
+        self._wake_up()
+        if self._connected is not None:
+            self._connected.set()
+        if self._slots is not None:
+            for _ in range(self._waiting):
+                self._slots.release()
+
+
+# Command sessions each gateway model accepts at once
+SESSION_LIMITS = {
+    "F454": 4,
+    "MyHOMEServer1": 4,
+    "MH202": 2,
+    "F453": 2,
+    "F453AV": 2,
+    "MH201": 1,
+    "MH200N": 1,
+    "F452": 1,
+}
+DEFAULT_SESSION_LIMIT = 2
+
+
+class _PooledSession:
+    __slots__ = ("session", "lock", "pending", "healthy", "replacement")
+
+    def __init__(self, session: OWNCommandSession):
+        self.session = session
+        # Plain command sessions can only wait for one ACK at a time
+        self.lock = (
+            None if isinstance(session, OWNPipelinedCommandSession) else asyncio.Lock()
+        )
+        self.pending = 0
+        self.healthy = False
+        self.replacement = None
+
+
+class OWNCommandPool:
+    """
+    Authenticated command sessions to one gateway, each send is routed to the
+    least busy healthy session, so that a slow status sweep on one session
+    doesn't delay a command sent on another.
+    The pool never opens more sessions than the SESSION_LIMITS entry of the
+    gateway model, and broken sessions are replaced in the background.
+    Its sessions share one rate limiter, by default OWNRateLimiter.for_gateway.
+    """
+
+    def __init__(
+        self,
+        gateway: OWNGateway,
+        size: Optional[int] = None,
+        logger: logging.Logger = None,
+        session_class=OWNCommandSession,
+        rate_limiter: Optional[OWNRateLimiter] = None,
+    ):
+        self._gateway = gateway
+        self._logger = logger
+        self._session_class = session_class
+        self._rate_limiter = (
+            rate_limiter
+            if rate_limiter is not None
+            else OWNRateLimiter.for_gateway(gateway)
+        )
+        _limit = SESSION_LIMITS.get(gateway.model_name, DEFAULT_SESSION_LIMIT)
+        if size is None:
+            size = _limit
+        elif size > _limit:
+            self._logger.warning(
+                "%s Gateway accepts %d command sessions, the pool is reduced from %d.",
+                self._gateway.log_id,
+                _limit,
+                size,
+            )
+            size = _limit
+        if size < 1:
+            raise ValueError("The command pool must hold at least one session.")
+        self._size = size
+        self._entries = []
+        self._available = None
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def rate_limiter(self) -> OWNRateLimiter:
+        return self._rate_limiter
+
+    @property
+    def healthy(self) -> int:
+        """Number of sessions currently able to send"""
+        return sum(1 for _entry in self._entries if _entry.healthy)
+
+    @property
+    def pending(self) -> int:
+        """Number of sends waiting for, or being handled by, a session"""
+        return sum(_entry.pending for _entry in self._entries)
+
+    async def connect(self) -> None:
+        """Open the sessions, those that can't be opened are retried in the background"""
+        self._closed = False
+        self._available = asyncio.Event()
+        self._entries = [_PooledSession(self._new_session()) for _ in range(self._size)]
+        _results = await asyncio.gather(
+            *(_entry.session.connect() for _entry in self._entries),
+            return_exceptions=True,
+        )
+        for _entry, _result in zip(self._entries, _results):
+            if isinstance(_result, dict) and _result["Success"]:
+                _entry.healthy = True
+            else:
+                self._replace(_entry)
+        self._update_available()
+
+    async def close(self) -> None:
+        self._closed = True
+        for _entry in self._entries:
+            if _entry.replacement is not None:
+                _entry.replacement.cancel()
+            _entry.healthy = False
+            await _entry.session.close()
+        self._entries = []
+
+    async def send(self, message, is_status_request: bool = False):
+        """Send the message on the least busy session, see OWNCommandSession.send"""
+        while True:
+            if self._closed or not self._entries:
+                self._logger.error(
+                    "%s Could not send message `%s`, the command pool is closed.",
+                    self._gateway.log_id,
+                    message,
+                )
+                return None
+            _entry = self._least_busy()
+            if _entry is not None:
+                break
+            await self._available.wait()
+
+        _entry.pending += 1
+        try:
+            if _entry.lock is None:
+                result = await (await _entry.session.send(message, is_status_request))
+            else:
+                async with _entry.lock:
+                    result = await _entry.session.send(message, is_status_request)
+        finally:
+            _entry.pending -= 1
+        if not _entry.session.is_connected:
+            self._replace(_entry)
+        return result
+
+    def _new_session(self) -> OWNCommandSession:
+        return self._session_class(
+            self._gateway, self._logger, rate_limiter=self._rate_limiter
+        )
+
+    def _least_busy(self) -> Optional[_PooledSession]:
+        _best = None
+        for _entry in self._entries:
+            if _entry.healthy and (_best is None or _entry.pending < _best.pending):
+                _best = _entry
+        return _best
+
+    def _update_available(self) -> None:
+        if any(_entry.healthy for _entry in self._entries):
+            self._available.set()
+        else:
+            self._available.clear()
+
+    def _replace(self, entry: _PooledSession) -> None:
+        if self._closed or entry.replacement is not None:
+            return
+        entry.healthy = False
+        self._update_available()
+        entry.replacement = asyncio.create_task(self._reconnect(entry))
+
+    async def _reconnect(self, entry: _PooledSession) -> None:
+        self._logger.warning(
+            "%s Replacing a broken command session.", self._gateway.log_id
+        )
+        _delay = 1
+        try:
+            try:
+                await entry.session.close()
+            except Exception:  # pylint: disable=broad-except
+                pass
+            while not self._closed:
+                _session = self._new_session()
+                try:
+                    _result = await _session.connect()
+                except Exception:  # pylint: disable=broad-except
+                    _result = None
+                if _result is not None and _result["Success"]:
+                    entry.session = _session
+                    entry.healthy = True
+                    self._update_available()
+                    return
+                await asyncio.sleep(_delay)
+                _delay = min(_delay * 2, 60)
+        finally:
+            entry.replacement = None
@@ -0,0 +1,149 @@
+""" This module contains declarative decoders for the WHOs OWNd has no event class for """
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Callable, Optional
+
+from .message import _EVENT_CLASSES, _EVENT_CLASSES_BY_WHERE, OWNEvent
+
+# Message attributes the fields of a spec can be read from
+_SOURCES = {
+    "what": "_what",
+    "what_param": "_what_param",
+    "where": "_where",
+    "where_param": "_where_param",
+    "dimension": "_dimension",
+    "dimension_param": "_dimension_param",
+    "value": "_dimension_value",
+}
+
+_DECODERS = {}
+
+
+class DecoderSpec:
+    """
+    Declaration of how to decode the frames of a WHO, or of one of its dimensions.
+    fields maps a field name to (source, position, conversion): the source is
+    one of what, what_param, where, where_param, dimension, dimension_param or
+    value (the dimension values), the position is an index in the source, None
+    for the whole source, and the conversion is applied to the text found there.
+    The log template is formatted with the fields, who and where.
+    The spec is compiled into a decoder function the first time it is used.
+    """
+
+    __slots__ = ("_message_type", "_fields", "_log", "_decoder")
+
+    def __init__(
+        self,
+        message_type: Optional[str] = None,
+        fields: Optional[dict] = None,
+        log: Optional[str] = None,
+    ):
+        self._message_type = message_type
+        self._fields = dict(fields or {})
+        self._log = log
+        self._decoder = None
+        for _name, (_source, _position, _conversion) in self._fields.items():
+            if _source not in _SOURCES:
+                raise ValueError(f"Unknown source '{_source}' for field '{_name}'.")
+            if not callable(_conversion):
+                raise ValueError(f"The conversion of field '{_name}' isn't callable.")
+
+    @property
+    def message_type(self) -> Optional[str]:
+        return self._message_type
+
+    @property
+    def fields(self) -> MappingProxyType:
+        return MappingProxyType(self._fields)
+
+    @property
+    def log(self) -> Optional[str]:
+        return self._log
+
+    @property
+    def decoder(self) -> Callable[[OWNEvent], dict]:
+        """Function of a message, returning its fields"""
+        if self._decoder is None:
+            self._decoder = _compile(self._fields)
+        return self._decoder
+
+
+def _compile(fields: dict) -> Callable[[OWNEvent], dict]:
+    _getters = tuple(
+        (_name, _SOURCES[_source], _position, _conversion)
+        for _name, (_source, _position, _conversion) in fields.items()
+    )
+
+    def decode(message: OWNEvent) -> dict:
+        _fields = {}
+        for _name, _attribute, _position, _conversion in _getters:
+            _value = getattr(message, _attribute)
+            if _position is not None:
+                _value = _value[_position]
+            _fields[_name] = _conversion(_value)
+        return _fields
+
+    return decode
+
+
+class OWNDecodedEvent(OWNEvent):
+    """
+    Event of a WHO decoded by registered DecoderSpec, rather than by a class.
+    Frames of a dimension with no spec of its own use the WHO's spec, if any.
+    """
+
+    __slots__ = ("_type", "_spec", "_fields")
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
+
+        self._spec = _DECODERS.get((self._who, self._dimension))
+        if self._spec is None:
+            self._spec = _DECODERS.get((self._who, None))
+        if self._spec is None:
+            self._type = None
+            self._fields = {}
+        else:
+            self._type = self._spec.message_type
+            self._fields = self._spec.decoder(self)
+
+    def _build_human_readable_log(self) -> str:
+        if self._spec is None or self._spec.log is None:
+            return str(self)
+        return self._spec.log.format(who=self._who, where=self._where, **self._fields)
+
+    @property
+    def message_type(self) -> Optional[str]:
+        return self._type
+
+    @property
+    def fields(self) -> dict:
+        return self._fields
+
+    def __getitem__(self, name: str):
+        return self._fields[name]
+
+
+def register_decoder(
+    who: int, spec: DecoderSpec, dimension: Optional[int] = None
+) -> None:
+    """Decode the events of a WHO, or of one of its dimensions, according to spec.
+    WHOs that already have an event class can't be decoded by specs"""
+    _class = _EVENT_CLASSES.get(who, _EVENT_CLASSES_BY_WHERE.get(who))
+    if _class is not None and _class is not OWNDecodedEvent:
+        raise ValueError(f"WHO {who} events are already parsed as {_class!r}.")
+    _DECODERS[(who, dimension)] = spec
+    if _class is None:
+        OWNEvent.register(who, OWNDecodedEvent)
+
+
+def unregister_decoder(who: int, dimension: Optional[int] = None) -> None:
+    """Undo register_decoder, the events of a WHO left without any spec are no
+    longer parsed"""
+    _DECODERS.pop((who, dimension), None)
+    if _EVENT_CLASSES.get(who) is OWNDecodedEvent and not any(
+        _who == who for _who, _ in _DECODERS
+    ):
+        del _EVENT_CLASSES[who]
@@ -0,0 +1,428 @@
+""" This module contains an event hub dispatching an event session to subscribers """
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+from typing import Callable, Iterable, Optional, Union
+
+from .connection import OWNEventSession
+from .message import OWNMessage, OWNSignaling
+
+# Policies of an OWNEventQueue that is full
+QUEUE_BLOCK = "block"
+QUEUE_DROP_OLDEST = "drop_oldest"
+QUEUE_DROP_NEWEST = "drop_newest"
+QUEUE_CONFLATE = "conflate"
+QUEUE_POLICIES = (QUEUE_BLOCK, QUEUE_DROP_OLDEST, QUEUE_DROP_NEWEST, QUEUE_CONFLATE)
+
+DEFAULT_QUEUE_SIZE = 1024
+
+
+def _as_set(value) -> Optional[frozenset]:
+    if value is None:
+        return None
+    if isinstance(value, (str, int)):
+        return frozenset((value,))
+    return frozenset(value)
+
+
+class OWNSubscription:
+    """
+    Subscriber of an OWNEventHub and its filters, all optional: a set of WHOs,
+    a set of WHEREs or unique IDs, a set of message types (the message_type of
+    the event classes, such as MESSAGE_TYPE_ACTIVE_POWER, or frame kinds such as
+    DIMENSION_REQUEST_REPLY), and a predicate of the message.
+    """
+
+    __slots__ = ("_callback", "_who", "_where", "_message_type", "_predicate")
+
+    def __init__(
+        self,
+        callback: Callable[[OWNMessage], None],
+        who: Optional[Iterable[int]] = None,
+        where: Optional[Iterable[str]] = None,
+        message_type: Optional[Iterable[str]] = None,
+        predicate: Optional[Callable[[OWNMessage], bool]] = None,
+    ):
+        self._callback = callback
+        self._who = _as_set(who)
+        self._where = _as_set(where)
+        self._message_type = _as_set(message_type)
+        self._predicate = predicate
+
+    @property
+    def callback(self) -> Callable[[OWNMessage], None]:
+        return self._callback
+
+    @property
+    def who(self) -> Optional[frozenset]:
+        return self._who
+
+    @property
+    def where(self) -> Optional[frozenset]:
+        return self._where
+
+    @property
+    def message_type(self) -> Optional[frozenset]:
+        return self._message_type
+
+    @property
+    def predicate(self) -> Optional[Callable[[OWNMessage], bool]]:
+        return self._predicate
+
+    def _keys(self) -> list:
+        """Keys of the hub index the subscription is filed under"""
+        _whos = self._who if self._who is not None else (None,)
+        _wheres = self._where if self._where is not None else (None,)
+        return [(_who, _where) for _who in _whos for _where in _wheres]
+
+    def _accepts(self, message) -> bool:
+        if not isinstance(message, OWNMessage) or isinstance(message, OWNSignaling):
+            return self._message_type is None and self._predicate is None
+        if self._message_type is not None and not (
+            getattr(message, "message_type", None) in self._message_type
+            or message._message_type  # pylint: disable=protected-access
+            in self._message_type
+        ):
+            return False
+        return self._predicate is None or self._predicate(message)
+
+
+class OWNEventQueue:
+    """
+    Bounded queue of messages between an OWNEventHub and a consumer, read with
+    `await queue.get()` or `async for message in queue`.
+    When the queue is full, its policy decides:
+    QUEUE_BLOCK: the hub stops reading the event session until there is room,
+    QUEUE_DROP_OLDEST: the oldest message is dropped to make room,
+    QUEUE_DROP_NEWEST: the new message is dropped,
+    QUEUE_CONFLATE: a message replaces the queued message with the same unique
+    ID, keeping its place, so that only the latest state of each device is
+    queued; a message for another device drops the oldest one.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_QUEUE_SIZE, policy: str = QUEUE_BLOCK):
+        if max_size < 1:
+            raise ValueError("The queue must hold at least one message.")
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(
+                f"Unknown queue policy '{policy}', expected one of {QUEUE_POLICIES}."
+            )
+        self._max_size = max_size
+        self._policy = policy
+        # Conflated messages are keyed by unique ID, the others by a counter
+        self._messages = collections.OrderedDict()
+        self._count = 0
+        self._readable = None
+        self._writable = None
+        self._closed = False
+        self._put = 0
+        self._got = 0
+        self._dropped = 0
+        self._conflated = 0
+        self._high_water = 0
+
+    @property
+    def policy(self) -> str:
+        return self._policy
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        return len(self._messages)
+
+    @property
+    def full(self) -> bool:
+        return len(self._messages) >= self._max_size
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def dropped(self) -> int:
+        """Number of messages dropped because the queue was full"""
+        return self._dropped
+
+    @property
+    def conflated(self) -> int:
+        """Number of messages replaced by a later state of the same device"""
+        return self._conflated
+
+    @property
+    def high_water(self) -> int:
+        """Largest number of messages queued at once"""
+        return self._high_water
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            "policy": self._policy,
+            "size": len(self._messages),
+            "max_size": self._max_size,
+            "high_water": self._high_water,
+            "put": self._put,
+            "got": self._got,
+            "dropped": self._dropped,
+            "conflated": self._conflated,
+        }
+
+    def __call__(self, message: Union[OWNMessage, str]) -> None:
+        self.put_nowait(message)
+
+    def put_nowait(self, message: Union[OWNMessage, str]) -> None:
+        """Queue the message, applying the policy if the queue is full.
+        A full blocking queue takes the message anyway, the hub waits for room
+        before dispatching the next one"""
+        if self._closed:
+            return
+        self._put += 1
+        if self._policy == QUEUE_CONFLATE and isinstance(message, OWNMessage):
+            _key = getattr(message, "unique_id", None)
+            if _key is not None and _key in self._messages:
+                self._messages[_key] = message
+                self._conflated += 1
+                return
+        else:
+            _key = None
+        if _key is None:
+            self._count += 1
+            _key = self._count
+        if len(self._messages) >= self._max_size:
+            if self._policy == QUEUE_DROP_NEWEST:
+                self._dropped += 1
+                return
+            if self._policy != QUEUE_BLOCK:
+                self._messages.popitem(last=False)
+                self._dropped += 1
+        self._messages[_key] = message
+        self._high_water = max(self._high_water, len(self._messages))
+        if self._readable is not None:
+            self._readable.set()
+
+    async def get(self) -> Union[OWNMessage, str]:
+        """Next message, waiting for one if the queue is empty.
+        Raises QueueEmpty once the queue is closed and empty"""
+        while not self._messages:
+            if self._closed:
+                raise asyncio.QueueEmpty()
+            if self._readable is None:
+                self._readable = asyncio.Event()
+            self._readable.clear()
+            await self._readable.wait()
+        _, message = self._messages.popitem(last=False)
+        self._got += 1
+        if self._writable is not None and len(self._messages) < self._max_size:
+            self._writable.set()
+        return message
+
+    async def wait_for_room(self) -> None:
+        """Wait until the queue isn't full, or is closed"""
+        while len(self._messages) >= self._max_size and not self._closed:
+            if self._writable is None:
+                self._writable = asyncio.Event()
+            self._writable.clear()
+            await self._writable.wait()
+
+    def close(self) -> None:
+        """Stop taking messages, those queued can still be read"""
+        self._closed = True
+        for _event in (self._readable, self._writable):
+            if _event is not None:
+                _event.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Union[OWNMessage, str]:
+        try:
+            return await self.get()
+        except asyncio.QueueEmpty:
+            raise StopAsyncIteration from None
+
+
+class OWNEventHub:
+    """
+    Fan-out of the messages of an event session to several subscribers.
+    Subscriptions are indexed by (WHO, WHERE), so that each message is only
+    checked against the subscribers interested in its WHO and WHERE, and those
+    with no WHO or WHERE filter, rather than against every subscriber.
+    Messages without a WHO, such as signaling or frames that couldn't be parsed,
+    are only dispatched to subscribers without any WHO or WHERE filter.
+    Subscribers given an OWNEventQueue, see subscribe_queue, are decoupled from
+    the reading of the session: a slow consumer only fills its own queue.
+    """
+
+    def __init__(
+        self,
+        session: Optional[OWNEventSession] = None,
+        logger: logging.Logger = None,
+    ):
+        self._session = session
+        self._logger = logger
+        self._index = {}
+        self._subscriptions = set()
+        self._blocking = ()
+        self._dispatched = 0
+        self._delivered = 0
+
+    @property
+    def subscriptions(self) -> int:
+        return len(self._subscriptions)
+
+    @property
+    def dispatched(self) -> int:
+        """Number of messages dispatched"""
+        return self._dispatched
+
+    @property
+    def delivered(self) -> int:
+        """Number of messages delivered, counting each subscriber"""
+        return self._delivered
+
+    def subscribe(
+        self,
+        callback: Callable[[OWNMessage], None],
+        who: Optional[Iterable[int]] = None,
+        where: Optional[Iterable[str]] = None,
+        message_type: Optional[Iterable[str]] = None,
+        predicate: Optional[Callable[[OWNMessage], bool]] = None,
+    ) -> OWNSubscription:
+        """Call callback with the messages matching all the given filters,
+        see OWNSubscription. Returns the subscription, to unsubscribe"""
+        subscription = OWNSubscription(callback, who, where, message_type, predicate)
+        self.add(subscription)
+        return subscription
+
+    def subscribe_queue(
+        self,
+        max_size: int = DEFAULT_QUEUE_SIZE,
+        policy: str = QUEUE_BLOCK,
+        who: Optional[Iterable[int]] = None,
+        where: Optional[Iterable[str]] = None,
+        message_type: Optional[Iterable[str]] = None,
+        predicate: Optional[Callable[[OWNMessage], bool]] = None,
+    ) -> OWNEventQueue:
+        """Queue the messages matching all the given filters in a new
+        OWNEventQueue. Unsubscribe with unsubscribe_queue"""
+        queue = OWNEventQueue(max_size, policy)
+        self.subscribe(queue, who, where, message_type, predicate)
+        return queue
+
+    def unsubscribe_queue(self, queue: OWNEventQueue) -> None:
+        """Unsubscribe and close the queue, the messages queued can still be read"""
+        for _subscription in [
+            _subscription
+            for _subscription in self._subscriptions
+            if _subscription.callback is queue
+        ]:
+            self.unsubscribe(_subscription)
+        queue.close()
+
+    @property
+    def queues(self) -> list:
+        """The OWNEventQueue subscribed"""
+        return [
+            _subscription.callback
+            for _subscription in self._subscriptions
+            if isinstance(_subscription.callback, OWNEventQueue)
+        ]
+
+    def add(self, subscription: OWNSubscription) -> None:
+        if subscription in self._subscriptions:
+            return
+        self._subscriptions.add(subscription)
+        if (
+            isinstance(subscription.callback, OWNEventQueue)
+            and subscription.callback.policy == QUEUE_BLOCK
+        ):
+            self._blocking += (subscription.callback,)
+        for _key in subscription._keys():  # pylint: disable=protected-access
+            # Replaced rather than appended to, in case a dispatch is iterating it
+            self._index[_key] = self._index.get(_key, ()) + (subscription,)
+
+    def unsubscribe(self, subscription: OWNSubscription) -> None:
+        if subscription not in self._subscriptions:
+            return
+        self._subscriptions.discard(subscription)
+        if subscription.callback in self._blocking and not any(
+            _other.callback is subscription.callback for _other in self._subscriptions
+        ):
+            self._blocking = tuple(
+                _queue
+                for _queue in self._blocking
+                if _queue is not subscription.callback
+            )
+        for _key in subscription._keys():  # pylint: disable=protected-access
+            _subscribers = tuple(
+                _other for _other in self._index[_key] if _other is not subscription
+            )
+            if _subscribers:
+                self._index[_key] = _subscribers
+            else:
+                del self._index[_key]
+
+    def _candidates(self, message) -> tuple:
+        """Subscriptions filed under the keys the message matches, without duplicates"""
+        if not isinstance(message, OWNMessage) or isinstance(message, OWNSignaling):
+            return self._index.get((None, None), ())
+        # pylint: disable=protected-access
+        _who = message._who
+        _where = message._where
+        _unique_id = message.unique_id
+        _keys = [(_who, _where), (_who, None), (None, _where), (None, None)]
+        if _unique_id != _where:
+            _keys += [(_who, _unique_id), (None, _unique_id)]
+        _found = [self._index[_key] for _key in _keys if _key in self._index]
+        if len(_found) == 1:
+            return _found[0]
+        return tuple(
+            dict.fromkeys(
+                _subscription
+                for _subscribers in _found
+                for _subscription in _subscribers
+            )
+        )
+
+    def dispatch(self, message) -> int:
+        """Deliver the message to its subscribers, returns how many got it"""
+        # pylint: disable=protected-access
+        self._dispatched += 1
+        _delivered = 0
+        for _subscription in self._candidates(message):
+            try:
+                if not _subscription._accepts(message):
+                    continue
+                _subscription.callback(message)
+            except Exception:  # pylint: disable=broad-except
+                if self._logger is not None:
+                    self._logger.exception(
+                        "Event hub subscriber %r failed on `%s`.",
+                        _subscription.callback,
+                        message,
+                    )
+                continue
+            _delivered += 1
+        self._delivered += _delivered
+        return _delivered
+
+    async def publish(self, message) -> int:
+        """Wait for room in the full blocking queues, then dispatch the message"""
+        for _queue in self._blocking:
+            if _queue.full:
+                await _queue.wait_for_room()
+        return self.dispatch(message)
+
+    async def run(self, on_error: Optional[Callable[[Exception], None]] = None):
+        """Publish the messages of the session until it is closed,
+        see OWNEventSession.events"""
+        async for message in self._session.events(on_error=on_error):
+            if self._blocking:
+                await self.publish(message)
+            else:
+                self.dispatch(message)
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 import datetime
+import importlib
 import re
+from types import MappingProxyType
 from typing import Optional
 
 from dateutil.relativedelta import relativedelta
 import pytz
 
+from .address import WhereAddress
+from .clock import DateResolver
+
 MESSAGE_TYPE_ACTIVE_POWER = "active_power"
 MESSAGE_TYPE_ENERGY_TOTALIZER = "energy_totalizer"
 MESSAGE_TYPE_HOURLY_CONSUMPTION = "hourly_consumption"
@@ -37,8 +43,258 @@ CLIMATE_MODE_AUTO = "auto"
 
 PIR_SENSITIVITY_MAPPING = ["low", "medium", "high", "very high"]
 
+_CENTRAL_LOCAL_ZONE = re.compile(r"^#0#\d+$")
+
+# event_content labels of the message families and types, e.g. 'Dimension request reply'
+_LABELS = {
+    _name: _name.replace("_", " ").capitalize()
+    for _name in (
+        "EVENT",
+        "COMMAND",
+        "REQUEST",
+        "COMMAND_TRANSLATION",
+        "STATUS",
+        "STATUS_REQUEST",
+        "DIMENSION_REQUEST",
+        "DIMENSION_REQUEST_REPLY",
+        "DIMENSION_WRITING",
+    )
+}
+_VALVE_STATES = ["off", "on", "opened", "closed", "stopped"]
+_VALVE_ACTIVE_STATES = frozenset(("1", "2", "6", "7", "8"))
+_ACTUATOR_ACTIVE_STATES = frozenset(("1", "2", "6", "7", "8", "9"))
+
+# Climate mode of the heating WHATs setting a mode: off, manual, programs and scenarios
+_HEATING_MODES = {
+    _what: _mode_name
+    for _mode_name, _whats in (
+        (CLIMATE_MODE_OFF, (103, 203, 303, 102, 202, 302)),
+        (
+            CLIMATE_MODE_COOL,
+            (0, 210, 211, 215, *range(2101, 2104), *range(2201, 2217)),
+        ),
+        (
+            CLIMATE_MODE_HEAT,
+            (1, 110, 111, 115, *range(1101, 1104), *range(1201, 1217)),
+        ),
+        (
+            CLIMATE_MODE_AUTO,
+            (310, 311, 315, *range(23001, 23256), *range(13001, 13256)),
+        ),
+    )
+    for _what in _whats
+}
+
+
+# Decoded `0TTT` temperatures, there are at most 10000 of them
+_TEMPERATURES = {}
+
+
+def _decode_temperature(value: str) -> float:
+    """Temperature of a `0TTT` field, in tenths of a degree"""
+    try:
+        return _TEMPERATURES[value]
+    except KeyError:
+        pass
+    _tenths = int(value[-1])
+    _units = value[1:3]
+    _temperature = (int(_units) * 10 + _tenths) / 10 if _units else _tenths / 10
+    if len(value) == 4:
+        _TEMPERATURES[value] = _temperature
+    return _temperature
+
+
+def _split_field(field: str) -> Optional[list]:
+    """Split a `VALUE#P1#Pn` field, returns None if any part is not numeric"""
+    parts = field.split("#")
+    for part in parts:
+        if not part.isdecimal():
+            return None
+    return parts
+
+
+def _split_where(field: str) -> Optional[list]:
+    """Split a `[#]WHERE#P1#Pn` field, keeping the leading '#' on WHERE"""
+    if field[:1] == "#":
+        parts = _split_field(field[1:])
+        if parts is not None:
+            parts[0] = f"#{parts[0]}"
+        return parts
+    return _split_field(field)
+
+
+def _tokenize(data: str) -> Optional[tuple]:
+    """Single pass tokenizer for OpenWebNet frames.
+    The frame is split once on '*' and '#' and classified from its shape.
+    Returns (family, message_type, who, what, what_param, where, where_param,
+    dimension, dimension_param, dimension_value) or None if not a valid frame"""
+    if data[:1] != "*" or data[-2:] != "##":
+        return None
+    return _tokenize_body(data[1:-2])
+
+
+def _tokenize_bytes(data: bytes) -> Optional[tuple]:
+    """Same as _tokenize, straight from a frame read off the wire.
+    Only the body between the leading '*' and the trailing '##' is decoded"""
+    if data[:1] != b"*" or data[-2:] != b"##":
+        return None
+    try:
+        return _tokenize_body(str(data[1:-2], "ascii"))
+    except UnicodeDecodeError:
+        return None
+
+
+def _tokenize_body(body: str) -> Optional[tuple]:
+    fields = body.split("*")
+    head = fields[0]
+    count = len(fields)
+
+    if head[:1] != "#":  #  *WHO*WHAT*WHERE##
+        if not head.isdecimal():
+            return None
+        if count == 3:
+            where = _split_where(fields[2])
+        elif count == 4 and fields[2] == "":  #  *WHO*WHAT**##
+            where = fields[3].split("#")
+            if where[0] != "":
+                return None
+            for part in where[1:]:
+                if not part.isdecimal():
+                    return None
+            where[0] = "*"
+        else:
+            return None
+        what = _split_field(fields[1])
+        if what is None or where is None:
+            return None
+        _what = int(what[0])
+        return (
+            "COMMAND_TRANSLATION" if _what == 1000 else "EVENT",
+            "STATUS",
+            int(head),
+            _what,
+            what[1:],
+            where[0],
+            where[1:],
+            None,
+            None,
+            None,
+        )
+
+    who = head[1:]
+    if not who.isdecimal() or count < 2:
+        return None
+
+    if count == 2:  #  *#WHO*WHERE##
+        where = _split_where(fields[1])
+        if where is None:
+            return None
+        return (
+            "REQUEST",
+            "STATUS_REQUEST",
+            int(who),
+            None,
+            None,
+            where[0],
+            where[1:],
+            None,
+            None,
+            None,
+        )
+
+    if fields[1]:
+        where = _split_where(fields[1])
+        if where is None:
+            return None
+    else:
+        where = [None]
+    dimension = fields[2]
+
+    if count == 3:  #  *#WHO*WHERE*DIMENSION##
+        if not dimension.isdecimal():
+            return None
+        return (
+            "REQUEST",
+            "DIMENSION_REQUEST",
+            int(who),
+            None,
+            None,
+            where[0],
+            where[1:],
+            int(dimension),
+            None,
+            None,
+        )
+
+    values = fields[3:]
+    for value in values:
+        if value and not value.isdecimal():
+            return None
+    if dimension[:1] == "#":  #  *#WHO*WHERE*#DIMENSION*VAL1*VALn##
+        family = "COMMAND"
+        message_type = "DIMENSION_WRITING"
+        dimension = _split_field(dimension[1:])
+    else:  #  *#WHO*WHERE*DIMENSION*VAL1*VALn##
+        family = "EVENT"
+        message_type = "DIMENSION_REQUEST_REPLY"
+        dimension = _split_field(dimension)
+    if dimension is None:
+        return None
+    return (
+        family,
+        message_type,
+        int(who),
+        None,
+        None,
+        where[0],
+        where[1:],
+        int(dimension[0]),
+        dimension[1:],
+        values,
+    )
+
+
+_WHO = re.compile(r"^\*#?(?P<who>\d+)\*.+##$")
+
+
+def _parse_who(data: str, tokens: Optional[tuple]) -> Optional[int]:
+    """WHO of the frame, from its tokens when they are already known"""
+    if tokens is not None:
+        return tokens[2]
+    _match = _WHO.match(data)
+    return int(_match.group("who")) if _match else None
+
+
+def _parse_last_field(data) -> Optional[str]:
+    """First digit of the last field, telling apart WHO 25 CEN+ (2) and dry contacts (3)"""
+    if isinstance(data, bytes):
+        _field = data[data.rfind(b"*") + 1 : -2]
+        return chr(_field[0]) if _field.isdigit() else None
+    _field = data[data.rfind("*") + 1 : -2]
+    return _field[0] if _field.isdecimal() else None
+
+
+class EventContent(dict):
+    """
+    The read-only dict returned by OWNMessage.event_content.
+    Its nested values are tuples; it serializes to JSON as a plain dict would.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("event_content is read-only, use to_dict() for a copy")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return EventContent, (dict(self),)
+
 
 class OWNMessage:
+    """Base class for all OWN messages"""
+
     _ACK = re.compile(r"^\*#\*1##$")  #  *#*1##
     _NACK = re.compile(r"^\*#\*0##$")  #  *#*0##
     _COMMAND_SESSION = re.compile(r"^\*99\*0##$")  #  *99*0##
@@ -46,135 +302,132 @@ class OWNMessage:
     _NONCE = re.compile(r"^\*#(\d+)##$")  #  *#123456789##
     _SHA = re.compile(r"^\*98\*(\d)##$")  #  *98*SHA##
 
-    _STATUS = re.compile(
-        r"^\*(?P<who>\d+)\*(?P<what>\d+)(?P<what_param>(?:#\d+)*)\*(?P<where>\*|#?\d+)(?P<where_param>(?:#\d+)*)##$"  # pylint: disable=line-too-long
-    )  #  *WHO*WHAT*WHERE##
-    _STATUS_REQUEST = re.compile(
-        r"^\*#(?P<who>\d+)\*(?P<where>#?\d+)(?P<where_param>(?:#\d+)*)##$"
-    )  #  *#WHO*WHERE
-    _DIMENSION_WRITING = re.compile(
-        r"^\*#(?P<who>\d+)\*(?P<where>#?\d+)?(?P<where_param>(?:#\d+)*)?\*#(?P<dimension>\d+)(?P<dimension_param>(?:#\d+)*)?(?P<dimension_value>(?:\*\d*)+)##$"  # pylint: disable=line-too-long
-    )  #  *#WHO*WHERE*#DIMENSION*VAL1*VALn##
-    _DIMENSION_REQUEST = re.compile(
-        r"^\*#(?P<who>\d+)\*(?P<where>#?\d+)?(?P<where_param>(?:#\d+)*)?\*(?P<dimension>\d+)##$"
-    )  #  *#WHO*WHERE*DIMENSION##
-    _DIMENSION_REQUEST_REPLY = re.compile(
-        r"^\*#(?P<who>\d+)\*(?P<where>#?\d+)?(?P<where_param>(?:#\d+)*)?\*(?P<dimension>\d+)(?P<dimension_param>(?:#\d+)*)?(?P<dimension_value>(?:\*\d*)+)##$"  # pylint: disable=line-too-long
-    )  #  *#WHO*WHERE*DIMENSION*VAL1*VALn##
-
-    """ Base class for all OWN messages """
-
-    def __init__(self, data):
+    _cache = None
+
+    __slots__ = (
+        "_raw",
+        "_human_readable_log",
+        "_family",
+        "_who",
+        "_where",
+        "_is_valid_message",
+        "_message_type",
+        "_what",
+        "_what_param",
+        "_where_param",
+        "_dimension",
+        "_dimension_param",
+        "_dimension_value",
+        "_address",
+        "_event_content",
+    )
+
+    # Fields of to_tuple(), in order
+    TUPLE_FIELDS = (
+        "message",
+        "family",
+        "type",
+        "who",
+        "what",
+        "what_param",
+        "where",
+        "where_param",
+        "interface",
+        "dimension",
+        "dimension_param",
+        "dimension_value",
+    )
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        """data is the frame as a str, or as bytes when its tokens are provided.
+        tokens, if provided, are the fields already extracted by _tokenize(data)"""
         self._raw = data
-        self._human_readable_log = self._raw
+        self._human_readable_log = None
+        self._event_content = None
         self._family = ""
         self._who = ""
         self._where = ""
         self._is_valid_message = False
 
-        if self._STATUS.match(self._raw):
-            self._is_valid_message = True
-            self._match = self._STATUS.match(self._raw)
-            self._family = "EVENT"
-            self._message_type = "STATUS"
-            self._who = int(self._match.group("who"))
-            self._what = int(self._match.group("what"))
-            if self._what == 1000:
-                self._family = "COMMAND_TRANSLATION"
-            self._what_param = self._match.group("what_param").split("#")
-            del self._what_param[0]
-            self._where = self._match.group("where")
-            self._where_param = self._match.group("where_param").split("#")
-            del self._where_param[0]
-            self._dimension = None
-            self._dimension_param = None
-            self._dimension_value = None
-
-        elif self._STATUS_REQUEST.match(self._raw):
-            self._is_valid_message = True
-            self._match = self._STATUS_REQUEST.match(self._raw)
-            self._family = "REQUEST"
-            self._message_type = "STATUS_REQUEST"
-            self._who = int(self._match.group("who"))
-            self._what = None
-            self._what_param = None
-            self._where = self._match.group("where")
-            self._where_param = self._match.group("where_param").split("#")
-            del self._where_param[0]
-            self._dimension = None
-            self._dimension_param = None
-            self._dimension_value = None
-
-        elif self._DIMENSION_REQUEST.match(self._raw):
-            self._is_valid_message = True
-            self._match = self._DIMENSION_REQUEST.match(self._raw)
-            self._family = "REQUEST"
-            self._message_type = "DIMENSION_REQUEST"
-            self._who = int(self._match.group("who"))
-            self._what = None
-            self._what_param = None
-            self._where = self._match.group("where")
-            self._where_param = self._match.group("where_param").split("#")
-            del self._where_param[0]
-            self._dimension = int(self._match.group("dimension"))
-            self._dimension_param = None
-            self._dimension_value = None
-
-        elif self._DIMENSION_REQUEST_REPLY.match(self._raw):
+        if tokens is None:
+            tokens = _tokenize(data)
+        if tokens is not None:
             self._is_valid_message = True
-            self._match = self._DIMENSION_REQUEST_REPLY.match(self._raw)
-            self._family = "EVENT"
-            self._message_type = "DIMENSION_REQUEST_REPLY"
-            self._who = int(self._match.group("who"))
-            self._what = None
-            self._what_param = None
-            self._where = self._match.group("where")
-            self._where_param = self._match.group("where_param").split("#")
-            del self._where_param[0]
-            self._dimension = int(self._match.group("dimension"))
-            self._dimension_param = self._match.group("dimension_param").split("#")
-            del self._dimension_param[0]
-            self._dimension_value = self._match.group("dimension_value").split("*")
-            del self._dimension_value[0]
-
-        elif self._DIMENSION_WRITING.match(self._raw):
-            self._is_valid_message = True
-            self._match = self._DIMENSION_WRITING.match(self._raw)
-            self._family = "COMMAND"
-            self._message_type = "DIMENSION_WRITING"
-            self._who = int(self._match.group("who"))
-            self._what = None
-            self._what_param = None
-            self._where = self._match.group("where")
-            self._where_param = self._match.group("where_param").split("#")
-            del self._where_param[0]
-            self._dimension = int(self._match.group("dimension"))
-            self._dimension_param = self._match.group("dimension_param").split("#")
-            del self._dimension_param[0]
-            self._dimension_value = self._match.group("dimension_value").split("*")
-            del self._dimension_value[0]
+            (
+                self._family,
+                self._message_type,
+                self._who,
+                self._what,
+                self._what_param,
+                self._where,
+                self._where_param,
+                self._dimension,
+                self._dimension_param,
+                self._dimension_value,
+            ) = tokens
+            self._address = WhereAddress(self._who, self._where, self._where_param)
+        else:
+            self._address = WhereAddress(self._who, self._where)
 
     @classmethod
     def parse(cls, data) -> Optional[OWNMessage]:
-        if (
-            cls._ACK.match(data)
-            or cls._NACK.match(data)
-            or cls._COMMAND_SESSION.match(data)
-            or cls._EVENT_SESSION.match(data)
-            or cls._NONCE.match(data)
-            or cls._SHA.match(data)
-        ):
-            return OWNSignaling(data)
-        elif cls._STATUS.match(data) or cls._DIMENSION_REQUEST_REPLY.match(data):
-            return OWNEvent.parse(data)
-        elif (
-            cls._STATUS_REQUEST.match(data)
-            or cls._DIMENSION_REQUEST.match(data)
-            or cls._DIMENSION_WRITING.match(data)
-        ):
-            return OWNCommand.parse(data)
-        else:
+        if OWNMessage._cache is not None:
+            return OWNMessage._cache.parse(data)
+        return OWNMessage._parse(data)
+
+    @classmethod
+    def parse_bytes(cls, data) -> Optional[OWNMessage]:
+        """Same as parse, for a frame as read off the wire (bytes or memoryview).
+        The frame is decoded once, without copying a memoryview first"""
+        if OWNMessage._cache is not None:
+            return OWNMessage._cache.parse_bytes(data)
+        return OWNMessage._parse_bytes(data)
+
+    @classmethod
+    def parse_many(cls, data) -> list:
+        """Parse all the complete frames of a buffer (bytes or memoryview).
+        Invalid frames and a trailing partial frame are left out"""
+        return FrameSplitter().parse(data)
+
+    @classmethod
+    def _parse_bytes(cls, data) -> Optional[OWNMessage]:
+        try:
+            return OWNMessage._parse(str(data, "ascii"))
+        except UnicodeDecodeError:
+            return OWNMessage._parse(str(data, "utf-8", "replace"))
+
+    @classmethod
+    def _parse(cls, data) -> Optional[OWNMessage]:
+        _tokens = _tokenize(data)
+        if _tokens is None:
+            if (
+                cls._ACK.match(data)
+                or cls._NACK.match(data)
+                or cls._COMMAND_SESSION.match(data)
+                or cls._EVENT_SESSION.match(data)
+                or cls._NONCE.match(data)
+                or cls._SHA.match(data)
+            ):
+                return OWNSignaling(data)
             return None
+        elif _tokens[1] == "STATUS" or _tokens[1] == "DIMENSION_REQUEST_REPLY":
+            return OWNEvent.parse(data, _tokens)
+        else:
+            return OWNCommand.parse(data, _tokens)
+
+    @classmethod
+    def enable_cache(cls, max_size: int = 1024) -> OWNMessageCache:
+        """Opt-in: from now on parse() returns shared, read-only messages for repeated frames"""
+        OWNMessage._cache = OWNMessageCache(max_size)
+        return OWNMessage._cache
+
+    @classmethod
+    def disable_cache(cls) -> None:
+        OWNMessage._cache = None
+
+    def _is_cacheable(self) -> bool:
+        """Whether this message can be shared, i.e. parsing it does not depend on the clock"""
+        return True
 
     @property
     def is_event(self) -> bool:
@@ -206,16 +459,15 @@ class OWNMessage:
         """The 'where' ID of the subject of this message"""
         return self._where  # [1:] if self._where.startswith('#') else self._where
 
+    @property
+    def address(self) -> WhereAddress:
+        """The 'where' ID of the subject of this message, with its parameters"""
+        return self._address
+
     @property
     def interface(self) -> str:
         """The 'where' parameter corresponding to the bus interface of the subject of this message"""
-        return (
-            self._where_param[1]
-            if self._who in [1, 2, 15]
-            and len(self._where_param) > 0
-            and self._where_param[0] == "4"
-            else None
-        )
+        return self._address.interface
 
     @property
     def dimension(self) -> str:
@@ -230,108 +482,114 @@ class OWNMessage:
     @property
     def unique_id(self) -> str:
         """The ID of the subject of this message"""
-        return (
-            f"{self.who}-{self.where}#4#{self.interface}"
-            if self.interface is not None
-            else f"{self.who}-{self.where}"
-        )
+        return self._address.unique_id
 
     @property
-    def event_content(self) -> dict:
+    def event_content(self) -> EventContent:
+        """The content of the message as a read-only dict, built on first access"""
+        if self._event_content is None:
+            self._event_content = EventContent(
+                (key, tuple(value) if isinstance(value, list) else value)
+                for key, value in self._build_event_content().items()
+            )
+        return self._event_content
+
+    def _build_event_content(self) -> dict:
+        _type = _LABELS[self._message_type]
+        _interface = self._address.interface
         _event = {
-            "message": self._raw,
-            "family": self._family.replace("_", " ").capitalize(),
-            "type": self._message_type.replace("_", " ").capitalize(),
+            "message": str(self),
+            "family": _LABELS[self._family],
+            "type": _type,
             "who": self._who,
         }
         if self._where:
-            _event.update({"where": self._where})
-        if self.interface:
-            _event.update({"interface": self.interface})
+            _event["where"] = self._where
+        if _interface:
+            _event["interface"] = _interface
             if self._where_param and len(self._where_param) > 2:
-                _event.update({"where parameters": self._where_param[2:]})
+                _event["where parameters"] = self._where_param[2:]
         elif self._where_param:
-            _event.update({"where parameters": self._where_param})
+            _event["where parameters"] = self._where_param
         if self._what:
-            _event.update({"what": self._what})
+            _event["what"] = self._what
         if self._what_param:
-            _event.update({"what parameters": self._what_param})
+            _event["what parameters"] = self._what_param
         if self._dimension:
-            _event.update({"dimension": self._dimension})
+            _event["dimension"] = self._dimension
         if self._dimension_param:
-            _event.update({"dimension parameters": self._dimension_param})
+            _event["dimension parameters"] = self._dimension_param
         if self._dimension_value:
-            _event.update({"dimension values": self._dimension_value})
+            _event["dimension values"] = self._dimension_value
 
         return _event
 
+    def to_dict(self) -> dict:
+        """A new dict with the same content as event_content, nested values as lists"""
+        return {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in self.event_content.items()
+        }
+
+    def to_tuple(self) -> tuple:
+        """All the fields of the message, in the order of TUPLE_FIELDS"""
+        return (
+            str(self),
+            _LABELS[self._family],
+            _LABELS[self._message_type],
+            self._who,
+            self._what,
+            self._what_param,
+            self._where,
+            self._where_param,
+            self._address.interface,
+            self._dimension,
+            self._dimension_param,
+            self._dimension_value,
+        )
+
     @property
     def human_readable_log(self) -> str:
-        """A human readable log of the event"""
+        """A human readable log of the event, built on first access"""
+        if self._human_readable_log is None:
+            self._human_readable_log = self._build_human_readable_log()
         return self._human_readable_log
 
+    def _build_human_readable_log(self) -> str:
+        return str(self)
+
     @property
     def _interface_log_text(self) -> str:
         return f" on interface {self.interface}" if self.interface is not None else ""
 
     @property
     def is_general(self) -> bool:
-        if self.who == 1 or self.who == 2:
-            if self._where == "0":
-                return True
-        else:
-            return False
+        return self._address.is_general
 
     @property
     def is_group(self) -> bool:
-        if self.who == 1 or self.who == 2:
-            if self._where.startswith("#"):
-                return True
-            else:
-                return False
-        else:
-            return False
+        return self._address.is_group
 
     @property
     def is_area(self) -> bool:
-        if self.who == 1 or self.who == 2:
-            try:
-                if (
-                    self._where == "00"
-                    or self._where == "100"
-                    or (
-                        len(self._where) == 1
-                        and int(self._where) > 0
-                        and int(self._where) < 10
-                    )
-                ):
-                    return True
-                else:
-                    return False
-            except ValueError:
-                return False
-        else:
-            return False
+        return self._address.is_area
 
     @property
     def group(self) -> int:
-        if self.is_group:
-            return int(self._where[1:])
-        else:
-            return None
+        return self._address.group
 
     @property
     def area(self) -> int:
-        if self.is_area:
-            return 10 if self._where == "100" else int(self._where)
-        else:
-            return None
+        return self._address.area
 
     def __repr__(self) -> str:
-        return self._raw
+        return str(self)
 
     def __str__(self) -> str:
-        return self._raw
+        return self._raw if isinstance(self._raw, str) else self._raw.decode()
+
+    def __bytes__(self) -> bytes:
+        return self._raw if isinstance(self._raw, bytes) else self._raw.encode()
 
 
 class OWNEvent(OWNMessage):
@@ -341,52 +599,46 @@ class OWNEvent(OWNMessage):
     Dividing this in a subclass provides better clarity
     """
 
+    __slots__ = ()
+
     @classmethod
-    def parse(cls, data) -> Optional[OWNEvent]:
-        _match = re.match(r"^\*#?(?P<who>\d+)\*.+##$", data)
-
-        if _match:
-            _who = int(_match.group("who"))
-
-            if _who == 0:
-                return OWNScenarioEvent(data)
-            elif _who == 1:
-                return OWNLightingEvent(data)
-            elif _who == 2:
-                return OWNAutomationEvent(data)
-            elif _who == 4:
-                return OWNHeatingEvent(data)
-            elif _who == 5:
-                return OWNAlarmEvent(data)
-            elif _who == 9:
-                return OWNAuxEvent(data)
-            elif _who == 13:
-                return OWNGatewayEvent(data)
-            elif _who == 15:
-                return OWNCENEvent(data)
-            elif _who == 17:
-                return OWNSceneEvent(data)
-            elif _who == 18:
-                return OWNEnergyEvent(data)
-            elif _who == 25:
-                _where = re.match(r"^\*.+\*(?P<where>\d+)##$", data).group("where")
-                if _where.startswith("2"):
-                    return OWNCENPlusEvent(data)
-                elif _where.startswith("3"):
-                    return OWNDryContactEvent(data)
-            elif _who > 1000:
-                return cls(data)
+    def parse(cls, data, tokens: Optional[tuple] = None) -> Optional[OWNEvent]:
+        _who = _parse_who(data, tokens)
+
+        if _who is not None:
+            _class = _EVENT_CLASSES.get(_who)
+            if _class is None:
+                if _who in _EVENT_CLASSES_BY_WHERE:
+                    _class = _EVENT_CLASSES_BY_WHERE[_who].get(_parse_last_field(data))
+                elif _who > 1000:
+                    _class = cls
+            if _class is not None:
+                return _class(data, tokens)
 
         return None
 
+    @classmethod
+    def register(cls, who: int, event_class, where: Optional[str] = None) -> None:
+        """Parse the events of a WHO as event_class, or only those whose WHERE starts
+        with the `where` digit, the way WHO 25 CEN+ and dry contacts are told apart.
+        event_class can be a 'module:Class' path, it is then only imported when
+        the first of those events is parsed"""
+        _register_class(
+            _EVENT_CLASSES, _EVENT_CLASSES_BY_WHERE, who, event_class, where
+        )
+
 
 class OWNScenarioEvent(OWNEvent):
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = ("_scenario", "_control_panel")
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
 
         self._scenario = self._what
         self._control_panel = self._where
-        self._human_readable_log = f"Scenario {self._scenario} from control panel {self._control_panel} has been launched."  # pylint: disable=line-too-long
+
+    def _build_human_readable_log(self) -> str:
+        return f"Scenario {self._scenario} from control panel {self._control_panel} has been launched."  # pylint: disable=line-too-long
 
     @property
     def scenario(self):
@@ -398,8 +650,22 @@ class OWNScenarioEvent(OWNEvent):
 
 
 class OWNLightingEvent(OWNEvent):
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = (
+        "_type",
+        "_state",
+        "_brightness",
+        "_brightness_preset",
+        "_transition",
+        "_timer",
+        "_blinker",
+        "_illuminance",
+        "_motion",
+        "_pir_sensitivity",
+        "_motion_timeout",
+    )
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
 
         self._type = None
         self._state = None
@@ -416,75 +682,48 @@ class OWNLightingEvent(OWNEvent):
         if self._what is not None and self._what != 1000:
             self._state = self._what
 
-            if self._state == 0:  # Light off
-                self._human_readable_log = (
-                    f"Light {self._where}{self._interface_log_text} is switched off."
-                )
-            elif self._state == 1:  # Light on
-                self._human_readable_log = (
-                    f"Light {self._where}{self._interface_log_text} is switched on."
-                )
-            elif self._state > 1 and self._state < 11:  # Light dimmed to preset value
+            if self._state > 1 and self._state < 11:  # Light dimmed to preset value
                 self._brightness_preset = self._state
                 # self._brightness = self._state * 10
-                self._human_readable_log = f"Light {self._where}{self._interface_log_text} is switched on at brightness level {self._state}."  # pylint: disable=line-too-long
             elif self._state == 11:  # Timer at 1m
                 self._timer = 60
-                self._human_readable_log = f"Light {self._where}{self._interface_log_text} is switched on for {self._timer}s."
             elif self._state == 12:  # Timer at 2m
                 self._timer = 120
-                self._human_readable_log = f"Light {self._where}{self._interface_log_text} is switched on for {self._timer}s."
             elif self._state == 13:  # Timer at 3m
                 self._timer = 180
-                self._human_readable_log = f"Light {self._where}{self._interface_log_text} is switched on for {self._timer}s."
             elif self._state == 14:  # Timer at 4m
                 self._timer = 240
-                self._human_readable_log = f"Light {self._where}{self._interface_log_text} is switched on for {self._timer}s."
             elif self._state == 15:  # Timer at 5m
                 self._timer = 300
-                self._human_readable_log = f"Light {self._where}{self._interface_log_text} is switched on for {self._timer}s."
             elif self._state == 16:  # Timer at 15m
                 self._timer = 900
-                self._human_readable_log = f"Light {self._where}{self._interface_log_text} is switched on for {self._timer}s."
             elif self._state == 17:  # Timer at 30s
                 self._timer = 30
-                self._human_readable_log = f"Light {self._where}{self._interface_log_text} is switched on for {self._timer}s."
             elif self._state == 18:  # Timer at 0.5s
                 self._timer = 0.5
-                self._human_readable_log = f"Light {self._where}{self._interface_log_text} is switched on for {self._timer}s."
             elif self._state >= 20 and self._state <= 29:  # Light blinking
                 self._blinker = 0.5 * (self._state - 19)
-                self._human_readable_log = f"Light {self._where}{self._interface_log_text} is blinking every {self._blinker}s."
             elif self._state == 34:  # Motion detected
                 self._type = MESSAGE_TYPE_MOTION
                 self._motion = True
-                self._human_readable_log = f"Light/motion sensor {self._where}{self._interface_log_text} detected motion"
 
         if self._dimension is not None:
             if self._dimension == 1 or self._dimension == 4:  # Brightness value
                 self._brightness = int(self._dimension_value[0]) - 100
                 self._transition = int(self._dimension_value[1])
-                if self._brightness == 0:
-                    self._state = 0
-                    self._human_readable_log = f"Light {self._where}{self._interface_log_text} is switched off."
-                else:
-                    self._state = 1
-                    self._human_readable_log = f"Light {self._where}{self._interface_log_text} is switched on at {self._brightness}%."
+                self._state = 0 if self._brightness == 0 else 1
             elif self._dimension == 2:  # Time value
                 self._timer = (
                     int(self._dimension_value[0]) * 3600
                     + int(self._dimension_value[1]) * 60
                     + int(self._dimension_value[2])
                 )
-                self._human_readable_log = f"Light {self._where}{self._interface_log_text} is switched on for {self._timer}s."
             elif self._dimension == 5:  # PIR sensitivity
                 self._type = MESSAGE_TYPE_PIR_SENSITIVITY
                 self._pir_sensitivity = int(self._dimension_value[0])
-                self._human_readable_log = f"Light/motion sensor {self._where}{self._interface_log_text} PIR sesitivity is {PIR_SENSITIVITY_MAPPING[self._pir_sensitivity]}."  # pylint: disable=line-too-long
             elif self._dimension == 6:  # Illuminance value
                 self._type = MESSAGE_TYPE_ILLUMINANCE
                 self._illuminance = int(self._dimension_value[0])
-                self._human_readable_log = f"Light/motion sensor {self._where}{self._interface_log_text} detected an illuminance value of {self._illuminance} lx."  # pylint: disable=line-too-long
             elif self._dimension == 7:  # Motion timeout value
                 self._type = MESSAGE_TYPE_MOTION_TIMEOUT
                 self._motion_timeout = datetime.timedelta(
@@ -492,11 +731,42 @@ class OWNLightingEvent(OWNEvent):
                     minutes=int(self._dimension_value[1]),
                     seconds=int(self._dimension_value[2]),
                 )
-                self._human_readable_log = f"Light/motion sensor {self._where}{self._interface_log_text} has timeout set to {self._motion_timeout}."  # pylint: disable=line-too-long
+
+    def _build_human_readable_log(self) -> str:
+        if self._dimension is not None:
+            if self._dimension == 1 or self._dimension == 4:  # Brightness value
+                if self._brightness == 0:
+                    return f"Light {self._where}{self._interface_log_text} is switched off."
+                return f"Light {self._where}{self._interface_log_text} is switched on at {self._brightness}%."
+            elif self._dimension == 2:  # Time value
+                return f"Light {self._where}{self._interface_log_text} is switched on for {self._timer}s."
+            elif self._dimension == 5:  # PIR sensitivity
+                _sensitivity = (
+                    PIR_SENSITIVITY_MAPPING[self._pir_sensitivity]
+                    if 0 <= self._pir_sensitivity < len(PIR_SENSITIVITY_MAPPING)
+                    else self._pir_sensitivity
+                )
+                return f"Light/motion sensor {self._where}{self._interface_log_text} PIR sesitivity is {_sensitivity}."  # pylint: disable=line-too-long
+            elif self._dimension == 6:  # Illuminance value
+                return f"Light/motion sensor {self._where}{self._interface_log_text} detected an illuminance value of {self._illuminance} lx."  # pylint: disable=line-too-long
+            elif self._dimension == 7:  # Motion timeout value
+                return f"Light/motion sensor {self._where}{self._interface_log_text} has timeout set to {self._motion_timeout}."  # pylint: disable=line-too-long
             elif self._dimension_value is not None:
-                self._human_readable_log = f"Light/motion sensor {self._where}{self._interface_log_text} has sent an unknown dimension {self._dimension}."
-            else:
-                pass
+                return f"Light/motion sensor {self._where}{self._interface_log_text} has sent an unknown dimension {self._dimension}."
+        elif self._state is not None:
+            if self._state == 0:  # Light off
+                return f"Light {self._where}{self._interface_log_text} is switched off."
+            elif self._state == 1:  # Light on
+                return f"Light {self._where}{self._interface_log_text} is switched on."
+            elif self._brightness_preset is not None:
+                return f"Light {self._where}{self._interface_log_text} is switched on at brightness level {self._state}."  # pylint: disable=line-too-long
+            elif self._timer is not None:
+                return f"Light {self._where}{self._interface_log_text} is switched on for {self._timer}s."
+            elif self._blinker is not None:
+                return f"Light {self._where}{self._interface_log_text} is blinking every {self._blinker}s."
+            elif self._motion:
+                return f"Light/motion sensor {self._where}{self._interface_log_text} detected motion"
+        return str(self)
 
     @property
     def message_type(self):
@@ -544,8 +814,18 @@ class OWNLightingEvent(OWNEvent):
 
 
 class OWNAutomationEvent(OWNEvent):
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = (
+        "_state",
+        "_position",
+        "_priority",
+        "_info",
+        "_is_opening",
+        "_is_closing",
+        "_is_closed",
+    )
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
 
         self._state = None
         self._position = None
@@ -566,45 +846,43 @@ class OWNAutomationEvent(OWNEvent):
                 self._info = int(self._dimension_value[3])
 
         if self._state == 0:
-            self._human_readable_log = (
-                f"Cover {self._where}{self._interface_log_text} stopped."
-            )
             self._is_opening = False
             self._is_closing = False
         elif self._state == 10:
             self._is_opening = False
             self._is_closing = False
+            self._is_closed = self._position == 0
+        elif self._state == 1:
+            self._is_opening = True
+            self._is_closing = False
+        elif self._state == 11 or self._state == 13:
+            self._is_opening = True
+            self._is_closing = False
+            self._is_closed = False
+        elif self._state == 2:
+            self._is_closing = True
+            self._is_opening = False
+        elif self._state == 12 or self._state == 14:
+            self._is_closing = True
+            self._is_opening = False
+            self._is_closed = False
+
+    def _build_human_readable_log(self) -> str:
+        if self._state == 0:
+            return f"Cover {self._where}{self._interface_log_text} stopped."
+        elif self._state == 10:
             if self._position == 0:
-                self._human_readable_log = (
-                    f"Cover {self._where}{self._interface_log_text} is closed."
-                )
-                self._is_closed = True
-            else:
-                self._human_readable_log = f"Cover {self._where}{self._interface_log_text} is opened at {self._position}%."
-                self._is_closed = False
-        else:
-            if self._state == 1:
-                self._human_readable_log = (
-                    f"Cover {self._where}{self._interface_log_text} is opening."
-                )
-                self._is_opening = True
-                self._is_closing = False
-            elif self._state == 11 or self._state == 13:
-                self._human_readable_log = f"Cover {self._where}{self._interface_log_text} is opening from initial position {self._position}."  # pylint: disable=line-too-long
-                self._is_opening = True
-                self._is_closing = False
-                self._is_closed = False
-            elif self._state == 2:
-                self._human_readable_log = (
-                    f"Cover {self._where}{self._interface_log_text} is closing."
-                )
-                self._is_closing = True
-                self._is_opening = False
-            elif self._state == 12 or self._state == 14:
-                self._human_readable_log = f"Cover {self._where}{self._interface_log_text} is closing from initial position {self._position}."  # pylint: disable=line-too-long
-                self._is_closing = True
-                self._is_opening = False
-                self._is_closed = False
+                return f"Cover {self._where}{self._interface_log_text} is closed."
+            return f"Cover {self._where}{self._interface_log_text} is opened at {self._position}%."
+        elif self._state == 1:
+            return f"Cover {self._where}{self._interface_log_text} is opening."
+        elif self._state == 11 or self._state == 13:
+            return f"Cover {self._where}{self._interface_log_text} is opening from initial position {self._position}."  # pylint: disable=line-too-long
+        elif self._state == 2:
+            return f"Cover {self._where}{self._interface_log_text} is closing."
+        elif self._state == 12 or self._state == 14:
+            return f"Cover {self._where}{self._interface_log_text} is closing from initial position {self._position}."  # pylint: disable=line-too-long
+        return str(self)
 
     @property
     def state(self):
@@ -628,8 +906,30 @@ class OWNAutomationEvent(OWNEvent):
 
 
 class OWNHeatingEvent(OWNEvent):
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = (
+        "_type",
+        "_zone",
+        "_sensor",
+        "_actuator",
+        "_mode",
+        "_mode_name",
+        "_set_temperature",
+        "_local_offset",
+        "_local_set_temperature",
+        "_measured_temperature",
+        "_secondary_temperature",
+        "_measured_humidity",
+        "_is_active",
+        "_is_heating",
+        "_is_cooling",
+        "_fan_on",
+        "_fan_speed",
+        "_cooling_fan_on",
+        "_cooling_fan_speed",
+    )
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
 
         self._type = None
 
@@ -662,60 +962,11 @@ class OWNHeatingEvent(OWNEvent):
         self._cooling_fan_on = None
         self._cooling_fan_speed = None
 
-        _valve_active_states = ["1", "2", "6", "7", "8"]
-        _actuator_active_states = ["1", "2", "6", "7", "8", "9"]
-
         if self._what is not None:
             self._mode = int(self._what)
-            if self._mode in [103, 203, 303, 102, 202, 302]:
-                self._type = MESSAGE_TYPE_MODE
-                self._mode_name = CLIMATE_MODE_OFF
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s mode is set to '{self._mode_name}'"
-                )
-            elif (
-                self._mode in [0, 210, 211, 215]
-                or (self._mode >= 2101 and self._mode <= 2103)
-                or (self._mode >= 2201 and self._mode <= 2216)
-            ):
-                self._type = MESSAGE_TYPE_MODE
-                self._mode_name = CLIMATE_MODE_COOL
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s mode is set to '{self._mode_name}'"
-                )
-            elif (
-                self._mode in [1, 110, 111, 115]
-                or (self._mode >= 1101 and self._mode <= 1103)
-                or (self._mode >= 1201 and self._mode <= 1216)
-            ):
-                self._type = MESSAGE_TYPE_MODE
-                self._mode_name = CLIMATE_MODE_HEAT
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s mode is set to '{self._mode_name}'"
-                )
-            elif (
-                self._mode in [310, 311, 315]
-                or (self._mode >= 23001 and self._mode <= 23255)
-                or (self._mode >= 13001 and self._mode <= 13255)
-            ):
+            self._mode_name = _HEATING_MODES.get(self._mode)
+            if self._mode_name is not None:
                 self._type = MESSAGE_TYPE_MODE
-                self._mode_name = CLIMATE_MODE_AUTO
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s mode is set to '{self._mode_name}'"
-                )
-            elif self._mode == 20:
-                self._mode_name = None
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s remote control is disabled"
-                )
-            elif self._mode == 21:
-                self._mode_name = None
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s remote control is enabled"
-                )
-            else:
-                self._mode_name = None
-                self._human_readable_log = f"Zone {self._zone}'s mode is unknown"
 
             if (
                 self._type == MESSAGE_TYPE_MODE
@@ -723,26 +974,19 @@ class OWNHeatingEvent(OWNEvent):
                 and self._what_param[0] is not None
             ):
                 self._type = MESSAGE_TYPE_MODE_TARGET
-                self._set_temperature = float(
-                    f"{self._what_param[0][1:3]}.{self._what_param[0][-1]}"
-                )
-                self._human_readable_log += f" at {self._set_temperature}°C."
-            else:
-                self._human_readable_log += "."
+                self._set_temperature = _decode_temperature(self._what_param[0])
 
         if self._dimension == 0:  # Temperature
             if self._sensor is None:
                 self._type = MESSAGE_TYPE_MAIN_TEMPERATURE
-                self._measured_temperature = float(
-                    f"{self._dimension_value[0][1:3]}.{self._dimension_value[0][-1]}"
+                self._measured_temperature = _decode_temperature(
+                    self._dimension_value[0]
                 )
-                self._human_readable_log = f"Zone {self._zone}'s main sensor is reporting a temperature of {self._measured_temperature}°C."  # pylint: disable=line-too-long
             else:
                 self._type = MESSAGE_TYPE_SECONDARY_TEMPERATURE
-                self._secondary_temperature = float(
-                    f"{self._dimension_value[0][1:3]}.{self._dimension_value[0][-1]}"
+                self._secondary_temperature = _decode_temperature(
+                    self._dimension_value[0]
                 )
-                self._human_readable_log = f"Zone {self._zone}'s secondary sensor {self._sensor} is reporting a temperature of {self._secondary_temperature}°C."  # pylint: disable=line-too-long
 
         elif self._dimension == 11:  # Fan speed
             _fan_mode = int(self._dimension_value[0])
@@ -751,24 +995,13 @@ class OWNHeatingEvent(OWNEvent):
                 self._is_active = True
                 if _fan_mode > 0:
                     self._fan_speed = _fan_mode
-                    self._human_readable_log = (
-                        f"Zone {self._zone}'s fan is on at speed {self._fan_speed}."
-                    )
-                else:
-                    self._human_readable_log = (
-                        f"Zone {self._zone}'s fan is on at 'Auto' speed."
-                    )
             else:
                 self._fan_on = False
                 self._is_active = False
-                self._human_readable_log = f"Zone {self._zone}'s fan is off."
 
         elif self._dimension == 12:  # Local set temperature (set+offset)
             self._type = MESSAGE_TYPE_LOCAL_TARGET_TEMPERATURE
-            self._local_set_temperature = float(
-                f"{self._dimension_value[0][1:3]}.{self._dimension_value[0][-1]}"
-            )
-            self._human_readable_log = f"Zone {self._zone}'s local target temperature is set to {self._local_set_temperature}°C."  # pylint: disable=line-too-long
+            self._local_set_temperature = _decode_temperature(self._dimension_value[0])
 
         elif self._dimension == 13:  # Local offset
             self._type = MESSAGE_TYPE_LOCAL_OFFSET
@@ -786,127 +1019,127 @@ class OWNHeatingEvent(OWNEvent):
                 self._local_offset = int(f"{self._dimension_value[0][1:]}")
             else:
                 self._local_offset = -int(f"{self._dimension_value[0][1:]}")
-            self._human_readable_log = (
-                f"Zone {self._zone}'s local offset is set to {self._local_offset}°C."
-            )
 
         elif self._dimension == 14:  # Set temperature
             self._type = MESSAGE_TYPE_TARGET_TEMPERATURE
-            self._set_temperature = float(
-                f"{self._dimension_value[0][1:3]}.{self._dimension_value[0][-1]}"
-            )
-            self._human_readable_log = f"Zone {self._zone}'s target temperature is set to {self._set_temperature}°C."  # pylint: disable=line-too-long
+            self._set_temperature = _decode_temperature(self._dimension_value[0])
 
         elif self._dimension == 19:  # Valves status
             self._type = MESSAGE_TYPE_ACTION
-            self._is_cooling = self._dimension_value[0] in _valve_active_states
-            self._is_heating = self._dimension_value[1] in _valve_active_states
+            self._is_cooling = self._dimension_value[0] in _VALVE_ACTIVE_STATES
+            self._is_heating = self._dimension_value[1] in _VALVE_ACTIVE_STATES
             self._is_active = self._is_cooling | self._is_heating
             # Handle cooling valve status relative to fan speed/status
             _cooling_value = int(self._dimension_value[0])
-            if _cooling_value == 0:
-                self._human_readable_log = f"Zone {self._zone}'s cooling valve is off"
-            elif _cooling_value == 1:
-                self._human_readable_log = f"Zone {self._zone}'s cooling valve is on"
-            elif _cooling_value == 2:
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s cooling valve is opened"
-                )
-            elif _cooling_value == 3:
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s cooling valve is closed"
-                )
-            elif _cooling_value == 4:
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s cooling valve is stopped"
-                )
-            elif _cooling_value > 4:
+            if _cooling_value > 4:
                 _fan_mode = _cooling_value - 5
                 if _fan_mode > 0:
                     self._cooling_fan_on = True
                     self._is_active = True
                     self._cooling_fan_speed = _fan_mode
-                    self._human_readable_log = f"Zone {self._zone}'s cooling fan is on at speed {self._fan_speed}"  # pylint: disable=line-too-long
                 else:
                     self._cooling_fan_on = False
                     self._is_active = False
-                    self._human_readable_log = f"Zone {self._zone}'s cooling fan is off"
             # Handle heating valve status relative to fan speed/status
             _heating_value = int(self._dimension_value[1])
-            if _heating_value == 0:
-                self._human_readable_log += "; heating valve is off."
-            elif _heating_value == 1:
-                self._human_readable_log += "; heating valve is on."
-            elif _heating_value == 2:
-                self._human_readable_log += "; heating valve is opened."
-            elif _heating_value == 3:
-                self._human_readable_log += "; heating valve is closed."
-            elif _heating_value == 4:
-                self._human_readable_log += "; heating valve is stopped."
-            elif _heating_value > 4:
+            if _heating_value > 4:
                 _fan_mode = _heating_value - 5
                 if _fan_mode > 0:
                     self._fan_on = True
                     self._is_active = True
                     self._fan_speed = _fan_mode
-                    self._human_readable_log += (
-                        f"; heating fan is on at speed {self._fan_speed}."
-                    )
                 else:
                     self._fan_on = False
                     self._is_active = False
-                    self._human_readable_log += "; heating fan is off."
 
         elif self._dimension == 20:  # Actuator status
             self._type = MESSAGE_TYPE_ACTION
-            self._is_active = self._dimension_value[0] in _actuator_active_states
+            self._is_active = self._dimension_value[0] in _ACTUATOR_ACTIVE_STATES
             self._actuator = (
                 self._where_param[0] if self._where_param[0] is not None else 1
             )
             _value = int(self._dimension_value[0])
-            if _value == 0:
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s actuator {self._actuator} is off."
-                )
-            elif _value == 1:
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s actuator {self._actuator} is on."
-                )
-            elif _value == 2:
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s actuator {self._actuator} is opened."
-                )
-            elif _value == 3:
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s actuator {self._actuator} is closed."
-                )
-            elif _value == 4:
-                self._human_readable_log = (
-                    f"Zone {self._zone}'s actuator {self._actuator} is stopped."
-                )
-            elif _value > 4:
+            if _value > 4:
                 _fan_mode = _value - 5
                 if _fan_mode > 0:
                     self._fan_on = True
                     self._is_active = True
                     if _fan_mode < 4:
                         self._fan_speed = _fan_mode
-                        self._human_readable_log = (
-                            f"Zone {self._zone}'s fan is on at speed {self._fan_speed}."
-                        )
-                    else:
-                        self._human_readable_log = (
-                            f"Zone {self._zone}'s fan is on at 'Auto' speed."
-                        )
                 else:
                     self._fan_on = False
                     self._is_active = False
-                    self._human_readable_log = f"Zone {self._zone}'s fan is off."
 
         elif self._dimension == 60:  # Humidity
             self._type = MESSAGE_TYPE_MAIN_HUMIDITY
             self._measured_humidity = float(self._dimension_value[0])
-            self._human_readable_log = f"Zone {self._zone}'s main sensor is reporting a humidity of {self._measured_humidity}%."  # pylint: disable=line-too-long
+
+    def _build_human_readable_log(self) -> str:
+        # pylint: disable=too-many-return-statements
+        if self._mode is not None:
+            if self._mode_name is not None:
+                _log = f"Zone {self._zone}'s mode is set to '{self._mode_name}'"
+            elif self._mode == 20:
+                _log = f"Zone {self._zone}'s remote control is disabled"
+            elif self._mode == 21:
+                _log = f"Zone {self._zone}'s remote control is enabled"
+            else:
+                _log = f"Zone {self._zone}'s mode is unknown"
+            if self._type == MESSAGE_TYPE_MODE_TARGET:
+                return f"{_log} at {self._set_temperature}°C."
+            return f"{_log}."
+
+        if self._dimension == 0:  # Temperature
+            if self._sensor is None:
+                return f"Zone {self._zone}'s main sensor is reporting a temperature of {self._measured_temperature}°C."  # pylint: disable=line-too-long
+            return f"Zone {self._zone}'s secondary sensor {self._sensor} is reporting a temperature of {self._secondary_temperature}°C."  # pylint: disable=line-too-long
+
+        elif self._dimension == 11:  # Fan speed
+            if not self._fan_on:
+                return f"Zone {self._zone}'s fan is off."
+            elif self._fan_speed is not None:
+                return f"Zone {self._zone}'s fan is on at speed {self._fan_speed}."
+            return f"Zone {self._zone}'s fan is on at 'Auto' speed."
+
+        elif self._dimension == 12:  # Local set temperature (set+offset)
+            return f"Zone {self._zone}'s local target temperature is set to {self._local_set_temperature}°C."  # pylint: disable=line-too-long
+
+        elif self._dimension == 13:  # Local offset
+            return f"Zone {self._zone}'s local offset is set to {self._local_offset}°C."
+
+        elif self._dimension == 14:  # Set temperature
+            return f"Zone {self._zone}'s target temperature is set to {self._set_temperature}°C."  # pylint: disable=line-too-long
+
+        elif self._dimension == 19:  # Valves status
+            _cooling_value = int(self._dimension_value[0])
+            if _cooling_value > 4:
+                if self._cooling_fan_on:
+                    _log = f"Zone {self._zone}'s cooling fan is on at speed {self._cooling_fan_speed}"  # pylint: disable=line-too-long
+                else:
+                    _log = f"Zone {self._zone}'s cooling fan is off"
+            else:
+                _log = f"Zone {self._zone}'s cooling valve is {_VALVE_STATES[_cooling_value]}"
+            _heating_value = int(self._dimension_value[1])
+            if _heating_value > 4:
+                if self._fan_on:
+                    return f"{_log}; heating fan is on at speed {self._fan_speed}."
+                return f"{_log}; heating fan is off."
+            return f"{_log}; heating valve is {_VALVE_STATES[_heating_value]}."
+
+        elif self._dimension == 20:  # Actuator status
+            _value = int(self._dimension_value[0])
+            if _value <= 4:
+                return f"Zone {self._zone}'s actuator {self._actuator} is {_VALVE_STATES[_value]}."  # pylint: disable=line-too-long
+            elif not self._fan_on:
+                return f"Zone {self._zone}'s fan is off."
+            elif self._fan_speed is not None:
+                return f"Zone {self._zone}'s fan is on at speed {self._fan_speed}."
+            return f"Zone {self._zone}'s fan is on at 'Auto' speed."
+
+        elif self._dimension == 60:  # Humidity
+            return f"Zone {self._zone}'s main sensor is reporting a humidity of {self._measured_humidity}%."  # pylint: disable=line-too-long
+
+        return str(self)
 
     @property
     def unique_id(self) -> str:
@@ -965,8 +1198,10 @@ class OWNHeatingEvent(OWNEvent):
 
 
 class OWNAlarmEvent(OWNEvent):
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = ("_state_code", "_state", "_system", "_zone", "_sensor")
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
 
         self._state_code = int(self._what)
         self._state = None
@@ -976,28 +1211,17 @@ class OWNAlarmEvent(OWNEvent):
 
         if self._where == "*":
             self._system = True
-            self._human_readable_log = "System is reporting: "
         elif self._where.startswith("#"):
             self._zone = self._where[1:]
             if self._zone == "12":
                 self._zone = "c"
             elif self._zone == "15":
                 self._zone = "f"
-            self._human_readable_log = f"Zone {self._zone} is reporting: "
         elif len(self._where) > 1:
             self._zone = int(self._where[0])
             self._sensor = int(self._where[1:])
-            if self._zone == 0:
-                self._human_readable_log = (
-                    f"Device {self._sensor} in input zone is reporting: "
-                )
-            else:
-                self._human_readable_log = (
-                    f"Sensor {self._sensor} in zone {self._zone} is reporting: "
-                )
         else:
             self._system = True
-            self._human_readable_log = "Control panel is reporting: "
 
         if self._state_code == 0:
             self._state = "maintenance"
@@ -1044,7 +1268,16 @@ class OWNAlarmEvent(OWNEvent):
         elif self._state_code == 31:
             self._state = "silent alarm"
 
-        self._human_readable_log = f"{self._human_readable_log}'{self._state}'."
+    def _build_human_readable_log(self) -> str:
+        if self._where == "*":
+            return f"System is reporting: '{self._state}'."
+        elif self._sensor is not None:
+            if self._zone == 0:
+                return f"Device {self._sensor} in input zone is reporting: '{self._state}'."
+            return f"Sensor {self._sensor} in zone {self._zone} is reporting: '{self._state}'."
+        elif self._zone is not None:
+            return f"Zone {self._zone} is reporting: '{self._state}'."
+        return f"Control panel is reporting: '{self._state}'."
 
     @property
     def general(self):
@@ -1078,56 +1311,39 @@ class OWNAlarmEvent(OWNEvent):
 
 
 class OWNAuxEvent(OWNEvent):
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = ("_channel", "_state")
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
 
         self._channel = self._where
 
         self._state = self._what
+
+    def _build_human_readable_log(self) -> str:
         if self._state == 0:
-            self._human_readable_log = (
-                f"Auxilliary channel {self._channel} is set to 'OFF'."
-            )
+            return f"Auxilliary channel {self._channel} is set to 'OFF'."
         elif self._state == 1:
-            self._human_readable_log = (
-                f"Auxilliary channel {self._channel} is set to 'ON'."
-            )
+            return f"Auxilliary channel {self._channel} is set to 'ON'."
         elif self._state == 2:
-            self._human_readable_log = (
-                f"Auxilliary channel {self._channel} is set to 'TOGGLE'."
-            )
+            return f"Auxilliary channel {self._channel} is set to 'TOGGLE'."
         elif self._state == 3:
-            self._human_readable_log = (
-                f"Auxilliary channel {self._channel} is set to 'STOP'."
-            )
+            return f"Auxilliary channel {self._channel} is set to 'STOP'."
         elif self._state == 4:
-            self._human_readable_log = (
-                f"Auxilliary channel {self._channel} is set to 'UP'."
-            )
+            return f"Auxilliary channel {self._channel} is set to 'UP'."
         elif self._state == 5:
-            self._human_readable_log = (
-                f"Auxilliary channel {self._channel} is set to 'DOWN'."
-            )
+            return f"Auxilliary channel {self._channel} is set to 'DOWN'."
         elif self._state == 6:
-            self._human_readable_log = (
-                f"Auxilliary channel {self._channel} is set to 'ENABLED'."
-            )
+            return f"Auxilliary channel {self._channel} is set to 'ENABLED'."
         elif self._state == 7:
-            self._human_readable_log = (
-                f"Auxilliary channel {self._channel} is set to 'DISABLED'."
-            )
+            return f"Auxilliary channel {self._channel} is set to 'DISABLED'."
         elif self._state == 8:
-            self._human_readable_log = (
-                f"Auxilliary channel {self._channel} is set to 'RESET_GEN'."
-            )
+            return f"Auxilliary channel {self._channel} is set to 'RESET_GEN'."
         elif self._state == 9:
-            self._human_readable_log = (
-                f"Auxilliary channel {self._channel} is set to 'RESET_BI'."
-            )
+            return f"Auxilliary channel {self._channel} is set to 'RESET_BI'."
         elif self._state == 10:
-            self._human_readable_log = (
-                f"Auxilliary channel {self._channel} is set to 'RESET_TRI'."
-            )
+            return f"Auxilliary channel {self._channel} is set to 'RESET_TRI'."
+        return str(self)
 
     @property
     def channel(self):
@@ -1143,8 +1359,29 @@ class OWNAuxEvent(OWNEvent):
 
 
 class OWNGatewayEvent(OWNEvent):
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = (
+        "_year",
+        "_month",
+        "_day",
+        "_hour",
+        "_minute",
+        "_second",
+        "_timezone",
+        "_time",
+        "_date",
+        "_datetime",
+        "_ip_address",
+        "_netmask",
+        "_mac_address",
+        "_device_type",
+        "_firmware_version",
+        "_uptime",
+        "_kernel_version",
+        "_distribution_version",
+    )
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
 
         self._year = None
         self._month = None
@@ -1183,7 +1420,6 @@ class OWNGatewayEvent(OWNEvent):
                 )
             else:
                 self._timezone = ""
-            self._human_readable_log = f"Gateway's internal time is: {self._hour}:{self._minute}:{self._second} UTC {self._timezone}."  # pylint: disable=line-too-long
 
         elif self._dimension == 1:
             self._year = self._dimension_value[3]
@@ -1192,21 +1428,15 @@ class OWNGatewayEvent(OWNEvent):
             self._date = datetime.date(
                 year=int(self._year), month=int(self._month), day=int(self._day)
             )
-            self._human_readable_log = (
-                f"Gateway's internal date is: {self._year}-{self._month}-{self._day}."
-            )
 
         elif self._dimension == 10:
             self._ip_address = f"{self._dimension_value[0]}.{self._dimension_value[1]}.{self._dimension_value[2]}.{self._dimension_value[3]}"  # pylint: disable=line-too-long
-            self._human_readable_log = f"Gateway's IP address is: {self._ip_address}."
 
         elif self._dimension == 11:
             self._netmask = f"{self._dimension_value[0]}.{self._dimension_value[1]}.{self._dimension_value[2]}.{self._dimension_value[3]}"  # pylint: disable=line-too-long
-            self._human_readable_log = f"Gateway's netmask is: {self._netmask}."
 
         elif self._dimension == 12:
             self._mac_address = f"{int(self._dimension_value[0]):02x}:{int(self._dimension_value[1]):02x}:{int(self._dimension_value[2]):02x}:{int(self._dimension_value[3]):02x}:{int(self._dimension_value[4]):02x}:{int(self._dimension_value[5]):02x}"  # pylint: disable=line-too-long
-            self._human_readable_log = f"Gateway's MAC address is: {self._mac_address}."
 
         elif self._dimension == 15:
             if self._dimension_value[0] == "2":
@@ -1225,13 +1455,9 @@ class OWNGatewayEvent(OWNEvent):
                 self._device_type = "F454"
             else:
                 self._device_type = f"Unknown ({self._dimension_value[0]})"
-            self._human_readable_log = f"Gateway device type is: {self._device_type}."
 
         elif self._dimension == 16:
             self._firmware_version = f"{self._dimension_value[0]}.{self._dimension_value[1]}.{self._dimension_value[2]}"  # pylint: disable=line-too-long
-            self._human_readable_log = (
-                f"Gateway's firmware version is: {self._firmware_version}."
-            )
 
         elif self._dimension == 19:
             self._uptime = datetime.timedelta(
@@ -1240,7 +1466,6 @@ class OWNGatewayEvent(OWNEvent):
                 minutes=int(self._dimension_value[2]),
                 seconds=int(self._dimension_value[3]),
             )
-            self._human_readable_log = f"Gateway's uptime is: {self._uptime}."
 
         elif self._dimension == 22:
             self._hour = self._dimension_value[0]
@@ -1261,26 +1486,47 @@ class OWNGatewayEvent(OWNEvent):
             self._datetime = datetime.datetime.fromisoformat(
                 f"{self._year}-{self._month}-{self._day}*{self._hour}:{self._minute}:{self._second}{self._timezone}"  # pylint: disable=line-too-long
             )
-            self._human_readable_log = (
-                f"Gateway's internal datetime is: {self._datetime}."
-            )
 
         elif self._dimension == 23:
             self._kernel_version = f"{self._dimension_value[0]}.{self._dimension_value[1]}.{self._dimension_value[2]}"  # pylint: disable=line-too-long
-            self._human_readable_log = (
-                f"Gateway's kernel version is: {self._kernel_version}."
-            )
 
         elif self._dimension == 24:
             self._distribution_version = f"{self._dimension_value[0]}.{self._dimension_value[1]}.{self._dimension_value[2]}"  # pylint: disable=line-too-long
-            self._human_readable_log = (
-                f"Gateway's distribution version is: {self._distribution_version}."
+
+    def _build_human_readable_log(self) -> str:
+        # pylint: disable=too-many-return-statements
+        if self._dimension == 0:
+            return f"Gateway's internal time is: {self._hour}:{self._minute}:{self._second} UTC {self._timezone}."  # pylint: disable=line-too-long
+        elif self._dimension == 1:
+            return (
+                f"Gateway's internal date is: {self._year}-{self._month}-{self._day}."
             )
+        elif self._dimension == 10:
+            return f"Gateway's IP address is: {self._ip_address}."
+        elif self._dimension == 11:
+            return f"Gateway's netmask is: {self._netmask}."
+        elif self._dimension == 12:
+            return f"Gateway's MAC address is: {self._mac_address}."
+        elif self._dimension == 15:
+            return f"Gateway device type is: {self._device_type}."
+        elif self._dimension == 16:
+            return f"Gateway's firmware version is: {self._firmware_version}."
+        elif self._dimension == 19:
+            return f"Gateway's uptime is: {self._uptime}."
+        elif self._dimension == 22:
+            return f"Gateway's internal datetime is: {self._datetime}."
+        elif self._dimension == 23:
+            return f"Gateway's kernel version is: {self._kernel_version}."
+        elif self._dimension == 24:
+            return f"Gateway's distribution version is: {self._distribution_version}."
+        return str(self)
 
 
 class OWNCENEvent(OWNEvent):
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = ("push_button", "object", "_state")
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
 
         try:
             self._state = self._what_param[0]
@@ -1289,14 +1535,16 @@ class OWNCENEvent(OWNEvent):
         self.push_button = self._what
         self.object = self._where
 
+    def _build_human_readable_log(self) -> str:
         if self._state is None:
-            self._human_readable_log = f"Button {self.push_button} of CEN object {self.object}{self._interface_log_text} has been pressed."  # pylint: disable=line-too-long
+            return f"Button {self.push_button} of CEN object {self.object}{self._interface_log_text} has been pressed."  # pylint: disable=line-too-long
         elif int(self._state) == 3:
-            self._human_readable_log = f"Button {self.push_button} of CEN object {self.object}{self._interface_log_text} is being held pressed."  # pylint: disable=line-too-long
+            return f"Button {self.push_button} of CEN object {self.object}{self._interface_log_text} is being held pressed."  # pylint: disable=line-too-long
         elif int(self._state) == 1:
-            self._human_readable_log = f"Button {self.push_button} of CEN object {self.object}{self._interface_log_text} has been released after a short press."  # pylint: disable=line-too-long
+            return f"Button {self.push_button} of CEN object {self.object}{self._interface_log_text} has been released after a short press."  # pylint: disable=line-too-long
         elif int(self._state) == 2:
-            self._human_readable_log = f"Button {self.push_button} of CEN object {self.object}{self._interface_log_text} has been released after a long press."  # pylint: disable=line-too-long
+            return f"Button {self.push_button} of CEN object {self.object}{self._interface_log_text} has been released after a long press."  # pylint: disable=line-too-long
+        return str(self)
 
     @property
     def is_pressed(self):
@@ -1316,12 +1564,15 @@ class OWNCENEvent(OWNEvent):
 
 
 class OWNSceneEvent(OWNEvent):
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = ("_scene", "_state")
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
 
         self._scene = self._where
         self._state = self._what
 
+    def _build_human_readable_log(self) -> str:
         if self._state == 1:
             _status = "started"
         elif self._state == 2:
@@ -1333,7 +1584,7 @@ class OWNSceneEvent(OWNEvent):
         else:
             _status = f"unknonwn ({self._state})"
 
-        self._human_readable_log = f"Scene {self._scene} is {_status}."
+        return f"Scene {self._scene} is {_status}."
 
     @property
     def scenario(self):
@@ -1363,8 +1614,22 @@ class OWNSceneEvent(OWNEvent):
 
 
 class OWNEnergyEvent(OWNEvent):
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = (
+        "_type",
+        "_sensor",
+        "_active_power",
+        "_total_consumption",
+        "_hourly_consumption",
+        "_daily_consumption",
+        "_current_day_partial_consumption",
+        "_monthly_consumption",
+        "_current_month_partial_consumption",
+    )
+
+    _date_resolver = DateResolver()
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
 
         if not self._where.startswith("5") and not self._where.startswith("7"):
             return None
@@ -1383,28 +1648,11 @@ class OWNEnergyEvent(OWNEvent):
             if self._dimension == 113:
                 self._type = MESSAGE_TYPE_ACTIVE_POWER
                 self._active_power = int(self._dimension_value[0])
-                self._human_readable_log = f"Sensor {self._sensor} is reporting an active power draw of {self._active_power} W."  # pylint: disable=line-too-long
             elif self._dimension == 511:
-                _now = datetime.date.today()
-                _raw_message_date = datetime.date(
-                    _now.year,
-                    int(self._dimension_param[0]),
-                    int(self._dimension_param[1]),
+                _message_date = self._date_resolver.resolve_day(
+                    int(self._dimension_param[0]), int(self._dimension_param[1])
                 )
-                try:
-                    if _raw_message_date > _now:
-                        _message_date = datetime.date(
-                            _now.year - 1,
-                            int(self._dimension_param[0]),
-                            int(self._dimension_param[1]),
-                        )
-                    else:
-                        _message_date = datetime.date(
-                            _now.year,
-                            int(self._dimension_param[0]),
-                            int(self._dimension_param[1]),
-                        )
-                except ValueError:
+                if _message_date is None:
                     return None
 
                 if int(self._dimension_value[0]) != 25:
@@ -1412,57 +1660,31 @@ class OWNEnergyEvent(OWNEvent):
                     self._hourly_consumption["date"] = _message_date
                     self._hourly_consumption["hour"] = int(self._dimension_value[0]) - 1
                     self._hourly_consumption["value"] = int(self._dimension_value[1])
-                    self._human_readable_log = f"Sensor {self._sensor} is reporting a power consumption of {self._hourly_consumption['value']} Wh for {self._hourly_consumption['date']} at {self._hourly_consumption['hour']}."  # pylint: disable=line-too-long
                 else:
                     self._type = MESSAGE_TYPE_DAILY_CONSUMPTION
                     self._daily_consumption["date"] = _message_date
                     self._daily_consumption["value"] = int(self._dimension_value[1])
-                    self._human_readable_log = f"Sensor {self._sensor} is reporting a power consumption of {self._daily_consumption['value']} Wh for {self._daily_consumption['date']}."  # pylint: disable=line-too-long
             elif self._dimension == 513 or self._dimension == 514:
-                _now = datetime.date.today()
-                _raw_message_date = datetime.date(
-                    _now.year, int(self._dimension_param[0]), 1
-                )
+                # 513 is for the last 12 months, 514 for the 12 months before
                 try:
-                    if self._dimension == 513 and _raw_message_date > _now:
-                        _message_date = datetime.date(
-                            _now.year - 1,
-                            int(self._dimension_param[0]),
-                            int(self._dimension_value[0]),
-                        )
-                    elif self._dimension == 514:
-                        if _raw_message_date > _now:
-                            _message_date = datetime.date(
-                                _now.year - 2,
-                                int(self._dimension_param[0]),
-                                int(self._dimension_value[0]),
-                            )
-                        else:
-                            _message_date = datetime.date(
-                                _now.year - 1,
-                                int(self._dimension_param[0]),
-                                int(self._dimension_value[0]),
-                            )
-                    else:
-                        _message_date = datetime.date(
-                            _now.year,
-                            int(self._dimension_param[0]),
-                            int(self._dimension_value[0]),
-                        )
+                    _message_date = self._date_resolver.resolve_month_day(
+                        int(self._dimension_param[0]),
+                        int(self._dimension_value[0]),
+                        0 if self._dimension == 513 else 1,
+                    )
                 except ValueError:
                     return None
+                if _message_date is None:
+                    return None
                 self._type = MESSAGE_TYPE_DAILY_CONSUMPTION
                 self._daily_consumption["date"] = _message_date
                 self._daily_consumption["value"] = int(self._dimension_value[1])
-                self._human_readable_log = f"Sensor {self._sensor} is reporting a power consumption of {self._daily_consumption['value']} Wh for {self._daily_consumption['date']}."  # pylint: disable=line-too-long
             elif self._dimension == 51:
                 self._type = MESSAGE_TYPE_ENERGY_TOTALIZER
                 self._total_consumption = int(self._dimension_value[0])
-                self._human_readable_log = f"Sensor {self._sensor} is reporting a total power consumption of {self._total_consumption} Wh."  # pylint: disable=line-too-long
             elif self._dimension == 54:
                 self._type = MESSAGE_TYPE_CURRENT_DAY_CONSUMPTION
                 self._current_day_partial_consumption = int(self._dimension_value[0])
-                self._human_readable_log = f"Sensor {self._sensor} is reporting a power consumption of {self._current_day_partial_consumption} Wh up to now today."  # pylint: disable=line-too-long
             elif self._dimension == 52:
                 self._type = MESSAGE_TYPE_MONTHLY_CONSUMPTION
                 _message_date = datetime.date(
@@ -1470,11 +1692,37 @@ class OWNEnergyEvent(OWNEvent):
                 )
                 self._monthly_consumption["date"] = _message_date
                 self._monthly_consumption["value"] = int(self._dimension_value[0])
-                self._human_readable_log = f"Sensor {self._sensor} is reporting a power consumption of {self._monthly_consumption['value']} Wh for {self._monthly_consumption['date'].strftime('%B %Y')}."  # pylint: disable=line-too-long
             elif self._dimension == 53:
                 self._type = MESSAGE_TYPE_CURRENT_MONTH_CONSUMPTION
                 self._current_month_partial_consumption = int(self._dimension_value[0])
-                self._human_readable_log = f"Sensor {self._sensor} is reporting a power consumption of {self._current_month_partial_consumption} Wh up to now this month."  # pylint: disable=line-too-long
+
+    def _build_human_readable_log(self) -> str:
+        if not self._where.startswith("5") and not self._where.startswith("7"):
+            return str(self)
+        elif self._type == MESSAGE_TYPE_ACTIVE_POWER:
+            return f"Sensor {self._sensor} is reporting an active power draw of {self._active_power} W."  # pylint: disable=line-too-long
+        elif self._type == MESSAGE_TYPE_HOURLY_CONSUMPTION:
+            return f"Sensor {self._sensor} is reporting a power consumption of {self._hourly_consumption['value']} Wh for {self._hourly_consumption['date']} at {self._hourly_consumption['hour']}."  # pylint: disable=line-too-long
+        elif self._type == MESSAGE_TYPE_DAILY_CONSUMPTION:
+            return f"Sensor {self._sensor} is reporting a power consumption of {self._daily_consumption['value']} Wh for {self._daily_consumption['date']}."  # pylint: disable=line-too-long
+        elif self._type == MESSAGE_TYPE_ENERGY_TOTALIZER:
+            return f"Sensor {self._sensor} is reporting a total power consumption of {self._total_consumption} Wh."  # pylint: disable=line-too-long
+        elif self._type == MESSAGE_TYPE_CURRENT_DAY_CONSUMPTION:
+            return f"Sensor {self._sensor} is reporting a power consumption of {self._current_day_partial_consumption} Wh up to now today."  # pylint: disable=line-too-long
+        elif self._type == MESSAGE_TYPE_MONTHLY_CONSUMPTION:
+            return f"Sensor {self._sensor} is reporting a power consumption of {self._monthly_consumption['value']} Wh for {self._monthly_consumption['date'].strftime('%B %Y')}."  # pylint: disable=line-too-long
+        elif self._type == MESSAGE_TYPE_CURRENT_MONTH_CONSUMPTION:
+            return f"Sensor {self._sensor} is reporting a power consumption of {self._current_month_partial_consumption} Wh up to now this month."  # pylint: disable=line-too-long
+        return str(self)
+
+    @classmethod
+    def set_date_resolver(cls, resolver: Optional[DateResolver] = None) -> None:
+        """Clock used to date consumption frames, None to go back to the system clock"""
+        cls._date_resolver = DateResolver() if resolver is None else resolver
+
+    def _is_cacheable(self) -> bool:
+        # The year of these consumption frames is guessed from today's date
+        return self._dimension not in (511, 513, 514)
 
     @property
     def message_type(self):
@@ -1508,27 +1756,23 @@ class OWNEnergyEvent(OWNEvent):
     def current_month_partial_consumption(self):
         return self._current_month_partial_consumption
 
-    @property
-    def human_readable_log(self):
-        return self._human_readable_log
-
 
 class OWNDryContactEvent(OWNEvent):
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = ("_state", "_detection", "_sensor")
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
 
         self._state = 1 if self._what == 31 else 0
         self._detection = int(self._what_param[0])
         self._sensor = self._where[1:]
 
+    def _build_human_readable_log(self) -> str:
         if self._detection == 1:
-            self._human_readable_log = (
+            return (
                 f"Sensor {self._sensor} detected {'ON' if self._state == 1 else 'OFF'}."
             )
-        else:
-            self._human_readable_log = (
-                f"Sensor {self._sensor} reported {'ON' if self._state == 1 else 'OFF'}."
-            )
+        return f"Sensor {self._sensor} reported {'ON' if self._state == 1 else 'OFF'}."
 
     @property
     def is_on(self):
@@ -1538,35 +1782,36 @@ class OWNDryContactEvent(OWNEvent):
     def is_detection(self):
         return self._detection == 1
 
-    @property
-    def human_readable_log(self):
-        return self._human_readable_log
-
 
 class OWNCENPlusEvent(OWNEvent):
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = ("_state", "push_button", "object")
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
 
         self._state = self._what
         self.push_button = int(self._what_param[0])
         self.object = self._where[1:]
 
+    def _build_human_readable_log(self) -> str:
+        # pylint: disable=too-many-return-statements
         if self._state == 21:
-            self._human_readable_log = f"Button {self.push_button} of CEN+ object {self.object} has been pressed"  # pylint: disable=line-too-long
+            return f"Button {self.push_button} of CEN+ object {self.object} has been pressed"  # pylint: disable=line-too-long
         elif self._state == 22:
-            self._human_readable_log = f"Button {self.push_button} of CEN+ object {self.object} is being held pressed"  # pylint: disable=line-too-long
+            return f"Button {self.push_button} of CEN+ object {self.object} is being held pressed"  # pylint: disable=line-too-long
         elif self._state == 23:
-            self._human_readable_log = f"Button {self.push_button} of CEN+ object {self.object} is still being held pressed"  # pylint: disable=line-too-long
+            return f"Button {self.push_button} of CEN+ object {self.object} is still being held pressed"  # pylint: disable=line-too-long
         elif self._state == 24:
-            self._human_readable_log = f"Button {self.push_button} of CEN+ object {self.object} has been released"  # pylint: disable=line-too-long
+            return f"Button {self.push_button} of CEN+ object {self.object} has been released"  # pylint: disable=line-too-long
         elif self._state == 25:
-            self._human_readable_log = f"Button {self.push_button} of CEN+ object {self.object} has been slowly rotated clockwise"  # pylint: disable=line-too-long
+            return f"Button {self.push_button} of CEN+ object {self.object} has been slowly rotated clockwise"  # pylint: disable=line-too-long
         elif self._state == 26:
-            self._human_readable_log = f"Button {self.push_button} of CEN+ object {self.object} has been quickly rotated clockwise"  # pylint: disable=line-too-long
+            return f"Button {self.push_button} of CEN+ object {self.object} has been quickly rotated clockwise"  # pylint: disable=line-too-long
         elif self._state == 27:
-            self._human_readable_log = f"Button {self.push_button} of CEN+ object {self.object} has been slowly rotated counter-clockwise"  # pylint: disable=line-too-long
+            return f"Button {self.push_button} of CEN+ object {self.object} has been slowly rotated counter-clockwise"  # pylint: disable=line-too-long
         elif self._state == 28:
-            self._human_readable_log = f"Button {self.push_button} of CEN+ object {self.object} has been quickly rotated counter-clockwise"  # pylint: disable=line-too-long
+            return f"Button {self.push_button} of CEN+ object {self.object} has been quickly rotated counter-clockwise"  # pylint: disable=line-too-long
+        return str(self)
 
     @property
     def is_short_pressed(self):
@@ -1600,10 +1845,6 @@ class OWNCENPlusEvent(OWNEvent):
     def is_quickly_turned_ccw(self):
         return self._state == 28
 
-    @property
-    def human_readable_log(self):
-        return self._human_readable_log
-
 
 class OWNCommand(OWNMessage):
     """
@@ -1612,88 +1853,222 @@ class OWNCommand(OWNMessage):
     Dividing this in a subclass provides better clarity
     """
 
+    __slots__ = ("_log_format",)
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
+
+        # (template, values) set by the command builders, formatted only when logged
+        self._log_format = None
+
+    def _build_human_readable_log(self) -> str:
+        if self._log_format is None:
+            return super()._build_human_readable_log()
+        _template, _values = self._log_format
+        return _template.format(
+            *_values, where=self._where, interface=self._interface_log_text
+        )
+
     @classmethod
-    def parse(cls, data) -> Optional[OWNCommand]:
-        _match = re.match(r"^\*#?(?P<who>\d+)\*.+##$", data)
-
-        if _match:
-            _who = int(_match.group("who"))
-
-            if _who == 0:
-                return cls(data)
-            elif _who == 1:
-                return OWNLightingCommand(data)
-            elif _who == 2:
-                return OWNAutomationCommand(data)
-            elif _who == 3:  # Charges / Loads ?
-                return cls(data)
-            elif _who == 4:
-                return OWNHeatingCommand(data)
-            elif _who == 5:
-                return cls(data)
-            elif _who == 6:  # VDES
-                return cls(data)
-            elif _who == 7:
-                return cls(data)
-            elif _who == 9:
-                return cls(data)
-            elif _who == 13:
-                return OWNGatewayCommand(data)
-            elif _who == 14:
-                return cls(data)
-            elif _who == 15:
-                return cls(data)
-            elif _who == 16:
-                return cls(data)
-            elif _who == 17:
-                return cls(data)
-            elif _who == 18:
-                return OWNEnergyCommand(data)
-            elif _who == 22:
-                return cls(data)
-            elif _who == 24:
-                return cls(data)
-            elif _who == 25:
-                _where = re.match(r"^\*.+\*(?P<where>\d+)##$", data).group("where")
-                if _where.startswith("2"):
-                    return cls(data)
-                elif _where.startswith("3"):
-                    return OWNDryContactCommand(data)
-            elif _who > 1000:
-                return cls(data)
+    def parse(cls, data, tokens: Optional[tuple] = None) -> Optional[OWNCommand]:
+        _who = _parse_who(data, tokens)
+
+        if _who is not None:
+            _class = _COMMAND_CLASSES.get(_who)
+            if _class is None:
+                if _who in _COMMAND_CLASSES_BY_WHERE:
+                    _class = _COMMAND_CLASSES_BY_WHERE[_who].get(
+                        _parse_last_field(data)
+                    )
+                elif _who > 1000:
+                    _class = cls
+            if _class is OWNCommand:
+                _class = cls
+            if _class is not None:
+                return _class(data, tokens)
 
         return None
 
+    @classmethod
+    def register(cls, who: int, command_class, where: Optional[str] = None) -> None:
+        """Parse the commands of a WHO as command_class, or only those whose WHERE starts
+        with the `where` digit, the way WHO 25 CEN+ and dry contacts are told apart.
+        command_class can be a 'module:Class' path, it is then only imported when
+        the first of those commands is parsed"""
+        _register_class(
+            _COMMAND_CLASSES, _COMMAND_CLASSES_BY_WHERE, who, command_class, where
+        )
+
+    # The builders below render a frame from its fields and hand the fields over
+    # as tokens, so that the frame doesn't have to be parsed back.
+    # Fields that wouldn't tokenize fall back to parsing, which flags the message invalid.
+
+    @classmethod
+    def _status(cls, who: int, what: int, where, what_param: tuple = ()) -> OWNCommand:
+        """*WHO*WHAT[#P]*WHERE##"""
+        _what = str(what)
+        _where = str(where)
+        if what_param:
+            _what_param = [str(_param) for _param in what_param]
+            _frame = f"*{who}*{'#'.join([_what, *_what_param])}*{_where}##"
+        else:
+            _what_param = []
+            _frame = f"*{who}*{_what}*{_where}##"
+        _where_fields = [_where] if _where.isdecimal() else _split_where(_where)
+        if _where_fields is None or not _what.isdecimal():
+            return cls(_frame)
+        for _param in _what_param:
+            if not _param.isdecimal():
+                return cls(_frame)
+        _what = int(_what)
+        return cls(
+            _frame,
+            (
+                "COMMAND_TRANSLATION" if _what == 1000 else "EVENT",
+                "STATUS",
+                who,
+                _what,
+                _what_param,
+                _where_fields[0],
+                _where_fields[1:],
+                None,
+                None,
+                None,
+            ),
+        )
+
+    @classmethod
+    def _status_request(cls, who: int, where) -> OWNCommand:
+        """*#WHO*WHERE##"""
+        _where = str(where)
+        _frame = f"*#{who}*{_where}##"
+        _where_fields = [_where] if _where.isdecimal() else _split_where(_where)
+        if _where_fields is None:
+            return cls(_frame)
+        return cls(
+            _frame,
+            (
+                "REQUEST",
+                "STATUS_REQUEST",
+                who,
+                None,
+                None,
+                _where_fields[0],
+                _where_fields[1:],
+                None,
+                None,
+                None,
+            ),
+        )
+
+    @classmethod
+    def _dimension_request(cls, who: int, where, dimension: int) -> OWNCommand:
+        """*#WHO*WHERE*DIMENSION##"""
+        _where = str(where)
+        _frame = f"*#{who}*{_where}*{dimension}##"
+        if _where.isdecimal():
+            _where_fields = [_where]
+        else:
+            _where_fields = _split_where(_where) if _where else [None]
+            if _where_fields is None:
+                return cls(_frame)
+        return cls(
+            _frame,
+            (
+                "REQUEST",
+                "DIMENSION_REQUEST",
+                who,
+                None,
+                None,
+                _where_fields[0],
+                _where_fields[1:],
+                dimension,
+                None,
+                None,
+            ),
+        )
+
+    @classmethod
+    def _dimension_writing(
+        cls, who: int, where, dimension: int, values, dimension_param: tuple = ()
+    ) -> OWNCommand:
+        """*#WHO*WHERE*#DIMENSION[#P]*VAL1*VALn##"""
+        _where = str(where)
+        _dimension_param = [str(_param) for _param in dimension_param]
+        _values = [str(_value) for _value in values]
+        _frame = f"*#{who}*{_where}*#{'#'.join([str(dimension), *_dimension_param])}*{'*'.join(_values)}##"  # pylint: disable=line-too-long
+        if _where.isdecimal():
+            _where_fields = [_where]
+        else:
+            _where_fields = _split_where(_where) if _where else [None]
+            if _where_fields is None:
+                return cls(_frame)
+        for _param in _dimension_param:
+            if not _param.isdecimal():
+                return cls(_frame)
+        for _value in _values:
+            if _value and not _value.isdecimal():
+                return cls(_frame)
+        return cls(
+            _frame,
+            (
+                "COMMAND",
+                "DIMENSION_WRITING",
+                who,
+                None,
+                None,
+                _where_fields[0],
+                _where_fields[1:],
+                dimension,
+                _dimension_param,
+                _values,
+            ),
+        )
+
 
 class OWNLightingCommand(OWNCommand):
+    __slots__ = ()
+
     @classmethod
     def status(cls, where):
-        message = cls(f"*#1*{where}##")
-        message._human_readable_log = f"Requesting light or switch {message._where}{message._interface_log_text} status."
+        message = cls._status_request(1, where)
+        message._log_format = (
+            "Requesting light or switch {where}{interface} status.",
+            (),
+        )
         return message
 
     @classmethod
     def get_brightness(cls, where):
-        message = cls(f"*#1*{where}*1##")
-        message._human_readable_log = f"Requesting light {message._where}{message._interface_log_text} brightness."
+        message = cls._dimension_request(1, where, 1)
+        message._log_format = ("Requesting light {where}{interface} brightness.", ())
         return message
 
     @classmethod
     def get_pir_sensitivity(cls, where):
-        message = cls(f"*#1*{where}*5##")
-        message._human_readable_log = f"Requesting light/motion sensor {message._where}{message._interface_log_text} PIR sensitivity."
+        message = cls._dimension_request(1, where, 5)
+        message._log_format = (
+            "Requesting light/motion sensor {where}{interface} PIR sensitivity.",
+            (),
+        )
         return message
 
     @classmethod
     def get_illuminance(cls, where):
-        message = cls(f"*#1*{where}*6##")
-        message._human_readable_log = f"Requesting light/motion sensor {message._where}{message._interface_log_text} illuminance."
+        message = cls._dimension_request(1, where, 6)
+        message._log_format = (
+            "Requesting light/motion sensor {where}{interface} illuminance.",
+            (),
+        )
         return message
 
     @classmethod
     def get_motion_timeout(cls, where):
-        message = cls(f"*#1*{where}*7##")
-        message._human_readable_log = f"Requesting light/motion sensor {message._where}{message._interface_log_text} motion timeout."
+        message = cls._dimension_request(1, where, 7)
+        message._log_format = (
+            "Requesting light/motion sensor {where}{interface} motion timeout.",
+            (),
+        )
         return message
 
     @classmethod
@@ -1703,100 +2078,122 @@ class OWNLightingCommand(OWNCommand):
         else:
             _freqency = 0.5
         _what = int((_freqency / 0.5) + 19)
-        message = cls(f"*1*{_what}*{where}##")
-        message._human_readable_log = f"Flashing light {message._where}{message._interface_log_text} every {_freqency}s."
+        message = cls._status(1, _what, where)
+        message._log_format = (
+            "Flashing light {where}{interface} every {}s.",
+            (_freqency,),
+        )
         return message
 
     @classmethod
     def switch_on(cls, where, _transition=None):
         if _transition is not None and _transition >= 0 and _transition <= 255:
-            message = cls(f"*1*1#{_transition}*{where}##")
-            message._human_readable_log = f"Switching ON light {message._where}{message._interface_log_text} with transition speed {_transition}."
+            message = cls._status(1, 1, where, (_transition,))
+            message._log_format = (
+                "Switching ON light {where}{interface} with transition speed {}.",
+                (_transition,),
+            )
         else:
-            message = cls(f"*1*1*{where}##")
-            message._human_readable_log = f"Switching ON light or switch {message._where}{message._interface_log_text}."
+            message = cls._status(1, 1, where)
+            message._log_format = (
+                "Switching ON light or switch {where}{interface}.",
+                (),
+            )
         return message
 
     @classmethod
     def switch_off(cls, where, _transition=None):
         if _transition is not None and _transition >= 0 and _transition <= 255:
-            message = cls(f"*1*0#{_transition}*{where}##")
-            message._human_readable_log = f"Switching OFF light {message._where}{message._interface_log_text} with transition speed {_transition}."
+            message = cls._status(1, 0, where, (_transition,))
+            message._log_format = (
+                "Switching OFF light {where}{interface} with transition speed {}.",
+                (_transition,),
+            )
         else:
-            message = cls(f"*1*0*{where}##")
-            message._human_readable_log = f"Switching OFF light or switch {message._where}{message._interface_log_text}."
+            message = cls._status(1, 0, where)
+            message._log_format = (
+                "Switching OFF light or switch {where}{interface}.",
+                (),
+            )
         return message
 
     @classmethod
     def set_brightness(cls, where, _level=30, _transition=0):
         command_level = int(_level) + 100
         transition_speed = _transition if _transition >= 0 and _transition <= 255 else 0
-        message = cls(f"*#1*{where}*#1*{command_level}*{transition_speed}##")
-        message._human_readable_log = (
-            f"Setting light {message._where}{message._interface_log_text} brightness to {_level}% with transition speed {transition_speed}."  # pylint: disable=line-too-long
+        message = cls._dimension_writing(1, where, 1, (command_level, transition_speed))
+        message._log_format = (
+            (
+                "Setting light {where}{interface} brightness to {}% with transition speed {}.",  # pylint: disable=line-too-long
+                (_level, transition_speed),
+            )
             if transition_speed > 0
-            else f"Setting light {message._where}{message._interface_log_text} brightness to {_level}%."
+            else ("Setting light {where}{interface} brightness to {}%.", (_level,))
         )
         return message
 
 
 class OWNAutomationCommand(OWNCommand):
+    __slots__ = ()
+
     @classmethod
     def status(cls, where):
-        message = cls(f"*#2*{where}##")
-        message._human_readable_log = (
-            f"Requesting shutter {message._where}{message._interface_log_text} status."
-        )
+        message = cls._status_request(2, where)
+        message._log_format = ("Requesting shutter {where}{interface} status.", ())
         return message
 
     @classmethod
     def raise_shutter(cls, where):
-        message = cls(f"*2*1*{where}##")
-        message._human_readable_log = (
-            f"Raising shutter {message._where}{message._interface_log_text}."
-        )
+        message = cls._status(2, 1, where)
+        message._log_format = ("Raising shutter {where}{interface}.", ())
         return message
 
     @classmethod
     def lower_shutter(cls, where):
-        message = cls(f"*2*2*{where}##")
-        message._human_readable_log = (
-            f"Lowering shutter {message._where}{message._interface_log_text}."
-        )
+        message = cls._status(2, 2, where)
+        message._log_format = ("Lowering shutter {where}{interface}.", ())
         return message
 
     @classmethod
     def stop_shutter(cls, where):
-        message = cls(f"*2*0*{where}##")
-        message._human_readable_log = (
-            f"Stoping shutter {message._where}{message._interface_log_text}."
-        )
+        message = cls._status(2, 0, where)
+        message._log_format = ("Stoping shutter {where}{interface}.", ())
         return message
 
     @classmethod
     def set_shutter_level(cls, where, level=30):
-        message = cls(f"*#2*{where}*#11#001*{level}##")
-        message._human_readable_log = f"Setting shutter {message._where}{message._interface_log_text} position to {level}%."
+        message = cls._dimension_writing(2, where, 11, (level,), ("001",))
+        message._log_format = (
+            "Setting shutter {where}{interface} position to {}%.",
+            (level,),
+        )
         return message
 
 
 class OWNHeatingCommand(OWNCommand):
+    __slots__ = ()
+
     @classmethod
     def status(cls, where):
-        message = cls(f"*#4*{where}##")
-        message._human_readable_log = f"Requesting climate status update for {message._where}{message._interface_log_text}."
+        message = cls._status_request(4, where)
+        message._log_format = (
+            "Requesting climate status update for {where}{interface}.",
+            (),
+        )
         return message
 
     @classmethod
     def get_temperature(cls, where):
-        message = cls(f"*#4*{where}*0##")
-        message._human_readable_log = f"Requesting climate status update for {message._where}{message._interface_log_text}."
+        message = cls._dimension_request(4, where, 0)
+        message._log_format = (
+            "Requesting climate status update for {where}{interface}.",
+            (),
+        )
         return message
 
     @classmethod
     def set_mode(cls, where, mode: str, standalone=False):
-        central_local = re.compile(r"^#0#\d+$")
-        if central_local.match(str(where)):
+        if _CENTRAL_LOCAL_ZONE.match(str(where)):
             zone = where
             zone_name = f"zone {int(where.split('#')[-1])}"
         else:
@@ -1816,8 +2213,8 @@ class OWNHeatingCommand(OWNCommand):
         else:
             return None
 
-        message = cls(f"*4*{mode}*{zone}##")
-        message._human_readable_log = f"Setting {zone_name} mode to '{mode_name}'."
+        message = cls._status(4, mode, zone)
+        message._log_format = ("Setting {} mode to '{}'.", (zone_name, mode_name))
         return message
 
     @classmethod
@@ -1826,8 +2223,7 @@ class OWNHeatingCommand(OWNCommand):
 
     @classmethod
     def set_temperature(cls, where, temperature: float, mode: str, standalone=False):
-        central_local = re.compile(r"^#0#\d+$")
-        if central_local.match(str(where)):
+        if _CENTRAL_LOCAL_ZONE.match(str(where)):
             zone = where
             zone_name = f"zone {int(where.split('#')[-1])}"
         else:
@@ -1855,14 +2251,17 @@ class OWNHeatingCommand(OWNCommand):
         elif mode == CLIMATE_MODE_AUTO:
             mode = 3
 
-        message = cls(f"*#4*{zone}*#14*{temperature:04d}*{mode}##")
-        message._human_readable_log = (
-            f"Setting {zone_name} to {temperature_print}°C in mode '{mode_name}'."
+        message = cls._dimension_writing(4, zone, 14, (f"{temperature:04d}", mode))
+        message._log_format = (
+            "Setting {} to {}°C in mode '{}'.",
+            (zone_name, temperature_print, mode_name),
         )
         return message
 
 
 class OWNAVCommand(OWNCommand):
+    __slots__ = ()
+
     @classmethod
     def receive_video(cls, where):
         camera_id = where
@@ -1873,20 +2272,33 @@ class OWNAVCommand(OWNCommand):
         else:
             return None
 
-        message = cls(f"*7*0*{where}##")
-        message._human_readable_log = f"Opening video stream for camera {camera_id}."
+        message = cls._status(7, 0, where)
+        message._log_format = ("Opening video stream for camera {}.", (camera_id,))
         return message
 
     @classmethod
     def close_video(cls):
         message = cls("*7*9**##")
-        message._human_readable_log = "Closing video stream."
+        message._log_format = ("Closing video stream.", ())
         return message
 
 
 class OWNGatewayCommand(OWNCommand):
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = (
+        "_year",
+        "_month",
+        "_day",
+        "_hour",
+        "_minute",
+        "_second",
+        "_timezone",
+        "_time",
+        "_date",
+        "_datetime",
+    )
+
+    def __init__(self, data, tokens: Optional[tuple] = None):
+        super().__init__(data, tokens)
 
         self._year = None
         self._month = None
@@ -1916,9 +2328,6 @@ class OWNGatewayCommand(OWNCommand):
             self._time = datetime.time.fromisoformat(
                 f"{self._hour}:{self._minute}:{self._second}{self._timezone}"
             )
-            self._human_readable_log = (
-                f"Gateway broadcasting internal time: {self._time}."
-            )
 
         elif self._dimension == 1:
             self._year = self._dimension_value[3]
@@ -1927,9 +2336,6 @@ class OWNGatewayCommand(OWNCommand):
             self._date = datetime.date(
                 year=int(self._year), month=int(self._month), day=int(self._day)
             )
-            self._human_readable_log = (
-                f"Gateway broadcasting internal date: {self._date}."
-            )
 
         elif self._dimension == 22:
             self._hour = self._dimension_value[0]
@@ -1950,9 +2356,17 @@ class OWNGatewayCommand(OWNCommand):
             self._datetime = datetime.datetime.fromisoformat(
                 f"{self._year}-{self._month}-{self._day}*{self._hour}:{self._minute}:{self._second}{self._timezone}"  # pylint: disable=line-too-long
             )
-            self._human_readable_log = (
-                f"Gateway broadcasting internal datetime: {self._datetime}."
-            )
+
+    def _build_human_readable_log(self) -> str:
+        if self._log_format is not None:
+            return super()._build_human_readable_log()
+        elif self._dimension == 0:
+            return f"Gateway broadcasting internal time: {self._time}."
+        elif self._dimension == 1:
+            return f"Gateway broadcasting internal date: {self._date}."
+        elif self._dimension == 22:
+            return f"Gateway broadcasting internal datetime: {self._datetime}."
+        return str(self)
 
     @classmethod
     def set_datetime_to_now(cls, time_zone: str):
@@ -1963,18 +2377,27 @@ class OWNGatewayCommand(OWNCommand):
             if now.strftime("%z")[0] == "+"
             else f"1{now.strftime('%z')[1:3]}"
         )
-        message = cls(
-            f"*#13**#22*{now.strftime('%H*%M*%S')}*{timezone_offset}*0{now.strftime('%w*%d*%m*%Y##')}"  # pylint: disable=line-too-long
+        message = cls._dimension_writing(
+            13,
+            "",
+            22,
+            (
+                *now.strftime("%H*%M*%S").split("*"),
+                timezone_offset,
+                *f"0{now.strftime('%w*%d*%m*%Y')}".split("*"),
+            ),
         )
-        message._human_readable_log = f"Setting gateway time to: {message._datetime}."
+        message._log_format = ("Setting gateway time to: {}.", (message._datetime,))
         return message
 
     @classmethod
     def set_date_to_today(cls, time_zone: str):
         timezone = pytz.timezone(time_zone)
         now = timezone.localize(datetime.datetime.now())
-        message = cls(f"*#13**#1*0{now.strftime('%w*%d*%m*%Y##')}")
-        message._human_readable_log = f"Setting gateway date to: {message._date}."
+        message = cls._dimension_writing(
+            13, "", 1, f"0{now.strftime('%w*%d*%m*%Y')}".split("*")
+        )
+        message._log_format = ("Setting gateway date to: {}.", (message._date,))
         return message
 
     @classmethod
@@ -1986,18 +2409,25 @@ class OWNGatewayCommand(OWNCommand):
             if now.strftime("%z")[0] == "+"
             else f"1{now.strftime('%z')[1:3]}"
         )
-        message = cls(f"*#13**#0*{now.strftime('%H*%M*%S')}*{timezone_offset}*##")
-        message._human_readable_log = f"Setting gateway time to: {message._time}."
+        message = cls._dimension_writing(
+            13, "", 0, (*now.strftime("%H*%M*%S").split("*"), timezone_offset, "")
+        )
+        message._log_format = ("Setting gateway time to: {}.", (message._time,))
         return message
 
 
 class OWNEnergyCommand(OWNCommand):
+    __slots__ = ()
+
     @classmethod
     def start_sending_instant_power(cls, where, duration: int = 65):
         where = f"{where}#0" if str(where).startswith("7") else str(where)
         duration = 255 if duration > 255 else duration
-        message = cls(f"*#18*{where}*#1200#1*{duration}##")
-        message._human_readable_log = f"Requesting instant power draw update from sensor {where} for {duration} minutes."  # pylint: disable=line-too-long
+        message = cls._dimension_writing(18, where, 1200, (duration,), (1,))
+        message._log_format = (
+            "Requesting instant power draw update from sensor {} for {} minutes.",
+            (where, duration),
+        )
         return message
 
     @classmethod
@@ -2010,17 +2440,19 @@ class OWNEnergyCommand(OWNCommand):
         if date < one_year_ago:
             return None
         message = cls(f"*#18*{where}*511#{date.month}#{date.day}##")
-        message._human_readable_log = (
-            f"Requesting hourly power consumption from sensor {where} for {date}."
+        message._log_format = (
+            "Requesting hourly power consumption from sensor {} for {}.",
+            (where, date),
         )
         return message
 
     @classmethod
     def get_partial_daily_consumption(cls, where):
         where = f"{where}#0" if str(where).startswith("7") else str(where)
-        message = cls(f"*#18*{where}*54##")
-        message._human_readable_log = (
-            f"Requesting today's partial power consumption from sensor {where}."
+        message = cls._dimension_request(18, where, 54)
+        message._log_format = (
+            "Requesting today's partial power consumption from sensor {}.",
+            (where,),
         )
         return message
 
@@ -2034,20 +2466,24 @@ class OWNEnergyCommand(OWNCommand):
         if target > today:
             return None
         elif target > one_year_ago:
-            message = cls(f"*18*59#{month}*{where}##")
+            message = cls._status(18, 59, where, (month,))
         elif target > two_year_ago:
-            message = cls(f"*18*510#{month}*{where}##")
+            message = cls._status(18, 510, where, (month,))
         else:
             return None
-        message._human_readable_log = f"Requesting daily power consumption for {year}-{month} from sensor {where}."  # pylint: disable=line-too-long
+        message._log_format = (
+            "Requesting daily power consumption for {}-{} from sensor {}.",
+            (year, month, where),
+        )
         return message
 
     @classmethod
     def get_partial_monthly_consumption(cls, where):
         where = f"{where}#0" if str(where).startswith("7") else str(where)
-        message = cls(f"*#18*{where}*53##")
-        message._human_readable_log = (
-            f"Requesting this month's partial power consumption from sensor {where}."
+        message = cls._dimension_request(18, where, 53)
+        message._log_format = (
+            "Requesting this month's partial power consumption from sensor {}.",
+            (where,),
         )
         return message
 
@@ -2055,24 +2491,30 @@ class OWNEnergyCommand(OWNCommand):
     def get_monthly_consumption(cls, where, year, month):
         where = f"{where}#0" if str(where).startswith("7") else str(where)
         message = cls(f"*#18*{where}*52#{str(year)[2:]}#{month}##")
-        message._human_readable_log = f"Requesting monthly power consumption for {year}-{month} from sensor {where}."  # pylint: disable=line-too-long
+        message._log_format = (
+            "Requesting monthly power consumption for {}-{} from sensor {}.",
+            (year, month, where),
+        )
         return message
 
     @classmethod
     def get_total_consumption(cls, where):
         where = f"{where}#0" if str(where).startswith("7") else str(where)
-        message = cls(f"*#18*{where}*51##")
-        message._human_readable_log = (
-            f"Requesting total power consumption from sensor {where}."
+        message = cls._dimension_request(18, where, 51)
+        message._log_format = (
+            "Requesting total power consumption from sensor {}.",
+            (where,),
         )
         return message
 
 
 class OWNDryContactCommand(OWNCommand):
+    __slots__ = ()
+
     @classmethod
     def status(cls, where):
-        message = cls(f"*#25*{where}##")
-        message._human_readable_log = f"Requesting dry contact {where} status."
+        message = cls._status_request(25, where)
+        message._log_format = ("Requesting dry contact {} status.", (where,))
         return message
 
 
@@ -2082,41 +2524,39 @@ class OWNSignaling(OWNMessage):
     It is dedicated to signaling messages such as ACK or Authentication negotiation
     """
 
+    __slots__ = ("_type", "_nonce", "_sha_version")
+
     def __init__(self, data):  # pylint: disable=super-init-not-called
         self._raw = data
         self._family = None
         self._type = "UNKNOWN"
         self._human_readable_log = data
+        self._nonce = None
+        self._sha_version = None
 
         if self._ACK.match(self._raw):
-            self._match = self._ACK.match(self._raw)
             self._family = "SIGNALING"
             self._type = "ACK"
             self._human_readable_log = "ACK."
         elif self._NACK.match(self._raw):
-            self._match = self._NACK.match(self._raw)
             self._family = "SIGNALING"
             self._type = "NACK"
             self._human_readable_log = "NACK."
         elif self._NONCE.match(self._raw):
-            self._match = self._NONCE.match(self._raw)
+            self._nonce = self._NONCE.match(self._raw).group(1)
             self._family = "SIGNALING"
             self._type = "NONCE"
-            self._human_readable_log = (
-                f"Nonce challenge received: {self._match.group(1)}."
-            )
+            self._human_readable_log = f"Nonce challenge received: {self._nonce}."
         elif self._SHA.match(self._raw):
-            self._match = self._SHA.match(self._raw)
+            self._sha_version = self._SHA.match(self._raw).group(1)
             self._family = "SIGNALING"
-            self._type = f"SHA{'-1' if self._match.group(1) == '1' else '-256'}"
-            self._human_readable_log = f"SHA{'-1' if self._match.group(1) == '1' else '-256'} challenge received."  # pylint: disable=line-too-long
+            self._type = f"SHA{'-1' if self._sha_version == '1' else '-256'}"
+            self._human_readable_log = f"{self._type} challenge received."
         elif self._COMMAND_SESSION.match(self._raw):
-            self._match = self._COMMAND_SESSION.match(self._raw)
             self._family = "SIGNALING"
             self._type = "COMMAND_SESSION"
             self._human_readable_log = "Command session requested."
         elif self._EVENT_SESSION.match(self._raw):
-            self._match = self._EVENT_SESSION.match(self._raw)
             self._family = "SIGNALING"
             self._type = "EVENT_SESSION"
             self._human_readable_log = "Event session requested."
@@ -2124,18 +2564,12 @@ class OWNSignaling(OWNMessage):
     @property
     def nonce(self):
         """Return the authentication nonce IF the message is a nonce message"""
-        if self.is_nonce:  # pylint: disable=using-constant-test
-            return self._match.group(1)
-        else:
-            return None
+        return self._nonce
 
     @property
     def sha_version(self):
         """Return the authentication SHA version IF the message is a SHA challenge message"""
-        if self.is_sha:  # pylint: disable=using-constant-test
-            return self._match.group(1)
-        else:
-            return None
+        return self._sha_version
 
     def is_ack(self) -> bool:
         return self._type == "ACK"
@@ -2154,3 +2588,341 @@ class OWNSignaling(OWNMessage):
 
     def is_sha_256(self) -> bool:
         return self._type == "SHA-256"
+
+
+# Attributes built on first access, that shared messages still have to fill in
+_LAZY_ATTRIBUTES = ("_human_readable_log", "_event_content")
+
+
+def _set_lazy_attribute(self, name, value):
+    if name in _LAZY_ATTRIBUTES and getattr(self, name) is None:
+        object.__setattr__(self, name, value)
+    else:
+        _read_only(self, name)
+
+
+def _read_only(self, name, *args):
+    raise AttributeError(
+        f"'{type(self).__name__}' object is shared by the message cache, '{name}' is read-only"
+    )
+
+
+def _reduce_read_only(self, protocol):  # pylint: disable=unused-argument
+    """Pickle and copy a shared message as a writable message of its own class,
+    with the lists and dicts _freeze turned into tuples and mappings restored"""
+    _state = {}
+    for _base in type(self).__mro__:
+        for name in getattr(_base, "__slots__", ()):
+            if name.startswith("__") or not hasattr(self, name):
+                continue
+            value = getattr(self, name)
+            if type(value) is tuple:  # pylint: disable=unidiomatic-typecheck
+                value = list(value)
+            elif type(value) is MappingProxyType:  # pylint: disable=unidiomatic-typecheck
+                value = dict(value)
+            _state[name] = value
+    if "_event_content" in _state:
+        # Built again on first access, as a read-only mapping
+        _state["_event_content"] = None
+    return _restore, (type(self).__bases__[0], _state)
+
+
+def _restore(message_class: type, state: dict) -> OWNMessage:
+    message = message_class.__new__(message_class)
+    for name, value in state.items():
+        setattr(message, name, value)
+    return message
+
+
+_READ_ONLY_CLASSES = {}
+
+
+def _freeze(message: OWNMessage) -> OWNMessage:
+    """Make a message read-only so it can be shared by the message cache"""
+    for _base in type(message).__mro__:
+        for name in getattr(_base, "__slots__", ()):
+            value = getattr(message, name, None)
+            if type(value) is list:  # pylint: disable=unidiomatic-typecheck
+                setattr(message, name, tuple(value))
+            elif type(value) is dict:  # pylint: disable=unidiomatic-typecheck
+                setattr(message, name, MappingProxyType(value))
+
+    _class = type(message)
+    if _class not in _READ_ONLY_CLASSES:
+        _READ_ONLY_CLASSES[_class] = type(
+            _class.__name__,
+            (_class,),
+            {
+                "__slots__": (),
+                "__module__": _class.__module__,
+                "__qualname__": _class.__qualname__,
+                "__doc__": _class.__doc__,
+                "__setattr__": _set_lazy_attribute,
+                "__delattr__": _read_only,
+                "__reduce_ex__": _reduce_read_only,
+            },
+        )
+    message.__class__ = _READ_ONLY_CLASSES[_class]
+    return message
+
+
+class OWNMessageCache:
+    """
+    Bounded LRU cache of parsed messages, keyed by raw frame.
+    Messages returned from the cache are shared and read-only:
+    their list and dict attributes are exposed as tuples and read-only mappings.
+    Messages whose parsing depends on the clock are never cached.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        if max_size < 1:
+            raise ValueError("The message cache must hold at least one message.")
+        self._max_size = max_size
+        self._messages = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def parse(self, data) -> Optional[OWNMessage]:
+        """Same as OWNMessage.parse, returning the cached message for known frames"""
+        return self._get(data, OWNMessage._parse)  # pylint: disable=protected-access
+
+    def parse_bytes(self, data) -> Optional[OWNMessage]:
+        """Same as OWNMessage.parse_bytes, returning the cached message for known frames"""
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        return self._get(data, OWNMessage._parse_bytes)  # pylint: disable=protected-access
+
+    def _get(self, data, parser) -> Optional[OWNMessage]:
+        try:
+            message = self._messages[data]
+        except KeyError:
+            pass
+        else:
+            self._hits += 1
+            self._messages.move_to_end(data)
+            return message
+
+        self._misses += 1
+        message = parser(data)
+        if (
+            message is not None and message._is_cacheable()
+        ):  # pylint: disable=protected-access
+            self._messages[data] = _freeze(message)
+            if len(self._messages) > self._max_size:
+                self._messages.popitem(last=False)
+                self._evictions += 1
+        return message
+
+    def clear(self) -> None:
+        self._messages.clear()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        return len(self._messages)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+
+class OWNFrameCache:
+    """
+    Bounded LRU cache of rendered command frames, keyed by (command, where, params).
+    The command is a builder such as OWNLightingCommand.switch_on, it is only
+    called on a miss and the frame of the command it returns is kept as bytes,
+    ready to be written to a command session.
+    Builders whose frame depends on the clock, such as
+    OWNGatewayCommand.set_time_to_now, must not be used with the cache.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        if max_size < 1:
+            raise ValueError("The frame cache must hold at least one frame.")
+        self._max_size = max_size
+        self._frames = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def frame(self, command, where, *params) -> bytes:
+        """The frame of command(where, *params)"""
+        _key = (command, where, params)
+        try:
+            frame = self._frames[_key]
+        except KeyError:
+            pass
+        else:
+            self._hits += 1
+            self._frames.move_to_end(_key)
+            return frame
+
+        self._misses += 1
+        frame = bytes(command(where, *params))
+        self._frames[_key] = frame
+        if len(self._frames) > self._max_size:
+            self._frames.popitem(last=False)
+            self._evictions += 1
+        return frame
+
+    def clear(self) -> None:
+        self._frames.clear()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        return len(self._frames)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+
+class FrameSplitter:
+    """
+    Incremental splitter of a byte stream into `##` terminated frames.
+    Feed it chunks of any size, the trailing partial frame of a chunk is kept
+    and completed by the next one.
+    """
+
+    SEPARATOR = b"##"
+
+    def __init__(self):
+        self._remainder = b""
+
+    def split(self, chunk) -> list:
+        """Complete frames (bytes) found in the pending data and this chunk"""
+        data = self._remainder + chunk if self._remainder else bytes(chunk)
+        frames = []
+        start = 0
+        end = data.find(self.SEPARATOR)
+        while end >= 0:
+            end += 2
+            frames.append(data[start:end])
+            start = end
+            end = data.find(self.SEPARATOR, start)
+        self._remainder = data[start:]
+        return frames
+
+    def parse(self, chunk) -> list:
+        """Messages parsed from the complete frames, invalid frames are left out"""
+        messages = []
+        for frame in self.split(chunk):
+            message = OWNMessage.parse_bytes(frame)
+            if message is not None:
+                messages.append(message)
+        return messages
+
+    def clear(self) -> None:
+        self._remainder = b""
+
+    @property
+    def remainder(self) -> bytes:
+        """The partial frame waiting for the next chunk"""
+        return self._remainder
+
+
+_EVENT_CLASSES = {
+    0: OWNScenarioEvent,
+    1: OWNLightingEvent,
+    2: OWNAutomationEvent,
+    4: OWNHeatingEvent,
+    5: OWNAlarmEvent,
+    9: OWNAuxEvent,
+    13: OWNGatewayEvent,
+    15: OWNCENEvent,
+    17: OWNSceneEvent,
+    18: OWNEnergyEvent,
+}
+_EVENT_CLASSES_BY_WHERE = {
+    25: {"2": OWNCENPlusEvent, "3": OWNDryContactEvent},
+}
+
+# OWNCommand stands for the class parse() was invoked on
+_COMMAND_CLASSES = {
+    0: OWNCommand,
+    1: OWNLightingCommand,
+    2: OWNAutomationCommand,
+    3: OWNCommand,  # Charges / Loads ?
+    4: OWNHeatingCommand,
+    5: OWNCommand,
+    6: OWNCommand,  # VDES
+    7: OWNCommand,
+    9: OWNCommand,
+    13: OWNGatewayCommand,
+    14: OWNCommand,
+    15: OWNCommand,
+    16: OWNCommand,
+    17: OWNCommand,
+    18: OWNEnergyCommand,
+    22: OWNCommand,
+    24: OWNCommand,
+}
+_COMMAND_CLASSES_BY_WHERE = {
+    25: {"2": OWNCommand, "3": OWNDryContactCommand},
+}
+
+
+class _LazyClass:
+    """Stands for a registered 'module:Class' until a message needs it"""
+
+    __slots__ = ("_path", "_table", "_key")
+
+    def __init__(self, path: str, table: dict, key):
+        self._path = path
+        self._table = table
+        self._key = key
+
+    def __call__(self, data, tokens: Optional[tuple] = None) -> OWNMessage:
+        _module, _, _name = self._path.partition(":")
+        _class = getattr(importlib.import_module(_module), _name)
+        if self._table.get(self._key) is self:
+            self._table[self._key] = _class
+        return _class(data, tokens)
+
+    def __repr__(self) -> str:
+        return f"_LazyClass({self._path!r})"
+
+
+def _register_class(
+    classes: dict, classes_by_where: dict, who: int, message_class, where
+) -> None:
+    if where is None:
+        _table = classes
+        _key = who
+        classes_by_where.pop(who, None)
+    else:
+        if who in classes:
+            raise ValueError(
+                f"WHO {who} messages are all parsed as {classes[who]!r}, not by WHERE."
+            )
+        _table = classes_by_where.setdefault(who, {})
+        _key = str(where)
+    if isinstance(message_class, str):
+        if ":" not in message_class:
+            raise ValueError(f"Expected a 'module:Class' path, got {message_class!r}.")
+        message_class = _LazyClass(message_class, _table, _key)
+    _table[_key] = message_class
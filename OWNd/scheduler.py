@@ -0,0 +1,178 @@
+""" This module contains a priority scheduler in front of command sessions """
+
+from __future__ import annotations
+
+import asyncio
+import collections
+from typing import Optional
+
+# Priority classes, most urgent first
+PRIORITY_ALARM = 0
+PRIORITY_INTERACTIVE = 1
+PRIORITY_STATUS = 2
+PRIORITY_BULK = 3
+PRIORITY_NAMES = ("alarm", "interactive", "status", "bulk")
+
+# Priority classes the reserved workers are kept for
+_FOREGROUND = (PRIORITY_ALARM, PRIORITY_INTERACTIVE)
+
+DEFAULT_QUEUE_SIZES = (64, 64, 256, 1024)
+
+
+class OWNCommandScheduler:
+    """
+    Priority scheduler in front of a command session, or of an OWNCommandPool.
+    Commands are queued by priority class in bounded queues, and sent by
+    `capacity` workers, most urgent class first. `reserved` workers only send
+    alarm and interactive commands, so that status refreshes and energy
+    history fill the idle capacity without delaying them.
+    A command waiting for more than `max_wait` seconds is sent before more
+    urgent ones, so that no class is starved.
+    """
+
+    def __init__(
+        self,
+        target,
+        capacity: int = 1,
+        reserved: Optional[int] = None,
+        queue_sizes: tuple = DEFAULT_QUEUE_SIZES,
+        max_wait: float = 10.0,
+    ):
+        if capacity < 1:
+            raise ValueError("The scheduler needs at least one worker.")
+        if reserved is None:
+            reserved = 1 if capacity > 1 else 0
+        if not 0 <= reserved < capacity:
+            raise ValueError("Some workers must be left for background commands.")
+        if len(queue_sizes) != len(PRIORITY_NAMES) or min(queue_sizes) < 1:
+            raise ValueError(
+                f"Expected a queue size of at least 1 for each of {PRIORITY_NAMES}."
+            )
+        self._target = target
+        self._capacity = capacity
+        self._reserved = reserved
+        self._queue_sizes = tuple(queue_sizes)
+        self._max_wait = max_wait
+        self._queues = tuple(collections.deque() for _ in PRIORITY_NAMES)
+        self._condition = None
+        self._workers = []
+        self._stopped = False
+        self._sent = [0] * len(PRIORITY_NAMES)
+        self._total_wait = [0.0] * len(PRIORITY_NAMES)
+        self._max_waited = [0.0] * len(PRIORITY_NAMES)
+        self._starved = [0] * len(PRIORITY_NAMES)
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._stopped = False
+        self._condition = asyncio.Condition()
+        self._workers = [
+            asyncio.create_task(self._work(_worker < self._reserved))
+            for _worker in range(self._capacity)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the workers, commands still queued are cancelled, and sends waiting
+        for room in a queue raise RuntimeError"""
+        self._stopped = True
+        for _worker in self._workers:
+            _worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for _queue in self._queues:
+            while _queue:
+                _queue.popleft()[3].cancel()
+        if self._condition is not None:
+            async with self._condition:
+                self._condition.notify_all()
+
+    async def send(self, message, priority: int = PRIORITY_INTERACTIVE):
+        """Queue the message, waiting for room in its class queue, then wait for
+        it to be sent. Returns what the session's send returned"""
+        if not self._workers:
+            raise RuntimeError("The scheduler is not started.")
+        _loop = asyncio.get_running_loop()
+        _queue = self._queues[priority]
+        future = _loop.create_future()
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self._stopped or len(_queue) < self._queue_sizes[priority]
+            )
+            if self._stopped:
+                raise RuntimeError("The scheduler is stopped.")
+            _queue.append((message, priority, _loop.time(), future))
+            self._condition.notify_all()
+        return await future
+
+    def _next(self, foreground_only: bool) -> Optional[int]:
+        """Priority class to send from next, None if there is nothing to send"""
+        _priorities = _FOREGROUND if foreground_only else range(len(PRIORITY_NAMES))
+        _now = asyncio.get_running_loop().time()
+        _next = None
+        for _priority in _priorities:
+            _queue = self._queues[_priority]
+            if not _queue:
+                continue
+            if _now - _queue[0][2] > self._max_wait:
+                return _priority
+            if _next is None:
+                _next = _priority
+        return _next
+
+    async def _work(self, foreground_only: bool) -> None:
+        _loop = asyncio.get_running_loop()
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(
+                    lambda: self._next(foreground_only) is not None
+                )
+                _priority = self._next(foreground_only)
+                if any(self._queues[:_priority]):
+                    # Sent ahead of more urgent commands, it waited too long
+                    self._starved[_priority] += 1
+                message, priority, queued, future = self._queues[_priority].popleft()
+                self._condition.notify_all()
+
+            if future.done():
+                continue
+            _wait = _loop.time() - queued
+            self._sent[priority] += 1
+            self._total_wait[priority] += _wait
+            self._max_waited[priority] = max(self._max_waited[priority], _wait)
+            try:
+                result = await self._target.send(
+                    message, is_status_request=priority >= PRIORITY_STATUS
+                )
+                if asyncio.isfuture(result):
+                    result = await result
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as error:  # pylint: disable=broad-except
+                future.set_exception(error)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+    def depth(self, priority: int) -> int:
+        """Number of commands of a priority class waiting to be sent"""
+        return len(self._queues[priority])
+
+    @property
+    def metrics(self) -> dict:
+        """Queue depth, commands sent and their wait in queue, per priority class"""
+        return {
+            _name: {
+                "depth": len(self._queues[_priority]),
+                "sent": self._sent[_priority],
+                "mean_wait": (
+                    self._total_wait[_priority] / self._sent[_priority]
+                    if self._sent[_priority]
+                    else 0.0
+                ),
+                "max_wait": self._max_waited[_priority],
+                "starved": self._starved[_priority],
+            }
+            for _priority, _name in enumerate(PRIORITY_NAMES)
+        }
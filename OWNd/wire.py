@@ -0,0 +1,364 @@
+""" This module contains a compact binary encoding of OpenWebNet messages """
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from .message import OWNCommand, OWNEvent, OWNMessage, OWNSignaling
+
+MAGIC = b"OWN"
+VERSION = 1
+
+# Message kinds, the family of a STATUS message follows from its WHAT
+STATUS = 0
+STATUS_REQUEST = 1
+DIMENSION_REQUEST = 2
+DIMENSION_REQUEST_REPLY = 3
+DIMENSION_WRITING = 4
+# Frame stored as is: signaling, invalid frames and frames the fields can't render back
+RAW = 5
+
+_KINDS = {
+    "STATUS": STATUS,
+    "STATUS_REQUEST": STATUS_REQUEST,
+    "DIMENSION_REQUEST": DIMENSION_REQUEST,
+    "DIMENSION_REQUEST_REPLY": DIMENSION_REQUEST_REPLY,
+    "DIMENSION_WRITING": DIMENSION_WRITING,
+}
+
+# Flags
+COMMAND = 0x01  # built as a command, rather than parsed as an event
+NO_WHERE = 0x02  # dimension request or writing without a WHERE
+PARAMS = 0x04  # the WHAT or dimension has parameters
+
+
+class WireFormatError(ValueError):
+    """Raised when decoding data that isn't a valid encoded batch"""
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _write_text(buffer: bytearray, text: str) -> None:
+    _data = text.encode("ascii")
+    if len(_data) < 0x80:
+        buffer.append(len(_data))
+    else:
+        _write_varint(buffer, len(_data))
+    buffer += _data
+
+
+def _read_varint(data: bytes, position: int) -> tuple:
+    """(value, next position) of the varint at position"""
+    value = 0
+    shift = 0
+    while True:
+        try:
+            _byte = data[position]
+        except IndexError:
+            raise WireFormatError("Truncated OWNd batch.") from None
+        position += 1
+        value |= (_byte & 0x7F) << shift
+        if _byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _read_text(data: bytes, position: int) -> tuple:
+    """(text, next position) of the length prefixed text at position"""
+    length, position = _read_varint(data, position)
+    _end = position + length
+    if _end > len(data):
+        raise WireFormatError("Truncated OWNd batch.")
+    return data[position:_end].decode("ascii"), _end
+
+
+def _where_text(where, where_param: list) -> str:
+    return "#".join([where, *where_param]) if where_param else where
+
+
+def _render(tokens: tuple) -> str:
+    """Frame of a message from its fields, in the form the tokenizer reads"""
+    (
+        _,
+        message_type,
+        who,
+        what,
+        what_param,
+        where,
+        where_param,
+        dimension,
+        dimension_param,
+        values,
+    ) = tokens
+    _where = "" if where is None else _where_text(where, where_param)
+    if message_type == "STATUS":
+        return f"*{who}*{'#'.join([str(what), *what_param])}*{_where}##"
+    if message_type == "STATUS_REQUEST":
+        return f"*#{who}*{_where}##"
+    if message_type == "DIMENSION_REQUEST":
+        return f"*#{who}*{_where}*{dimension}##"
+    _dimension = "#".join([str(dimension), *dimension_param])
+    if message_type == "DIMENSION_WRITING":
+        _dimension = f"#{_dimension}"
+    return f"*#{who}*{_where}*{_dimension}*{'*'.join(values)}##"
+
+
+def _message_tokens(message: OWNMessage) -> tuple:
+    # pylint: disable=protected-access
+    return (
+        message._family,
+        message._message_type,
+        message._who,
+        message._what,
+        message._what_param,
+        message._where,
+        message._where_param,
+        message._dimension,
+        message._dimension_param,
+        message._dimension_value,
+    )
+
+
+def encode_batch(messages: Iterable[OWNMessage]) -> bytes:
+    """
+    Encode messages to a versioned binary batch:
+    MAGIC, VERSION, the WHERE dictionary, then one record per message.
+    A record is a header of kind, flags and WHO (varint), then the varint WHAT or
+    dimension, its parameters, the WHERE index and the dimension values.
+    Texts (WHEREs, parameters, values and raw frames) are length prefixed.
+    """
+    _wheres = {}
+    _body = bytearray()
+    _count = 0
+
+    for message in messages:
+        _count += 1
+        _frame = str(message)
+        _flags = COMMAND if isinstance(message, OWNCommand) else 0
+        _tokens = (
+            None
+            if isinstance(message, OWNSignaling) or not message.is_valid
+            else _message_tokens(message)
+        )
+        if _tokens is None or _render(_tokens) != _frame:
+            _body.append(RAW)
+            _body.append(_flags)
+            _write_text(_body, _frame)
+            continue
+
+        (
+            _,
+            message_type,
+            who,
+            what,
+            what_param,
+            where,
+            where_param,
+            dimension,
+            dimension_param,
+            values,
+        ) = _tokens
+        _number = what if what is not None else dimension
+        _params = what_param if what is not None else dimension_param
+        if _params:
+            _flags |= PARAMS
+        if where is None:
+            _flags |= NO_WHERE
+
+        _body.append(_KINDS[message_type])
+        _body.append(_flags)
+        if who < 0x80:
+            _body.append(who)
+        else:
+            _write_varint(_body, who)
+        if _number is not None:
+            if _number < 0x80:
+                _body.append(_number)
+            else:
+                _write_varint(_body, _number)
+        if _params:
+            _write_text(_body, "#".join(_params))
+        if where is not None:
+            _where = _where_text(where, where_param)
+            _where_id = _wheres.get(_where)
+            if _where_id is None:
+                _where_id = _wheres[_where] = len(_wheres)
+            if _where_id < 0x80:
+                _body.append(_where_id)
+            else:
+                _write_varint(_body, _where_id)
+        if values is not None:
+            _write_text(_body, "*".join(values))
+
+    _data = bytearray(MAGIC)
+    _data.append(VERSION)
+    _write_varint(_data, len(_wheres))
+    for _where in _wheres:
+        _write_text(_data, _where)
+    _write_varint(_data, _count)
+    _data += _body
+    return bytes(_data)
+
+
+def _split_where_text(where: str) -> tuple:
+    if where[:1] == "#":
+        _fields = where[1:].split("#")
+        return f"#{_fields[0]}", _fields[1:]
+    _fields = where.split("#")
+    return _fields[0], _fields[1:]
+
+
+def decode_batch(data) -> list:
+    """Messages of a batch made by encode_batch, in order"""
+    data = bytes(data)
+    _start = len(MAGIC) + 1
+    if len(data) < _start or data[: len(MAGIC)] != MAGIC:
+        raise WireFormatError("Not an OWNd batch.")
+    if data[len(MAGIC)] != VERSION:
+        raise WireFormatError(f"Unsupported OWNd batch version {data[len(MAGIC)]}.")
+
+    _wheres = []
+    _size, _position = _read_varint(data, _start)
+    for _ in range(_size):
+        _where, _position = _read_text(data, _position)
+        _wheres.append(_split_where_text(_where))
+    _count, _position = _read_varint(data, _position)
+    messages = []
+
+    try:
+        for _ in range(_count):
+            _kind = data[_position]
+            _flags = data[_position + 1]
+            _position += 2
+            _parser = OWNCommand.parse if _flags & COMMAND else None
+
+            if _kind == RAW:
+                _frame, _position = _read_text(data, _position)
+                messages.append((_parser or OWNMessage.parse)(_frame))
+                continue
+            if _kind > DIMENSION_WRITING:
+                raise WireFormatError(f"Unknown message kind {_kind}.")
+
+            _who = data[_position]
+            if _who < 0x80:
+                _position += 1
+            else:
+                _who, _position = _read_varint(data, _position)
+            _number = None
+            if _kind != STATUS_REQUEST:
+                _number = data[_position]
+                if _number < 0x80:
+                    _position += 1
+                else:
+                    _number, _position = _read_varint(data, _position)
+            _params = []
+            if _flags & PARAMS:
+                _params, _position = _read_text(data, _position)
+                _params = _params.split("#")
+            if _flags & NO_WHERE:
+                _where, _where_param = None, []
+            else:
+                _where_id = data[_position]
+                if _where_id < 0x80:
+                    _position += 1
+                else:
+                    _where_id, _position = _read_varint(data, _position)
+                _where, _where_param = _wheres[_where_id]
+                _where_param = list(_where_param)
+            _values = None
+            if _kind >= DIMENSION_REQUEST_REPLY:
+                _values, _position = _read_text(data, _position)
+                _values = _values.split("*")
+
+            if _kind == STATUS:
+                _tokens = (
+                    "COMMAND_TRANSLATION" if _number == 1000 else "EVENT",
+                    "STATUS",
+                    _who,
+                    _number,
+                    _params,
+                    _where,
+                    _where_param,
+                    None,
+                    None,
+                    None,
+                )
+            elif _kind == STATUS_REQUEST:
+                _tokens = (
+                    "REQUEST",
+                    "STATUS_REQUEST",
+                    _who,
+                    None,
+                    None,
+                    _where,
+                    _where_param,
+                    None,
+                    None,
+                    None,
+                )
+            elif _kind == DIMENSION_REQUEST:
+                _tokens = (
+                    "REQUEST",
+                    "DIMENSION_REQUEST",
+                    _who,
+                    None,
+                    None,
+                    _where,
+                    _where_param,
+                    _number,
+                    None,
+                    None,
+                )
+            elif _kind == DIMENSION_REQUEST_REPLY:
+                _tokens = (
+                    "EVENT",
+                    "DIMENSION_REQUEST_REPLY",
+                    _who,
+                    None,
+                    None,
+                    _where,
+                    _where_param,
+                    _number,
+                    _params,
+                    _values,
+                )
+            else:
+                _tokens = (
+                    "COMMAND",
+                    "DIMENSION_WRITING",
+                    _who,
+                    None,
+                    None,
+                    _where,
+                    _where_param,
+                    _number,
+                    _params,
+                    _values,
+                )
+
+            if _parser is None:
+                _parser = (
+                    OWNEvent.parse
+                    if _kind in (STATUS, DIMENSION_REQUEST_REPLY)
+                    else OWNCommand.parse
+                )
+            messages.append(_parser(_render(_tokens), _tokens))
+    except IndexError:
+        raise WireFormatError("Truncated OWNd batch.") from None
+
+    if _position != len(data):
+        raise WireFormatError("Trailing data after OWNd batch.")
+    return messages
+
+
+def encode(message: OWNMessage) -> bytes:
+    return encode_batch((message,))
+
+
+def decode(data) -> OWNMessage:
+    return decode_batch(data)[0]
@@ -0,0 +1,89 @@
+""" Shared fixtures of the tests """
+
+import asyncio
+
+import pytest
+
+from OWNd.connection import OWNGateway, OWNSession
+
+
+class FakeGateway:
+    """
+    Local server standing for a gateway. Each frame it reads is passed to
+    `answer`, a function or coroutine function returning the frames to write
+    back, None to drop the connection instead. The frames read are kept in
+    `frames`. The next `refusals` sessions fail to connect.
+    Event sessions are sent frames with push, and disconnected with drop.
+    """
+
+    def __init__(self, answer, model_name: str = "F454"):
+        self.answer = answer
+        self.model_name = model_name
+        self.frames = []
+        self.connections = 0
+        self.refusals = 0
+        self._server = None
+        self._writers = []
+
+    async def start(self) -> OWNGateway:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        _port = self._server.sockets[0].getsockname()[1]
+        _GATEWAYS[_port] = self
+        return OWNGateway(
+            {"address": "127.0.0.1", "port": _port, "modelName": self.model_name}
+        )
+
+    async def stop(self) -> None:
+        self._server.close()
+
+    async def push(self, data: bytes) -> None:
+        """Write data to the latest connection, once there is one"""
+        while not self._writers:
+            await asyncio.sleep(0.001)
+        self._writers[-1].write(data)
+        await self._writers[-1].drain()
+
+    def drop(self) -> None:
+        """Close the connections"""
+        for writer in self._writers:
+            writer.close()
+        self._writers.clear()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self._writers.append(writer)
+        try:
+            while True:
+                frame = (await reader.readuntil(b"##")).decode()
+                self.frames.append(frame)
+                replies = self.answer(frame)
+                if asyncio.iscoroutine(replies):
+                    replies = await replies
+                if replies is None:
+                    writer.close()
+                    return
+                for reply in replies:
+                    writer.write(reply.encode())
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+
+_GATEWAYS = {}
+
+
+@pytest.fixture(autouse=True)
+def fake_connect(monkeypatch):
+    """Sessions to a FakeGateway connect without authentication"""
+
+    async def connect(self):
+        gateway = _GATEWAYS[self._gateway.port]
+        if gateway.refusals:
+            gateway.refusals -= 1
+            return None
+        self._stream_reader, self._stream_writer = await asyncio.open_connection(
+            "127.0.0.1", self._gateway.port
+        )
+        return {"Success": True, "Message": None}
+
+    monkeypatch.setattr(OWNSession, "connect", connect)
@@ -0,0 +1,15 @@
+""" Tests of the WHERE addresses """
+
+from OWNd import address
+from OWNd.address import WhereAddress
+
+
+def test_intern_table_is_bounded():
+    first = WhereAddress(1, "12")
+    for where in range(address.MAX_INTERNED_ADDRESSES + 10):
+        WhereAddress(18, f"7{where}#0")
+    assert len(WhereAddress._interned) <= address.MAX_INTERNED_ADDRESSES
+    again = WhereAddress(1, "12")
+    assert again is not first
+    assert again == first and hash(again) == hash(first)
+    assert WhereAddress(1, "12") is WhereAddress(1, "12")
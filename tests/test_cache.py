@@ -0,0 +1,20 @@
+""" Tests of the message cache """
+
+import copy
+import pickle
+
+from OWNd.message import OWNLightingEvent, OWNMessageCache
+
+
+def test_cached_messages_pickle_and_copy():
+    cache = OWNMessageCache()
+    cache.parse("*1*1*12##")
+    message = cache.parse("*#1*12*1*150*0##")
+    message.event_content  # pylint: disable=pointless-statement
+    for duplicate in (pickle.loads(pickle.dumps(message)), copy.copy(message)):
+        assert type(duplicate) is OWNLightingEvent
+        assert str(duplicate) == str(message)
+        assert duplicate.brightness == message.brightness
+        assert duplicate.event_content.keys() == message.event_content.keys()
+        # A writable message again, with its lists back
+        assert duplicate.to_dict()["dimension values"] == ["150", "0"]
@@ -0,0 +1,83 @@
+""" Tests of the command coalescer """
+
+import asyncio
+
+from OWNd.coalescing import OWNCommandCoalescer
+from OWNd.message import CLIMATE_MODE_HEAT, OWNHeatingCommand, OWNLightingCommand
+
+
+class _Target:
+    def __init__(self):
+        self.frames = []
+
+    async def send(self, message, is_status_request=False):
+        self.frames.append(str(message))
+        return True
+
+
+def _run(commands):
+    async def _send_all():
+        target = _Target()
+        coalescer = OWNCommandCoalescer(target, window=0.05)
+        tasks = []
+        for command in commands:
+            tasks.append(asyncio.create_task(coalescer.send(command)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        return target.frames, coalescer
+
+    return asyncio.run(_send_all())
+
+
+def test_latest_writing_wins():
+    frames, coalescer = _run(
+        [
+            OWNLightingCommand.set_brightness("12", 10),
+            OWNLightingCommand.set_brightness("12", 50),
+        ]
+    )
+    assert frames == ["*#1*12*#1*150*0##"]
+    assert (coalescer.sent, coalescer.coalesced, coalescer.dropped) == (1, 1, 1)
+
+
+def test_general_area_and_group_commands_keep_order():
+    for where in ("0", "3", "#1"):
+        frames, _ = _run(
+            [
+                OWNLightingCommand.set_brightness("31", 50),
+                OWNLightingCommand.switch_off(where),
+            ]
+        )
+        assert frames == ["*#1*31*#1*150*0##", f"*1*0*{where}##"]
+
+
+def test_point_command_after_group_writing_keeps_order():
+    frames, _ = _run(
+        [
+            OWNLightingCommand.set_brightness("#1", 50),
+            OWNLightingCommand.switch_off("12"),
+        ]
+    )
+    assert frames == ["*#1*#1*#1*150*0##", "*1*0*12##"]
+
+
+def test_heating_central_commands_keep_order():
+    frames, _ = _run(
+        [
+            OWNHeatingCommand.set_temperature("1", 21, CLIMATE_MODE_HEAT),
+            OWNHeatingCommand.turn_off("#0"),
+        ]
+    )
+    assert frames == ["*#4*#1*#14*0210*1##", "*4*303*#0##"]
+
+
+def test_heating_zone_commands_keep_order():
+    frames, coalescer = _run(
+        [
+            OWNHeatingCommand.set_temperature("1", 21, CLIMATE_MODE_HEAT),
+            OWNHeatingCommand.set_temperature("2", 19, CLIMATE_MODE_HEAT),
+            OWNHeatingCommand.turn_off("1"),
+        ]
+    )
+    assert frames[:2] == ["*#4*#1*#14*0210*1##", "*4*303*#1##"]
+    assert coalescer.pending == 0
@@ -0,0 +1,223 @@
+""" Tests of the command sessions """
+
+import asyncio
+import logging
+
+from conftest import FakeGateway
+
+import pytest
+
+from OWNd.connection import (
+    OWNCommandPool,
+    OWNCommandSession,
+    OWNPipelinedCommandSession,
+)
+
+ACK = "*#*1##"
+NACK = "*#*0##"
+
+_LOGGER = logging.getLogger("tests")
+
+
+async def _session(gateway, **kwargs) -> OWNPipelinedCommandSession:
+    session = OWNPipelinedCommandSession(gateway, _LOGGER, **kwargs)
+    await session.connect()
+    return session
+
+
+def test_pipelined_fifo_ack_and_nack():
+    async def _run():
+        fake = FakeGateway(lambda frame: [NACK if frame == "*1*1*99##" else ACK])
+        session = await _session(await fake.start(), depth=4)
+        futures = [
+            await session.send(frame)
+            for frame in ("*1*1*11##", "*1*1*99##", "*1*1*13##", "*2*1*21##")
+        ]
+        results = await asyncio.gather(*futures)
+        await session.close()
+        await fake.stop()
+        return results, fake.frames
+
+    results, frames = asyncio.run(_run())
+    assert results == [True, False, True, True]
+    # Written again twice after its NACK, then given up
+    assert frames.count("*1*1*99##") == 3
+
+
+def test_pipelined_status_replies_belong_to_oldest_frame():
+    def _answer(frame):
+        if frame == "*#1*12##":
+            return ["*1*1*12##", "*#1*12*1*150*0##", ACK]
+        return [ACK]
+
+    async def _run():
+        fake = FakeGateway(_answer)
+        session = await _session(await fake.start(), depth=4)
+        status = await session.send("*#1*12##", is_status_request=True)
+        command = await session.send("*1*0*13##")
+        results = await asyncio.gather(status, command)
+        await session.close()
+        await fake.stop()
+        return results
+
+    assert asyncio.run(_run()) == [True, True]
+
+
+def test_pipelined_nack_retry_keeps_device_order():
+    """A NACKed switch_on written again must not overtake the next switch_off"""
+    state = {}
+    nacked = set()
+
+    def _answer(frame):
+        if frame not in nacked:
+            nacked.add(frame)
+            return [NACK]
+        what, where = frame[1:-2].split("*")[1:]
+        state[where] = what
+        return [ACK]
+
+    async def _run():
+        fake = FakeGateway(_answer)
+        session = await _session(await fake.start(), depth=4)
+        futures = [
+            await session.send(frame)
+            for frame in ("*1*1*12##", "*1*0*12##", "*1*1*13##")
+        ]
+        results = await asyncio.gather(*futures)
+        await session.close()
+        await fake.stop()
+        return results, fake.frames
+
+    results, frames = asyncio.run(_run())
+    assert results == [True, True, True]
+    assert state == {"12": "0", "13": "1"}
+    assert frames.index("*1*0*12##") > max(
+        _index for _index, _frame in enumerate(frames) if _frame == "*1*1*12##"
+    )
+
+
+def test_pipelined_reconnection_writes_frames_in_flight_again():
+    dropped = []
+
+    def _answer(frame):
+        if frame == "*1*1*12##" and not dropped:
+            dropped.append(frame)
+            return None
+        return [ACK]
+
+    async def _run():
+        fake = FakeGateway(_answer)
+        session = await _session(await fake.start(), depth=4)
+        futures = [await session.send(frame) for frame in ("*1*1*11##", "*1*1*12##")]
+        results = await asyncio.gather(*futures)
+        connected = session.is_connected
+        await session.close()
+        await fake.stop()
+        return results, connected, fake.connections
+
+    results, connected, connections = asyncio.run(_run())
+    assert results == [True, True]
+    assert connected
+    assert connections == 2
+
+
+def test_pipelined_close_wakes_waiting_sends():
+    async def _run():
+        fake = FakeGateway(lambda frame: [])
+        session = await _session(await fake.start(), depth=1)
+        first = await session.send("*1*1*11##")
+        waiting = asyncio.create_task(session.send("*1*1*12##"))
+        await asyncio.sleep(0.05)
+        await session.close()
+        await fake.stop()
+        return await first, await asyncio.gather(waiting, return_exceptions=True)
+
+    first, (waiting,) = asyncio.run(_run())
+    assert first is False
+    assert isinstance(waiting, ConnectionError)
+
+
+def test_bytes_frames_are_logged_as_text(caplog):
+    async def _run():
+        fake = FakeGateway(lambda frame: [ACK])
+        gateway = await fake.start()
+        session = OWNCommandSession(gateway, _LOGGER)
+        await session.connect()
+        await session.send(b"*1*1*12##")
+        pipelined = await _session(gateway)
+        await (await pipelined.send(bytearray(b"*1*0*12##")))
+        await session.close()
+        await pipelined.close()
+        await fake.stop()
+        return fake.frames
+
+    with caplog.at_level(logging.INFO, logger="tests"):
+        assert asyncio.run(_run()) == ["*1*1*12##", "*1*0*12##"]
+    assert "Message `*1*1*12##` was successfully sent." in caplog.text
+    assert "Message `*1*0*12##` was successfully sent." in caplog.text
+
+
+async def _slow_status(frame):
+    await asyncio.sleep(0.3 if frame.startswith("*#18") else 0)
+    return [ACK]
+
+
+@pytest.mark.parametrize(
+    "session_class", [OWNCommandSession, OWNPipelinedCommandSession]
+)
+def test_pool_routes_commands_around_a_busy_session(session_class):
+    async def _run():
+        fake = FakeGateway(_slow_status, model_name="MH202")
+        pool = OWNCommandPool(
+            await fake.start(), size=4, logger=_LOGGER, session_class=session_class
+        )
+        await pool.connect()
+        sweep = asyncio.create_task(pool.send("*#18*51*113##", True))
+        await asyncio.sleep(0.05)
+        _start = asyncio.get_running_loop().time()
+        await pool.send("*1*1*12##")
+        latency = asyncio.get_running_loop().time() - _start
+        pending = pool.pending
+        await sweep
+        await pool.close()
+        await fake.stop()
+        return pool.size, latency, pending
+
+    size, latency, pending = asyncio.run(_run())
+    # An MH202 only accepts two command sessions
+    assert size == 2
+    assert latency < 0.2
+    assert pending == 1
+
+
+def test_pool_replaces_broken_sessions():
+    async def _run():
+        fake = FakeGateway(lambda frame: [ACK])
+        fake.refusals = 1
+        pool = OWNCommandPool(await fake.start(), size=2, logger=_LOGGER)
+        await pool.connect()
+        healthy_after_connect = pool.healthy
+        await asyncio.sleep(0.05)
+        healthy_after_replacement = pool.healthy
+        await pool.send("*1*1*12##")
+        await pool.close()
+        closed_result = await pool.send("*1*1*12##")
+        await fake.stop()
+        return healthy_after_connect, healthy_after_replacement, closed_result
+
+    assert asyncio.run(_run()) == (1, 2, None)
+
+
+def test_pool_shares_its_rate_limiter():
+    async def _run():
+        fake = FakeGateway(lambda frame: [ACK])
+        pool = OWNCommandPool(await fake.start(), logger=_LOGGER)
+        await pool.connect()
+        # pylint: disable=protected-access
+        limiters = {_entry.session._rate_limiter for _entry in pool._entries}
+        await pool.close()
+        await fake.stop()
+        return limiters, pool.rate_limiter
+
+    limiters, rate_limiter = asyncio.run(_run())
+    assert limiters == {rate_limiter}
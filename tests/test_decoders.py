@@ -0,0 +1,38 @@
+""" Tests of the declarative decoders """
+
+from OWNd.decoders import (
+    DecoderSpec,
+    OWNDecodedEvent,
+    register_decoder,
+    unregister_decoder,
+)
+from OWNd.message import OWNMessage
+
+
+def test_register_unregister_round_trip():
+    frame = "*#8*21*3*0215##"
+    assert OWNMessage.parse(frame) is None
+
+    register_decoder(8, DecoderSpec("probe", {"value": ("value", 0, int)}))
+    message = OWNMessage.parse(frame)
+    assert isinstance(message, OWNDecodedEvent)
+    assert message["value"] == 215
+
+    unregister_decoder(8)
+    assert OWNMessage.parse(frame) is None
+
+    register_decoder(8, DecoderSpec("probe", {"text": ("value", 0, str)}), dimension=3)
+    message = OWNMessage.parse(frame)
+    assert message.fields == {"text": "0215"}
+    unregister_decoder(8, dimension=3)
+    assert OWNMessage.parse(frame) is None
+
+
+def test_unregister_keeps_the_other_specs_of_the_who():
+    frame = "*#8*21*3*0215##"
+    register_decoder(8, DecoderSpec("probe", {"value": ("value", 0, int)}))
+    register_decoder(8, DecoderSpec("dim", {"text": ("value", 0, str)}), dimension=3)
+    unregister_decoder(8, dimension=3)
+    assert OWNMessage.parse(frame).fields == {"value": 215}
+    unregister_decoder(8)
+    assert OWNMessage.parse(frame) is None
@@ -0,0 +1,99 @@
+""" Tests of the event session """
+
+import asyncio
+import logging
+
+from conftest import FakeGateway
+
+from OWNd.connection import OWNEventSession
+from OWNd.hub import OWNEventHub
+from OWNd.message import OWNLightingEvent
+
+_LOGGER = logging.getLogger("tests")
+
+
+async def _session(fake: FakeGateway) -> OWNEventSession:
+    session = OWNEventSession(await fake.start(), _LOGGER)
+    await session.connect()
+    return session
+
+
+def test_events_split_chunks_into_frames():
+    async def _run():
+        fake = FakeGateway(lambda frame: [])
+        session = await _session(fake)
+        received = []
+
+        async def _consume():
+            async for message in session.events():
+                received.append(message)
+                if len(received) == 4:
+                    await session.close()
+
+        consumer = asyncio.create_task(_consume())
+        await fake.push(b"*1*1*11##*1*0*12##*1*1*")
+        await asyncio.sleep(0.01)
+        await fake.push(b"13##*9*9*X##")
+        await asyncio.wait_for(consumer, 1)
+        await fake.stop()
+        return session, received
+
+    session, received = asyncio.run(_run())
+    assert [str(message) for message in received] == [
+        "*1*1*11##",
+        "*1*0*12##",
+        "*1*1*13##",
+        "*9*9*X##",
+    ]
+    assert all(isinstance(message, OWNLightingEvent) for message in received[:3])
+    # Frames that can't be parsed are yielded as str
+    assert isinstance(received[3], str)
+    assert session.reads == 2
+    assert session.frames == 4
+
+
+def test_events_reconnect_after_a_lost_connection():
+    async def _run():
+        fake = FakeGateway(lambda frame: [])
+        session = await _session(fake)
+        errors = []
+        received = []
+
+        async def _consume():
+            async for message in session.events(on_error=errors.append):
+                received.append(str(message))
+                if len(received) == 2:
+                    await session.close()
+
+        consumer = asyncio.create_task(_consume())
+        # The partial frame is lost with the connection
+        await fake.push(b"*1*1*11##*1*0*")
+        await asyncio.sleep(0.01)
+        fake.drop()
+        await asyncio.sleep(0.01)
+        await fake.push(b"*1*0*12##")
+        await asyncio.wait_for(consumer, 1)
+        await fake.stop()
+        return received, errors, fake.connections
+
+    received, errors, connections = asyncio.run(_run())
+    assert received == ["*1*1*11##", "*1*0*12##"]
+    assert [type(error) for error in errors] == [asyncio.IncompleteReadError]
+    assert connections == 2
+
+
+def test_hub_runs_on_the_event_session():
+    async def _run():
+        fake = FakeGateway(lambda frame: [])
+        session = await _session(fake)
+        hub = OWNEventHub(session, _LOGGER)
+        queue = hub.subscribe_queue(who=1)
+        running = asyncio.create_task(hub.run())
+        await fake.push(b"*1*1*11##*2*1*21##*1*0*11##")
+        received = [str(await queue.get()), str(await queue.get())]
+        await session.close()
+        await asyncio.wait_for(running, 1)
+        await fake.stop()
+        return received, hub.dispatched
+
+    assert asyncio.run(_run()) == (["*1*1*11##", "*1*0*11##"], 3)
@@ -0,0 +1,131 @@
+""" Tests of the event hub """
+
+import asyncio
+
+import pytest
+
+from OWNd.hub import (
+    QUEUE_BLOCK,
+    QUEUE_CONFLATE,
+    QUEUE_DROP_NEWEST,
+    QUEUE_DROP_OLDEST,
+    OWNEventHub,
+    OWNEventQueue,
+)
+from OWNd.message import OWNMessage
+
+
+def _fill(queue: OWNEventQueue, frames) -> list:
+    async def _run():
+        for frame in frames:
+            queue.put_nowait(OWNMessage.parse(frame))
+        queue.close()
+        return [str(message) async for message in queue]
+
+    return asyncio.run(_run())
+
+
+def test_heating_zone_unique_id():
+    """Heating events are matched on their zone's unique ID, not on their WHERE"""
+    hub = OWNEventHub()
+    received = []
+    hub.subscribe(received.append, where="4-1")
+    frames = ["*#4*#1*14*0215*3##", "*4*1*#1##", "*#4*1*0*0215##", "*#4*2*0*0215##"]
+    for frame in frames:
+        hub.dispatch(OWNMessage.parse(frame))
+    assert [str(message) for message in received] == frames[:3]
+
+
+def test_who_and_where_filters():
+    hub = OWNEventHub()
+    received = []
+    hub.subscribe(received.append, who=1, where=("12", "13"))
+    for frame in ("*1*1*12##", "*1*0*14##", "*2*1*12##", "*1*0*13##"):
+        hub.dispatch(OWNMessage.parse(frame))
+    assert [str(message) for message in received] == ["*1*1*12##", "*1*0*13##"]
+
+
+FRAMES = ["*1*1*11##", "*1*1*12##", "*1*0*11##", "*1*1*13##"]
+
+
+@pytest.mark.parametrize(
+    "policy, queued, dropped, conflated",
+    [
+        (QUEUE_BLOCK, FRAMES, 0, 0),
+        (QUEUE_DROP_OLDEST, FRAMES[1:], 1, 0),
+        (QUEUE_DROP_NEWEST, FRAMES[:3], 1, 0),
+        (QUEUE_CONFLATE, ["*1*0*11##", "*1*1*12##", "*1*1*13##"], 0, 1),
+    ],
+)
+def test_queue_policies(policy, queued, dropped, conflated):
+    queue = OWNEventQueue(3, policy)
+    assert _fill(queue, FRAMES) == queued
+    assert queue.dropped == dropped
+    assert queue.conflated == conflated
+    assert queue.high_water == (4 if policy == QUEUE_BLOCK else 3)
+    assert queue.metrics["put"] == 4
+    assert queue.metrics["got"] == len(queued)
+
+
+def test_queue_conflate_full_drops_oldest_device():
+    queue = OWNEventQueue(2, QUEUE_CONFLATE)
+    assert _fill(queue, ["*1*1*11##", "*1*1*12##", "*1*1*13##", "*1*0*12##"]) == [
+        "*1*0*12##",
+        "*1*1*13##",
+    ]
+    assert (queue.dropped, queue.conflated, queue.high_water) == (1, 1, 2)
+
+
+def test_closed_queue_ignores_messages():
+    queue = OWNEventQueue(2)
+    queue.close()
+    queue.put_nowait(OWNMessage.parse("*1*1*11##"))
+    assert queue.size == 0
+    assert queue.metrics["put"] == 0
+
+
+def test_invalid_queue():
+    with pytest.raises(ValueError):
+        OWNEventQueue(0)
+    with pytest.raises(ValueError):
+        OWNEventQueue(1, "drop_everything")
+
+
+def test_hub_waits_for_room_in_blocking_queues():
+    async def _run():
+        hub = OWNEventHub()
+        blocking = hub.subscribe_queue(2, QUEUE_BLOCK)
+        dropping = hub.subscribe_queue(2, QUEUE_DROP_OLDEST)
+        for frame in FRAMES[:2]:
+            await hub.publish(OWNMessage.parse(frame))
+        publishing = asyncio.create_task(hub.publish(OWNMessage.parse(FRAMES[2])))
+        await asyncio.sleep(0.01)
+        waited = not publishing.done()
+        first = await blocking.get()
+        await publishing
+        hub.unsubscribe_queue(blocking)
+        await hub.publish(OWNMessage.parse(FRAMES[3]))
+        rest = [str(message) async for message in blocking]
+        return waited, str(first), rest, dropping, hub
+
+    waited, first, rest, dropping, hub = asyncio.run(_run())
+    assert waited
+    assert first == FRAMES[0]
+    # Closed by unsubscribe_queue, it keeps what was queued
+    assert rest == FRAMES[1:3]
+    assert dropping.size == 2
+    assert dropping.dropped == 2
+    assert hub.queues == [dropping]
+    assert hub.dispatched == 4
+
+
+def test_closing_a_queue_wakes_the_hub():
+    async def _run():
+        queue = OWNEventQueue(1)
+        queue.put_nowait(OWNMessage.parse(FRAMES[0]))
+        waiting = asyncio.create_task(queue.wait_for_room())
+        await asyncio.sleep(0.01)
+        queue.close()
+        await asyncio.wait_for(waiting, 1)
+
+    asyncio.run(_run())
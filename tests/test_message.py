@@ -0,0 +1,39 @@
+""" Tests of the message parsing """
+
+import json
+import pickle
+
+import pytest
+
+from OWNd.message import OWNEnergyEvent, OWNMessage
+
+
+def test_energy_daily_consumption_without_day():
+    """A 513 reply with an empty day parses into a typeless event, as it always did"""
+    message = OWNMessage.parse("*#18*51*513#12#31**0215*8*978*1751##")
+    assert isinstance(message, OWNEnergyEvent)
+    assert message.message_type is None
+
+
+def test_unknown_pir_sensitivity_log():
+    """An out of range sensitivity is logged as is, rather than raising"""
+    message = OWNMessage.parse("*#1*12*5*7##")
+    assert message.human_readable_log.endswith("PIR sesitivity is 7.")
+    message = OWNMessage.parse("*#1*12*5*2##")
+    assert message.human_readable_log.endswith("PIR sesitivity is high.")
+
+
+def test_event_content_is_read_only_and_serializable():
+    message = OWNMessage.parse("*#1*12*1*150*0##")
+    content = message.event_content
+    assert json.loads(json.dumps(content))["dimension values"] == ["150", "0"]
+    assert content["dimension values"] == ("150", "0")
+    with pytest.raises(TypeError):
+        content["where"] = "13"
+    with pytest.raises(AttributeError):
+        content["dimension values"].append("1")
+    assert pickle.loads(pickle.dumps(content)) == content
+
+    copy = message.to_dict()
+    copy["dimension values"].append("1")
+    assert message.to_dict()["dimension values"] == ["150", "0"]
@@ -0,0 +1,104 @@
+""" Tests of the adaptive rate limiter """
+
+import asyncio
+import logging
+
+import pytest
+from conftest import FakeGateway
+
+from OWNd.connection import OWNCommandSession, OWNGateway, OWNRateLimiter
+
+
+def _gateway(model_name: str) -> OWNGateway:
+    return OWNGateway({"address": "127.0.0.1", "port": 20000, "modelName": model_name})
+
+
+def test_for_gateway():
+    limiter = OWNRateLimiter.for_gateway(_gateway("MH202"))
+    assert limiter.rate == 5.0
+    limiter = OWNRateLimiter.for_gateway(_gateway("Unknown"), max_rate=2.0)
+    # The starting rate is capped by an overridden max_rate
+    assert limiter.rate == 2.0
+
+
+def test_invalid_rate_limiter():
+    with pytest.raises(ValueError):
+        OWNRateLimiter(rate=50.0, max_rate=10.0)
+    with pytest.raises(ValueError):
+        OWNRateLimiter(decrease=1.0)
+    with pytest.raises(ValueError):
+        OWNRateLimiter(window=0)
+
+
+def test_acks_increase_the_rate_up_to_max_rate():
+    limiter = OWNRateLimiter(rate=4.0, max_rate=5.0, increase=2.0)
+    limiter.ack(0.05)
+    assert limiter.rate == 4.5
+    for _ in range(10):
+        limiter.ack(0.05)
+    assert limiter.rate == 5.0
+    assert limiter.decreases == 0
+
+
+def test_nack_storm_cuts_the_rate_once_per_window():
+    limiter = OWNRateLimiter(rate=8.0, max_rate=8.0, min_rate=1.0, window=10)
+    for _ in range(10):
+        limiter.nack()
+    assert limiter.rate == 4.0
+    assert limiter.decreases == 1
+    assert limiter.nack_ratio == 1.0
+    for _ in range(30):
+        limiter.nack()
+    # Never below min_rate
+    assert limiter.rate == 1.0
+    assert limiter.decreases == 4
+
+
+def test_slow_acks_cut_the_rate():
+    limiter = OWNRateLimiter(rate=8.0, max_rate=8.0, target_latency=0.1)
+    limiter.ack(0.5)
+    assert limiter.rate == 4.0
+    assert limiter.latency == 0.5
+    # Status requests leave the latency out
+    limiter.ack(None)
+    assert limiter.latency == 0.5
+
+
+def test_acquire_paces_commands():
+    async def _run():
+        limiter = OWNRateLimiter(rate=20.0, max_rate=20.0, burst=2.0)
+        _start = asyncio.get_running_loop().time()
+        for _ in range(5):
+            await limiter.acquire()
+        return asyncio.get_running_loop().time() - _start
+
+    # Two commands in the burst, then one every 50 ms
+    assert 0.13 < asyncio.run(_run()) < 0.3
+
+
+def test_sessions_report_answers():
+    nacked = []
+
+    def _answer(frame):
+        if not nacked:
+            nacked.append(frame)
+            return ["*#*0##"]
+        return ["*#*1##"]
+
+    async def _run():
+        fake = FakeGateway(_answer)
+        limiter = OWNRateLimiter()
+        session = OWNCommandSession(
+            await fake.start(), logging.getLogger("tests"), rate_limiter=limiter
+        )
+        await session.connect()
+        await session.send("*1*1*12##")
+        await session.close()
+        await fake.stop()
+        return limiter, fake.frames
+
+    limiter, frames = asyncio.run(_run())
+    # Retried after the NACK, in its turn
+    assert frames == ["*1*1*12##", "*1*1*12##"]
+    assert limiter.nack_ratio == 0.5
+    assert limiter.latency is not None
@@ -0,0 +1,36 @@
+""" Tests of the command scheduler """
+
+import asyncio
+
+import pytest
+
+from OWNd.scheduler import PRIORITY_BULK, OWNCommandScheduler
+
+
+class _StalledTarget:
+    async def send(self, message, is_status_request=False):
+        await asyncio.sleep(3600)
+
+
+def test_stop_wakes_blocked_producers():
+    async def _stop_while_full():
+        scheduler = OWNCommandScheduler(_StalledTarget(), queue_sizes=(1, 1, 1, 1))
+        scheduler.start()
+        sends = [
+            asyncio.create_task(scheduler.send("*1*1*12##", PRIORITY_BULK))
+            for _ in range(4)
+        ]
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+        results = await asyncio.wait_for(
+            asyncio.gather(*sends, return_exceptions=True), 1
+        )
+        with pytest.raises(RuntimeError):
+            await scheduler.send("*1*1*12##")
+        return scheduler, results
+
+    scheduler, results = asyncio.run(_stop_while_full())
+    assert any(isinstance(result, RuntimeError) for result in results)
+    assert all(isinstance(result, BaseException) for result in results)
+    # Only the command taken by the worker was sent, not the cancelled ones
+    assert scheduler.metrics["bulk"]["sent"] == 1